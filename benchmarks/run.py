@@ -0,0 +1,202 @@
+"""
+Benchmark Spout's detection, parsing and generation phases.
+
+Usage:
+    python benchmarks/run.py --sizes 100,1000 --output bench.json
+    python benchmarks/run.py --baseline benchmarks/baseline.json
+
+Each phase is timed separately on synthetic projects, then rerun under
+tracemalloc to record its peak memory. When a baseline is given, any phase
+slower than ``--threshold`` times its baseline is reported as a regression
+and the runner exits non-zero.
+"""
+
+import argparse
+import json
+import platform
+import sys
+import tempfile
+import time
+import tracemalloc
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Tuple
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from spout.framework_detectors import detect_framework  # noqa: E402
+from spout.generators import GENERATORS  # noqa: E402
+from spout.generators.templated import (  # noqa: E402
+    template_client_types,
+    template_generator,
+)
+
+from synthetic import FRAMEWORKS, create_project  # noqa: E402
+
+DEFAULT_SIZES = (100, 1000, 10000)
+
+
+def _measure(func: Callable[[], Any], repeat: int) -> Tuple[float, Any]:
+    """Return the best wall time over ``repeat`` runs and the last result."""
+    best = float("inf")
+    result = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = func()
+        best = min(best, time.perf_counter() - start)
+    return best, result
+
+
+def _peak_memory(func: Callable[[], Any]) -> int:
+    """Return the peak bytes allocated while running ``func``."""
+    tracemalloc.start()
+    try:
+        func()
+        return tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+
+def bench_project(
+    project: Path, repeat: int, jobs: int, memory: bool
+) -> Dict[str, Dict[str, Any]]:
+    """Benchmark every phase on one project."""
+    phases: Dict[str, Callable[[], Any]] = {}
+
+    def detect():
+        return detect_framework(project)
+
+    detect_time, detector = _measure(detect, repeat)
+    if detector is None:
+        raise RuntimeError(f"No framework detected in {project}")
+    detector.jobs = jobs
+    phases["detect"] = detect
+
+    parse_time, endpoints = _measure(detector.parse, repeat)
+    phases["parse"] = detector.parse
+
+    results: Dict[str, Dict[str, Any]] = {
+        "detect": {"seconds": detect_time, "files": len(detector.index.files)},
+        "parse": {"seconds": parse_time, "endpoints": len(endpoints)},
+    }
+
+    generators = dict(GENERATORS)
+    # Same clients rendered from templates, to compare against the f-strings
+    for name in template_client_types():
+        generators[f"{name}_template"] = template_generator(name)
+
+    for name, generator_class in generators.items():
+        generator = generator_class(base_url="", include_types=True)
+        phase = f"generate_{name}"
+        phases[phase] = lambda g=generator: g.generate(endpoints)
+        seconds, output = _measure(phases[phase], repeat)
+        results[phase] = {"seconds": seconds, "bytes": len(output)}
+
+    if memory:
+        for phase, func in phases.items():
+            results[phase]["peak_bytes"] = _peak_memory(func)
+
+    return results
+
+
+def run(
+    sizes: List[int], frameworks: List[str], repeat: int, jobs: int, memory: bool
+) -> Dict[str, Any]:
+    """Run the suite and return the results document."""
+    benchmarks: Dict[str, Any] = {}
+    with tempfile.TemporaryDirectory(prefix="spout-bench-") as tmp:
+        for framework in frameworks:
+            for size in sizes:
+                name = f"{framework}-{size}"
+                project = create_project(Path(tmp) / name, framework, size)
+                print(f"Running {name}...", file=sys.stderr)
+                benchmarks[name] = bench_project(project, repeat, jobs, memory)
+
+    return {
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "benchmarks": benchmarks,
+    }
+
+
+def compare(
+    results: Dict[str, Any], baseline: Dict[str, Any], threshold: float
+) -> List[str]:
+    """Return a description of every phase slower than its baseline."""
+    regressions = []
+    for name, phases in results["benchmarks"].items():
+        base_phases = baseline.get("benchmarks", {}).get(name, {})
+        for phase, data in phases.items():
+            base = base_phases.get(phase)
+            if not base or not base.get("seconds"):
+                continue
+            ratio = data["seconds"] / base["seconds"]
+            if ratio > threshold:
+                regressions.append(
+                    f"{name} {phase}: {data['seconds']:.4f}s vs "
+                    f"{base['seconds']:.4f}s baseline ({ratio:.2f}x)"
+                )
+    return regressions
+
+
+def _print_table(results: Dict[str, Any]) -> None:
+    print(f"{'benchmark':<22} {'phase':<24} {'seconds':>10} {'peak MiB':>10}")
+    for name, phases in results["benchmarks"].items():
+        for phase, data in phases.items():
+            peak = data.get("peak_bytes")
+            peak_str = f"{peak / (1024 * 1024):.1f}" if peak is not None else "-"
+            print(f"{name:<22} {phase:<24} {data['seconds']:>10.4f} {peak_str:>10}")
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument(
+        "--sizes",
+        default=",".join(str(s) for s in DEFAULT_SIZES),
+        help="Comma-separated numbers of route files",
+    )
+    parser.add_argument(
+        "--frameworks",
+        default=",".join(FRAMEWORKS),
+        help="Comma-separated frameworks to benchmark",
+    )
+    parser.add_argument("--repeat", type=int, default=3, help="Runs per phase")
+    parser.add_argument("--jobs", type=int, default=1, help="Parse processes")
+    parser.add_argument(
+        "--no-memory", action="store_true", help="Skip peak memory measurement"
+    )
+    parser.add_argument("--output", type=Path, help="Write results JSON here")
+    parser.add_argument("--baseline", type=Path, help="Baseline JSON to compare")
+    parser.add_argument(
+        "--threshold",
+        type=float,
+        default=1.25,
+        help="Slowdown ratio reported as a regression",
+    )
+    args = parser.parse_args()
+
+    results = run(
+        sizes=[int(s) for s in args.sizes.split(",")],
+        frameworks=args.frameworks.split(","),
+        repeat=args.repeat,
+        jobs=args.jobs,
+        memory=not args.no_memory,
+    )
+    _print_table(results)
+
+    if args.output:
+        args.output.write_text(json.dumps(results, indent=2))
+
+    if args.baseline:
+        regressions = compare(
+            results, json.loads(args.baseline.read_text()), args.threshold
+        )
+        for regression in regressions:
+            print(f"REGRESSION {regression}", file=sys.stderr)
+        if regressions:
+            return 1
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
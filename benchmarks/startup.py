@@ -0,0 +1,112 @@
+"""
+Check Spout's import-time startup cost against a budget.
+
+Usage:
+    python benchmarks/startup.py
+    python benchmarks/startup.py --budget-ms 120 --repeat 10
+
+Each target module is imported in a fresh interpreter under
+``python -X importtime``; the best cumulative time over ``--repeat`` runs
+is compared with the budget. Modules that must stay out of a cheap
+startup (pydantic, jinja2, the detectors and generators, and entry point
+scanning once plugin discovery is cached) are reported if they get
+imported, and either failure makes the runner exit non-zero.
+"""
+
+import argparse
+import os
+import subprocess
+import sys
+from pathlib import Path
+from typing import Dict, List, Set, Tuple
+
+ROOT = Path(__file__).resolve().parent.parent
+
+# Module imported on startup -> modules it must not import
+TARGETS: Dict[str, Tuple[str, ...]] = {
+    "spout": ("pydantic", "spout.core", "spout.models"),
+    "spout.cli": (
+        "importlib.metadata",
+        "pydantic",
+        "jinja2",
+        "spout.core",
+        "spout.framework_detectors.base",
+        "spout.generators.base",
+    ),
+}
+
+DEFAULT_BUDGET_MS = 150.0
+
+
+def import_profile(module: str) -> Tuple[float, Set[str]]:
+    """
+    Import ``module`` in a fresh interpreter.
+
+    Returns:
+        Cumulative import time of the module in milliseconds, and the
+        names of every module imported along the way
+    """
+    env = dict(os.environ, PYTHONPATH=str(ROOT))
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        capture_output=True,
+        text=True,
+        env=env,
+        check=True,
+    )
+    cumulative = 0.0
+    imported = set()
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "|" not in line:
+            continue
+        _, total, name = line.split("|")
+        if not total.strip().isdigit():
+            continue  # Header row
+        imported.add(name.strip())
+        if name.strip() == module:
+            cumulative = int(total) / 1000
+    return cumulative, imported
+
+
+def check(budget_ms: float, repeat: int) -> List[str]:
+    """Return a description of every target over budget or importing too much."""
+    failures = []
+    for module, forbidden in TARGETS.items():
+        best = float("inf")
+        imported: Set[str] = set()
+        for _ in range(repeat):
+            seconds, imported = import_profile(module)
+            best = min(best, seconds)
+        print(f"{module:<12} {best:>8.1f} ms")
+
+        if best > budget_ms:
+            failures.append(f"{module}: {best:.1f} ms over {budget_ms:.0f} ms budget")
+        leaked = sorted(
+            name
+            for name in imported
+            if any(name == f or name.startswith(f"{f}.") for f in forbidden)
+        )
+        if leaked:
+            failures.append(f"{module} imports {', '.join(leaked)}")
+    return failures
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument(
+        "--budget-ms",
+        type=float,
+        default=DEFAULT_BUDGET_MS,
+        help="Maximum cumulative import time per target",
+    )
+    parser.add_argument("--repeat", type=int, default=5, help="Imports per target")
+    args = parser.parse_args()
+
+    failures = check(args.budget_ms, args.repeat)
+    for failure in failures:
+        print(f"REGRESSION {failure}", file=sys.stderr)
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
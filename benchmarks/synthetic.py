@@ -0,0 +1,124 @@
+"""Synthetic FastAPI and Django Ninja projects for benchmarking."""
+
+from pathlib import Path
+
+FRAMEWORKS = ("fastapi", "django-ninja")
+
+ROUTES_PER_FILE = 5
+NON_ROUTE_FILES_PER_ROUTE_FILE = 2
+
+_FASTAPI_HEADER = """\
+from typing import List, Optional
+
+from fastapi import APIRouter
+from pydantic import BaseModel
+
+router = APIRouter()
+
+
+class Item{n}(BaseModel):
+    id: int
+    name: str
+    price: float
+    tags: List[str] = []
+
+"""
+
+_FASTAPI_ROUTE = """
+@router.{method}("/resource{n}/{{item_id}}/sub{r}")
+def {method}_resource{n}_{r}(item_id: int, q: str, data: Item{n}):
+    \"\"\"Handle resource {n} route {r}.\"\"\"
+    return {{"id": item_id}}
+"""
+
+_NINJA_HEADER = """\
+from typing import List
+
+from ninja import Router, Schema
+
+router = Router()
+
+
+class Item{n}(Schema):
+    id: int
+    name: str
+    price: float
+
+"""
+
+_NINJA_ROUTE = """
+@router.{method}("/resource{n}/{{item_id}}/sub{r}")
+def {method}_resource{n}_{r}(request, item_id: int, q: str, data: Item{n}):
+    \"\"\"Handle resource {n} route {r}.\"\"\"
+    return {{"id": item_id}}
+"""
+
+_NON_ROUTE = '''\
+"""Helper module {n}."""
+
+import math
+
+
+def helper_{n}(value: float) -> float:
+    total = 0.0
+    for i in range(10):
+        total += math.sqrt(value + i)
+    return total
+
+
+class Service{n}:
+    def __init__(self, name: str):
+        self.name = name
+
+    def run(self) -> str:
+        return self.name.upper()
+'''
+
+_METHODS = ("get", "post", "put", "delete", "patch")
+
+
+def create_project(root: Path, framework: str, route_files: int) -> Path:
+    """
+    Write a synthetic project with ``route_files`` router modules.
+
+    The project also contains a realistic share of non-route modules and a
+    virtualenv-like directory that scanning is expected to prune.
+    """
+    if framework not in FRAMEWORKS:
+        raise ValueError(f"Unknown framework: {framework}")
+
+    header, route = (
+        (_FASTAPI_HEADER, _FASTAPI_ROUTE)
+        if framework == "fastapi"
+        else (_NINJA_HEADER, _NINJA_ROUTE)
+    )
+
+    root.mkdir(parents=True, exist_ok=True)
+    (root / "requirements.txt").write_text(
+        "fastapi\nuvicorn\n" if framework == "fastapi" else "django\ndjango-ninja\n"
+    )
+    if framework == "fastapi":
+        (root / "main.py").write_text("from fastapi import FastAPI\n\napp = FastAPI()\n")
+    else:
+        (root / "settings.py").write_text("DEBUG = True\n")
+        (root / "api.py").write_text("from ninja import NinjaAPI\n\napi = NinjaAPI()\n")
+
+    for n in range(route_files):
+        package = root / "app" / f"pkg{n // 100}"
+        package.mkdir(parents=True, exist_ok=True)
+        parts = [header.format(n=n)]
+        for r in range(ROUTES_PER_FILE):
+            parts.append(route.format(n=n, r=r, method=_METHODS[r % len(_METHODS)]))
+        (package / f"routes_{n}.py").write_text("".join(parts))
+
+        for k in range(NON_ROUTE_FILES_PER_ROUTE_FILE):
+            m = n * NON_ROUTE_FILES_PER_ROUTE_FILE + k
+            (package / f"helpers_{m}.py").write_text(_NON_ROUTE.format(n=m))
+
+    # Third-party code that must not be scanned
+    vendored = root / ".venv" / "lib" / "site-packages" / "fastapi"
+    vendored.mkdir(parents=True, exist_ok=True)
+    for n in range(min(route_files, 200)):
+        (vendored / f"vendored_{n}.py").write_text("from fastapi import FastAPI\n")
+
+    return root
@@ -9,9 +9,39 @@ __version__ = "0.1.0"
 __author__ = "James Ford"
 __email__ = "jameslford@example.com"
 
-from .core import SpoutDetector, SpoutGenerator
-from .models.endpoint import Endpoint, EndpointMethod, EndpointParameter
-from .models.framework import FrameworkInfo, SupportedFramework
+import importlib
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from .core import SpoutDetector, SpoutGenerator
+    from .models.endpoint import Endpoint, EndpointMethod, EndpointParameter
+    from .models.framework import FrameworkInfo, SupportedFramework
+
+# Public names and the modules defining them, imported on first access so
+# that `import spout` (and with it the CLI) stays cheap
+_LAZY_ATTRIBUTES = {
+    "SpoutGenerator": ".core",
+    "SpoutDetector": ".core",
+    "Endpoint": ".models.endpoint",
+    "EndpointMethod": ".models.endpoint",
+    "EndpointParameter": ".models.endpoint",
+    "FrameworkInfo": ".models.framework",
+    "SupportedFramework": ".models.framework",
+}
+
+
+def __getattr__(name: str) -> Any:
+    module = _LAZY_ATTRIBUTES.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list:
+    return sorted(set(globals()) | set(_LAZY_ATTRIBUTES))
+
 
 __all__ = [
     "SpoutGenerator",
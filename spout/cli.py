@@ -1,19 +1,116 @@
 """Command line interface for Spout."""
 
+import cProfile
 import json
 import sys
+import threading
 from pathlib import Path
-from typing import Optional
+from typing import TYPE_CHECKING, List, Optional, Sequence
 
 import click
 
-from .core import SpoutDetector, SpoutGenerator
-from .generators import GENERATORS
-from .models.cli_input import DetectInput, GenerateInput
+# Only lightweight modules are imported here; each command imports the
+# detectors, generators and pydantic models it needs when it runs
+from . import __version__
+from .generators import ENGINES, GENERATORS
+from .shared import timing
+from .shared.constants import SPLIT_MODES, STYLES
+
+if TYPE_CHECKING:
+    from .core import SpoutDetector, SpoutGenerator
+    from .models.cli_input import GenerateTarget
+
+
+def _load_config(config: Optional[Path], verbose: bool) -> dict:
+    """Load a JSON configuration file, exiting on error."""
+    if not config:
+        return {}
+    try:
+        with open(config, "r") as f:
+            config_data = json.load(f)
+        if verbose:
+            click.echo(f"Loaded configuration from {config}")
+        return config_data
+    except Exception as e:
+        click.echo(f"Error loading configuration: {e}", err=True)
+        sys.exit(1)
+
+
+def _load_targets(target_specs: Sequence[str], config_data: dict) -> List[dict]:
+    """Parse --target options, falling back to the config's ``targets``."""
+    from .shared.utils import parse_target_spec
+
+    specs = list(target_specs) or config_data.get("targets", [])
+    try:
+        targets = [parse_target_spec(spec) for spec in specs]
+    except ValueError as e:
+        raise click.BadParameter(str(e), param_hint="--target")
+    for target in targets:
+        if target["client_type"] not in GENERATORS:
+            available = ", ".join(GENERATORS.keys())
+            raise click.BadParameter(
+                f"Unsupported client type: {target['client_type']}. "
+                f"Available: {available}",
+                param_hint="--target",
+            )
+    return targets
+
+
+def _stale_outputs(
+    input_path: Path, config_data: dict, options: dict, targets: List[dict]
+) -> List[int]:
+    """
+    Check the output manifests before anything heavy is imported.
+
+    Only the outputs found stale here are generated, without checking their
+    manifests again.
+
+    Keys are hashed from the validated options, exactly as the generator
+    hashes them when it saves a manifest.
+
+    Args:
+        input_path: Project directory
+        config_data: Loaded configuration
+        options: ``GenerateInput`` fields from the command line
+        targets: Per-target overrides, empty for a single output
+
+    Returns:
+        Positions of the stale targets, or ``[0]`` for a stale single output
+    """
+    from .models.cli_input import GenerateInput, GenerateTarget
+    from .shared.manifest import input_key, stale_outputs
+    from .shared.utils import output_location
+    from .shared.walker import ProjectWalker
+
+    base = GenerateInput(**options)
+    inputs = [base.for_target(GenerateTarget(**target)) for target in targets]
+    outputs = []
+    for input_data in inputs or [base]:
+        location = output_location(Path(input_data.output_path), input_data.split_by)
+        outputs.append((location, input_key(input_data)))
+
+    with timing.phase("manifest"):
+        names = ProjectWalker.from_config(input_path, config_data).walk_names()
+        return stale_outputs(input_path, names, outputs)
+
+
+def _echo_scan_stats(detector: "SpoutDetector") -> None:
+    """Report how much of the project tree was scanned and pruned."""
+    walker = detector.index.walker
+    if walker is None:
+        return
+    click.echo(
+        f"Scanned {walker.files_scanned} Python files "
+        f"(pruned {walker.dirs_pruned} directories, {walker.files_pruned} files)"
+    )
+    index = detector.index
+    if index.remaining:
+        read = len(index.paths) - index.remaining
+        click.echo(f"Detection was decided after reading {read} of them")
 
 
 @click.group()
-@click.version_option()
+@click.version_option(version=__version__)
 def main():
     """Spout - Generate TypeScript clients from Python web frameworks."""
     pass
@@ -49,11 +146,115 @@ def main():
 @click.option(
     "--no-types", is_flag=True, help="Do not include TypeScript type definitions"
 )
+@click.option(
+    "--engine",
+    type=click.Choice(ENGINES),
+    default="fstring",
+    help="Render the client with the built-in code or with Jinja2 templates",
+)
+@click.option(
+    "--split-by",
+    type=click.Choice(SPLIT_MODES),
+    default=None,
+    help="Emit one module per tag, source file or path prefix into a directory "
+    "named after --output (without .ts), plus types.ts, runtime.ts and index.ts",
+)
+@click.option(
+    "--style",
+    type=click.Choice(STYLES),
+    default="class",
+    help="Emit an ApiClient class, or one tree-shakeable function per endpoint "
+    "taking a shared ApiContext (fetch and axios)",
+)
+@click.option(
+    "--dedupe",
+    is_flag=True,
+    help="Share one request between identical concurrent GETs (fetch only)",
+)
+@click.option(
+    "--batch-path",
+    default=None,
+    metavar="PATH",
+    help="Batch requests issued in the same tick into one POST to PATH "
+    "(fetch only)",
+)
+@click.option(
+    "--max-concurrency",
+    type=click.IntRange(min=1),
+    default=None,
+    help="Limit the generated client's requests in flight (fetch only)",
+)
+@click.option(
+    "--cache-ttl",
+    type=click.FloatRange(min=0),
+    default=None,
+    metavar="SECONDS",
+    help="Cache GET responses in the generated client for SECONDS, revalidating "
+    "with ETags; overrides the config's cache.ttl",
+)
+@click.option(
+    "--timeout",
+    type=click.IntRange(min=1),
+    default=None,
+    metavar="MS",
+    help="Abort the generated client's requests after MS milliseconds "
+    "(fetch only); overrides the config's timeout",
+)
+@click.option(
+    "--retries",
+    type=click.IntRange(min=0),
+    default=None,
+    help="Retry failed idempotent requests with jittered backoff (fetch only); "
+    "overrides the config's retry.retries",
+)
+@click.option(
+    "--target",
+    "-t",
+    "targets",
+    multiple=True,
+    metavar="TYPE:PATH",
+    help="Emit a client of TYPE to PATH; repeat to emit several clients from one "
+    "parse. Replaces --output, --client-type and the config's targets",
+)
+@click.option(
+    "--parallel",
+    is_flag=True,
+    help="Render and write multiple targets concurrently",
+)
 @click.option(
     "--config",
     type=click.Path(exists=True, dir_okay=False, path_type=Path),
     help="Path to configuration file",
 )
+@click.option(
+    "--jobs",
+    "-j",
+    type=click.IntRange(min=1),
+    default=None,
+    help="Number of parallel parse processes (default: CPU count)",
+)
+@click.option("--no-cache", is_flag=True, help="Do not read or write the parse cache")
+@click.option(
+    "--clear-cache", is_flag=True, help="Clear the parse cache before generating"
+)
+@click.option(
+    "--force",
+    is_flag=True,
+    help="Regenerate even if the output manifest shows nothing changed",
+)
+@click.option("--timings", is_flag=True, help="Print a per-phase timing table")
+@click.option(
+    "--timings-json",
+    type=click.Path(dir_okay=False, path_type=Path),
+    default=None,
+    help="Write per-phase timings as JSON to this file",
+)
+@click.option(
+    "--profile",
+    type=click.Path(dir_okay=False, path_type=Path),
+    default=None,
+    help="Write cProfile stats for the whole run to this file",
+)
 @click.option("--verbose", "-v", is_flag=True, help="Enable verbose output")
 def generate(
     input_path: Path,
@@ -61,31 +262,112 @@ def generate(
     client_type: str,
     base_url: Optional[str],
     no_types: bool,
+    engine: str,
+    split_by: Optional[str],
+    style: str,
+    dedupe: bool,
+    batch_path: Optional[str],
+    max_concurrency: Optional[int],
+    cache_ttl: Optional[float],
+    timeout: Optional[int],
+    retries: Optional[int],
+    targets: Sequence[str],
+    parallel: bool,
     config: Optional[Path],
+    jobs: Optional[int],
+    no_cache: bool,
+    clear_cache: bool,
+    force: bool,
+    timings: bool,
+    timings_json: Optional[Path],
+    profile: Optional[Path],
     verbose: bool,
 ):
     """Generate TypeScript client from Python web framework."""
+    from .shared.cache import ParseCache
+    from .shared.utils import output_location
+
+    recorder = timing.enable() if timings or timings_json else None
+    profiler = cProfile.Profile() if profile else None
+    if profiler is not None:
+        profiler.enable()
 
-    # Load configuration if provided
-    config_data = {}
-    if config:
-        try:
-            with open(config, "r") as f:
-                config_data = json.load(f)
+    # A failing run exits through sys.exit; still report what it recorded
+    try:
+        if clear_cache:
+            ParseCache.for_project(input_path).clear()
             if verbose:
-                click.echo(f"Loaded configuration from {config}")
-        except Exception as e:
-            click.echo(f"Error loading configuration: {e}", err=True)
-            sys.exit(1)
+                click.echo("Cleared parse cache")
 
-    final_config = GenerateInput(
-        project_path=str(input_path),
-        output_path=str(output_path),
-        client_type=client_type,
-        base_url=base_url,
-        include_types=not no_types,
-        config=config_data,
-    )
+        # Load configuration if provided
+        config_data = _load_config(config, verbose)
+        target_options = _load_targets(targets, config_data)
+        parallel = parallel or bool(config_data.get("parallel", False))
+
+        options = dict(
+            project_path=str(input_path),
+            output_path=str(output_path),
+            client_type=client_type,
+            base_url=base_url,
+            include_types=not no_types,
+            engine=engine,
+            split_by=split_by,
+            style=style,
+            dedupe=dedupe,
+            batch_path=batch_path,
+            max_concurrency=max_concurrency,
+            cache_ttl=cache_ttl,
+            timeout=timeout,
+            retries=retries,
+            config=config_data,
+        )
+
+        # Unchanged sources and options: stop before detecting or parsing
+        if force:
+            stale = list(range(len(target_options) or 1))
+        else:
+            stale = _stale_outputs(input_path, config_data, options, target_options)
+        if not stale:
+            for target in target_options:
+                name = f"{target['client_type']} client"
+                click.echo(f"✅ {name} is up to date: {target['output_path']}")
+            if not target_options:
+                location = output_location(output_path, split_by)
+                click.echo(f"✅ TypeScript client is up to date: {location}")
+            if verbose:
+                click.echo("Sources and options are unchanged; nothing was parsed")
+        else:
+            _generate(
+                options, target_options, stale, parallel, not no_cache, jobs, verbose
+            )
+    finally:
+        if profiler is not None:
+            profiler.disable()
+            profiler.dump_stats(str(profile))
+            click.echo(f"Profile written to {profile}")
+
+        if recorder is not None:
+            timing.disable()
+            if timings:
+                click.echo(recorder.format_table())
+            if timings_json:
+                timings_json.write_text(json.dumps(recorder.to_dict(), indent=2))
+
+
+def _generate(
+    options: dict,
+    target_options: List[dict],
+    stale: List[int],
+    parallel: bool,
+    use_cache: bool,
+    jobs: Optional[int],
+    verbose: bool,
+) -> None:
+    """Detect, parse and write the requested clients that are ``stale``."""
+    from .core import SpoutGenerator
+    from .models.cli_input import GenerateInput, GenerateTarget
+
+    final_config = GenerateInput(**options, use_cache=use_cache, jobs=jobs)
     if verbose:
         click.echo("Final configuration:")
         for key, value in final_config.dict().items():
@@ -97,20 +379,74 @@ def generate(
     except Exception as e:
         click.echo(f"Error initializing generator: {e}", err=True)
         sys.exit(1)
-    client_code = generator.generate_client()
 
-    # Generate client
+    if target_options:
+        generate_targets = [GenerateTarget(**target) for target in target_options]
+        _write_targets(generator, generate_targets, stale, parallel, verbose)
+    else:
+        _write_output(generator, verbose)
     if verbose:
-        click.echo(f"Generating {final_config.client_type} client...")
+        _echo_scan_stats(generator)
+        if generator._detector is not None and generator.detector.cache is not None:
+            cache = generator.detector.cache
+            click.echo(f"Parse cache: {cache.hits} hits, {cache.misses} misses")
 
-    # Write output
+
+def _write_output(generator: "SpoutGenerator", verbose: bool) -> None:
+    """Stream the stale client into its output file or split directory."""
+    output_path = generator.output_location
+    if verbose:
+        click.echo(f"Generating {generator.input_data.client_type} client...")
     try:
-        output_path.parent.mkdir(parents=True, exist_ok=True)
-        output_path.write_text(client_code, encoding="utf-8")
+        written = generator.write_output(force=True)
+    except OSError as e:
+        click.echo(f"Error writing output file: {e}", err=True)
+        sys.exit(1)
+    except ValueError as e:
+        click.echo(f"Error generating client: {e}", err=True)
+        sys.exit(1)
+
+    if verbose and generator.input_data.split_by:
+        for module in written:
+            click.echo(f"  wrote {module}")
+    if written:
         click.echo(f"✅ TypeScript client generated successfully: {output_path}")
-    except Exception as e:
+    else:
+        click.echo(f"✅ TypeScript client is up to date: {output_path}")
+
+
+def _write_targets(
+    generator: "SpoutGenerator",
+    targets: List["GenerateTarget"],
+    stale: List[int],
+    parallel: bool,
+    verbose: bool,
+) -> None:
+    """Emit the stale targets from the generator's single parse."""
+    if verbose:
+        click.echo(f"Generating {len(stale)} clients from one parse...")
+    try:
+        results = generator.write_targets(
+            [targets[i] for i in stale], parallel=parallel, force=True
+        )
+    except OSError as e:
         click.echo(f"Error writing output file: {e}", err=True)
         sys.exit(1)
+    except ValueError as e:
+        click.echo(f"Error generating clients: {e}", err=True)
+        sys.exit(1)
+
+    written_by_target = dict(zip(stale, results))
+    for i, target in enumerate(targets):
+        written = written_by_target.get(i, [])
+        name = f"{target.client_type} client"
+        if written:
+            click.echo(f"✅ {name} generated successfully: {target.output_path}")
+        else:
+            click.echo(f"✅ {name} is up to date: {target.output_path}")
+        if verbose:
+            for path in written:
+                click.echo(f"  wrote {path}")
 
 
 @main.command()
@@ -123,23 +459,40 @@ def generate(
     default=Path("."),
     help="Path to the Python project directory",
 )
+@click.option(
+    "--config",
+    type=click.Path(exists=True, dir_okay=False, path_type=Path),
+    help="Path to configuration file",
+)
 @click.option("--verbose", "-v", is_flag=True, help="Enable verbose output")
-def detect(input_path: Path, verbose: bool):
+def detect(input_path: Path, config: Optional[Path], verbose: bool):
     """Detect web framework in a Python project."""
+    from .core import SpoutDetector
+    from .models.cli_input import DetectInput
 
-    config = DetectInput(project_path=str(input_path), verbose=verbose)
+    detect_input = DetectInput(
+        project_path=str(input_path),
+        verbose=verbose,
+        config=_load_config(config, verbose),
+    )
 
-    detector = SpoutDetector(config)
+    detector = SpoutDetector(detect_input)
     try:
         framework_info = detector.framework_info
     except Exception as e:
         click.echo(f"Error during detection: {e}", err=True)
         sys.exit(1)
 
+    if verbose:
+        _echo_scan_stats(detector)
+
     if framework_info:
         click.echo(f"✅ Framework detected: {framework_info.name}")
         click.echo(f"   Confidence: {framework_info.confidence:.2f}")
-        click.echo(f"   Files: {len(framework_info.detected_files)}")
+        files = f"   Files: {len(framework_info.detected_files)}"
+        if detector.index.remaining:
+            files += " (scan stopped once the framework was decided)"
+        click.echo(files)
 
         if framework_info.detected_files:
             click.echo("   Detected in:")
@@ -155,6 +508,251 @@ def detect(input_path: Path, verbose: bool):
         sys.exit(1)
 
 
+@main.command()
+@click.option(
+    "--input",
+    "-i",
+    "input_path",
+    type=click.Path(exists=True, file_okay=False, dir_okay=True, path_type=Path),
+    required=False,
+    default=Path("."),
+    help="Path to the Python project directory",
+)
+@click.option(
+    "--output",
+    "-o",
+    "output_path",
+    type=click.Path(path_type=Path),
+    default=Path("client.ts"),
+    required=False,
+    help="Path for the generated TypeScript client file",
+)
+@click.option(
+    "--client-type",
+    "-c",
+    type=click.Choice(list(GENERATORS.keys())),
+    default="fetch",
+    help="Type of TypeScript client to generate",
+)
+@click.option("--base-url", "-b", default=None, help="Base URL for API calls")
+@click.option(
+    "--no-types", is_flag=True, help="Do not include TypeScript type definitions"
+)
+@click.option(
+    "--config",
+    type=click.Path(exists=True, dir_okay=False, path_type=Path),
+    help="Path to configuration file",
+)
+@click.option(
+    "--interval",
+    type=click.FloatRange(min=0.01),
+    default=0.5,
+    help="Seconds between checks for changes",
+)
+@click.option("--verbose", "-v", is_flag=True, help="Enable verbose output")
+def watch(
+    input_path: Path,
+    output_path: Path,
+    client_type: str,
+    base_url: Optional[str],
+    no_types: bool,
+    config: Optional[Path],
+    interval: float,
+    verbose: bool,
+):
+    """Regenerate the TypeScript client whenever project files change."""
+    from .core import SpoutGenerator
+    from .models.cli_input import GenerateInput
+    from .watch import SpoutWatcher
+
+    final_config = GenerateInput(
+        project_path=str(input_path),
+        output_path=str(output_path),
+        client_type=client_type,
+        base_url=base_url,
+        include_types=not no_types,
+        config=_load_config(config, verbose),
+    )
+
+    try:
+        watcher = SpoutWatcher(SpoutGenerator(final_config))
+        watcher.start()
+    except Exception as e:
+        click.echo(f"Error during initial generation: {e}", err=True)
+        sys.exit(1)
+    click.echo(f"👀 Watching {input_path} (writing {output_path}, Ctrl+C to stop)")
+
+    def on_update(changed, written):
+        if written:
+            click.echo(f"✅ Regenerated {output_path} ({len(changed)} file(s) changed)")
+        elif verbose:
+            click.echo(f"No output change ({len(changed)} file(s) changed)")
+
+    try:
+        watcher.run(interval=interval, on_update=on_update)
+    except KeyboardInterrupt:
+        pass
+
+
+@main.command()
+@click.option(
+    "--input",
+    "-i",
+    "input_path",
+    type=click.Path(exists=True, file_okay=False, dir_okay=True, path_type=Path),
+    default=Path("."),
+    help="Path to the Python project directory",
+)
+@click.option(
+    "--config",
+    type=click.Path(exists=True, dir_okay=False, path_type=Path),
+    help="Path to configuration file",
+)
+@click.option(
+    "--socket",
+    "socket_path",
+    type=click.Path(dir_okay=False, path_type=Path),
+    default=None,
+    help="Unix socket to listen on (default: .spout_cache/spout.sock in the project)",
+)
+@click.option(
+    "--port",
+    type=click.IntRange(min=0, max=65535),
+    default=None,
+    help=(
+        "Listen on this localhost TCP port instead of a Unix socket; clients "
+        "must send the token in .spout_cache/spout.token"
+    ),
+)
+@click.option(
+    "--idle-timeout",
+    type=click.FloatRange(min=0),
+    default=900.0,
+    help="Exit after this many seconds without requests (0 to never exit)",
+)
+@click.option(
+    "--interval",
+    type=click.FloatRange(min=0.05),
+    default=0.5,
+    help="Seconds between checks for changed files",
+)
+@click.option("--no-cache", is_flag=True, help="Do not read or write the parse cache")
+@click.option("--verbose", "-v", is_flag=True, help="Enable verbose output")
+def serve(
+    input_path: Path,
+    config: Optional[Path],
+    socket_path: Optional[Path],
+    port: Optional[int],
+    idle_timeout: float,
+    interval: float,
+    no_cache: bool,
+    verbose: bool,
+):
+    """Keep the project warm and answer requests from `spout call`."""
+    from .models.cli_input import GenerateInput
+    from .server import SpoutDaemon
+
+    final_config = GenerateInput(
+        project_path=str(input_path),
+        output_path="",
+        config=_load_config(config, verbose),
+        use_cache=not no_cache,
+    )
+    daemon = SpoutDaemon(
+        final_config, idle_timeout=idle_timeout or None, interval=interval
+    )
+
+    def announce():
+        if daemon.ready.wait():
+            click.echo(f"🚰 Serving {input_path} on {daemon.address}")
+
+    threading.Thread(target=announce, daemon=True).start()
+    try:
+        daemon.serve(socket_path=socket_path, port=port)
+    except OSError as e:
+        click.echo(f"Error starting server: {e}", err=True)
+        sys.exit(1)
+    except KeyboardInterrupt:
+        pass
+
+
+@main.command()
+@click.argument(
+    "method", type=click.Choice(["ping", "detect", "endpoints", "generate", "shutdown"])
+)
+@click.option(
+    "--input",
+    "-i",
+    "input_path",
+    type=click.Path(exists=True, file_okay=False, dir_okay=True, path_type=Path),
+    default=Path("."),
+    help="Project whose default socket (or TCP token) to use",
+)
+@click.option(
+    "--params",
+    default="{}",
+    help='Method parameters as a JSON object, e.g. \'{"client_type": "axios"}\'',
+)
+@click.option(
+    "--socket",
+    "socket_path",
+    type=click.Path(dir_okay=False, path_type=Path),
+    default=None,
+    help="Unix socket of the daemon",
+)
+@click.option(
+    "--port",
+    type=click.IntRange(min=1, max=65535),
+    default=None,
+    help="Localhost TCP port of the daemon",
+)
+def call(
+    method: str,
+    input_path: Path,
+    params: str,
+    socket_path: Optional[Path],
+    port: Optional[int],
+):
+    """Send one request to a running `spout serve` daemon and print the result."""
+    from .server import (
+        DaemonClient,
+        DaemonError,
+        default_socket_path,
+        default_token_path,
+    )
+
+    try:
+        params_data = json.loads(params)
+    except ValueError as e:
+        click.echo(f"Invalid --params: {e}", err=True)
+        sys.exit(1)
+    if not isinstance(params_data, dict):
+        click.echo("Invalid --params: expected a JSON object", err=True)
+        sys.exit(1)
+    token = None
+    if port is not None:
+        token_path = default_token_path(input_path)
+        if token_path.exists():
+            token = token_path.read_text().strip()
+    elif socket_path is None:
+        socket_path = default_socket_path(input_path)
+
+    try:
+        client = DaemonClient(socket_path, port, token=token)
+        result = client.call(method, **params_data)
+    except DaemonError as e:
+        click.echo(f"Error: {e}", err=True)
+        sys.exit(1)
+    except OSError as e:
+        click.echo(f"Could not reach the daemon: {e}", err=True)
+        sys.exit(1)
+
+    if isinstance(result, dict) and set(result) == {"code"}:
+        click.echo(result["code"], nl=False)
+    else:
+        click.echo(json.dumps(result, indent=2))
+
+
 @main.command()
 def list_generators():
     """List available TypeScript client generators."""
@@ -1,10 +1,32 @@
 """Core Spout functionality."""
 
-from typing import List, Optional
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Dict, List, Optional, Sequence
 
-from .framework_detectors import detect_framework, BaseFrameworkDetector
-from .generators import GENERATORS, BaseClientGenerator
-from .models import DetectInput, GenerateInput, Endpoint, FrameworkInfo
+from .framework_detectors import (
+    BaseFrameworkDetector,
+    ProjectIndex,
+    build_index,
+    detect_framework,
+)
+from .framework_detectors.symbols import SymbolIndex
+from .framework_detectors.type_resolver import TypeResolver, endpoint_type_names
+from .generators import GENERATORS
+from .generators.base import BaseClientGenerator
+from .generators.runtime import INPUT_OPTIONS, runtime_options
+from .models import DetectInput, GenerateInput, GenerateTarget, Endpoint, FrameworkInfo
+from .models.ir import AnyEndpoint, ModelIR, to_endpoint_model
+from .shared import timing
+from .shared.cache import CACHE_DIR_NAME, ParseCache
+from .shared.manifest import (
+    OutputManifest,
+    input_key,
+    manifest_path,
+    outputs_current,
+)
+from .shared.utils import output_location, write_atomic
+from .shared.walker import ProjectWalker
 
 
 class SpoutDetector:
@@ -13,19 +35,45 @@ class SpoutDetector:
     def __init__(self, input_data: DetectInput | GenerateInput):
         """Initialize the detector."""
         self.input_data: DetectInput | GenerateInput = input_data
+        self._index: Optional[ProjectIndex] = None
+        self._symbols: Optional[SymbolIndex] = None
         self._detector: Optional[BaseFrameworkDetector] = None
         self._framework_info = None
+        self._parsed_endpoints: Optional[List[AnyEndpoint]] = None
         self._endpoints: Optional[List[Endpoint]] = None
 
+    @property
+    def index(self) -> ProjectIndex:
+        if self._index is None:
+            walker = ProjectWalker.from_config(
+                self.input_data.path, self.input_data.config
+            )
+            # Files are read as detection needs them, the rest on first use
+            self._index = build_index(self.input_data.path, walker, lazy=True)
+        return self._index
+
+    @property
+    def symbols(self) -> SymbolIndex:
+        """Module-level symbols of the project, built on first access."""
+        if self._symbols is None:
+            cache = None
+            if self.input_data.use_cache:
+                cache = ParseCache.for_project(self.input_data.path)
+            self._symbols = SymbolIndex.build(self.index, cache)
+        return self._symbols
+
     @property
     def detector(self) -> BaseFrameworkDetector:
         if self._detector is None:
             print("project path is:", self.input_data.path)
-            detector = detect_framework(self.input_data.path)
+            detector = detect_framework(self.input_data.path, self.index)
             if not detector:
                 raise ValueError(
                     f"No supported framework detected in {self.input_data.path}"
                 )
+            detector.jobs = self.input_data.jobs
+            if self.input_data.use_cache:
+                detector.cache = ParseCache.for_project(self.input_data.path)
             self._detector = detector
         return self._detector
 
@@ -35,10 +83,22 @@ class SpoutDetector:
             self._framework_info = self.detector.framework_info
         return self._framework_info
 
+    @property
+    def parsed_endpoints(self) -> List[AnyEndpoint]:
+        """Endpoints in the lightweight form consumed by generators."""
+        if self._parsed_endpoints is None:
+            if self._endpoints is not None:
+                # Public models supplied directly are used as-is
+                self._parsed_endpoints = list(self._endpoints)
+            else:
+                self._parsed_endpoints = self.detector.parse()
+        return self._parsed_endpoints
+
     @property
     def endpoints(self) -> List[Endpoint]:
+        """Endpoints as public pydantic models, converted on first access."""
         if self._endpoints is None:
-            self._endpoints = self.detector.parse(self.input_data.path)
+            self._endpoints = [to_endpoint_model(e) for e in self.parsed_endpoints]
         return self._endpoints
 
 
@@ -50,20 +110,91 @@ class SpoutGenerator(SpoutDetector):
         super().__init__(input_data)
         self.input_data: GenerateInput = input_data
         self._generator: BaseClientGenerator | None = None
+        self._models: Optional[Dict[str, ModelIR]] = None
+        # Every file of the client last written, changed or not
+        self.output_files: List[Path] = []
+
+    @property
+    def models(self) -> Dict[str, ModelIR]:
+        """Model definitions reachable from the parsed endpoints."""
+        if self._models is None:
+            self._models = self.resolve_models(self.parsed_endpoints)
+        return self._models
+
+    def resolve_models(self, endpoints: List[AnyEndpoint]) -> Dict[str, ModelIR]:
+        """Resolve the models referenced by ``endpoints`` from project source."""
+        if not self.input_data.include_types or not endpoint_type_names(endpoints):
+            return {}
+        return TypeResolver(self.index, self.symbols).resolve_endpoints(endpoints)
+
+    def derive(self, **options) -> "SpoutGenerator":
+        """
+        Return a generator with other output options over the same project.
+
+        The project index, symbols, detector and parsed endpoints are shared
+        with this generator, so the derived one only repeats rendering.
+        Resolved models are shared as well unless ``include_types`` changes.
+        The index is built first if needed, so that all derived generators
+        share one walk of the project.
+
+        Args:
+            **options: ``GenerateInput`` fields to override
+        """
+        derived = SpoutGenerator(self.input_data.model_copy(update=options))
+        derived._index = self.index
+        derived._symbols = self._symbols
+        derived._detector = self._detector
+        derived._framework_info = self._framework_info
+        derived._parsed_endpoints = self._parsed_endpoints
+        derived._endpoints = self._endpoints
+        if derived.input_data.include_types == self.input_data.include_types:
+            derived._models = self._models
+        return derived
 
     @property
     def generator(self) -> "BaseClientGenerator":
         if self._generator is None:
-            if self.input_data.client_type not in GENERATORS:
-                raise ValueError(
-                    f"Unsupported client type: {self.input_data.client_type}. Available: {list(GENERATORS.keys())}"
-                )
-            generator = GENERATORS[self.input_data.client_type](
-                base_url=self.input_data.base_url,
-                include_types=self.input_data.include_types,
+            self._generator = self._create_generator()
+        return self._generator
+
+    def _create_generator(self) -> BaseClientGenerator:
+        """
+        Instantiate the generator selected by the input options.
+
+        Raises:
+            ValueError: If client_type is not supported
+        """
+        client_type = self.input_data.client_type
+        if client_type not in GENERATORS:
+            available = ", ".join(GENERATORS.keys())
+            raise ValueError(
+                f"Unsupported client type: {client_type}. Available: {available}"
             )
-            self._generator = generator
-        return self._generator  # type: ignore
+
+        options = dict(
+            base_url=self.input_data.base_url or "",
+            include_types=self.input_data.include_types,
+            models=self.models,
+        )
+        runtime = runtime_options(
+            self.input_data.config,
+            **{name: getattr(self.input_data, name) for name in INPUT_OPTIONS},
+        )
+        # Only passed when used, so plugin generators need not accept them
+        if runtime.enabled or runtime.timeout is not None:
+            options["runtime"] = runtime
+        if self.input_data.style != "class":
+            options["style"] = self.input_data.style
+        if self.input_data.engine == "template":
+            from .generators.templated import template_generator
+
+            cache_dir = None
+            if self.input_data.use_cache:
+                cache_dir = self.input_data.path / CACHE_DIR_NAME / "templates"
+            return template_generator(client_type)(
+                bytecode_cache_dir=cache_dir, **options
+            )
+        return GENERATORS[client_type](**options)
 
     def generate_client(self) -> str:
         """
@@ -75,15 +206,201 @@ class SpoutGenerator(SpoutDetector):
         Raises:
             ValueError: If client_type is not supported
         """
-        if self.input_data.client_type not in GENERATORS:
-            available = ", ".join(GENERATORS.keys())
-            raise ValueError(
-                f"Unsupported client type: {self.input_data.client_type}. Available: {available}"
+        return self.generator.generate(self.parsed_endpoints)
+
+    def write_client(self, output_path: Path) -> bool:
+        """
+        Stream the generated client into ``output_path`` atomically.
+
+        Returns:
+            True if the file was written, False if it was already up to date
+        """
+        endpoints = self.parsed_endpoints
+        self.output_files = [output_path]
+        with timing.phase("write") as stats:
+            written = write_atomic(
+                output_path, self.generator.generate_iter(endpoints)
             )
+            stats.add(endpoints=len(endpoints), written=int(written))
+        return written
 
-        generator_class = GENERATORS[self.input_data.client_type]
-        generator = generator_class(
-            base_url=self.input_data.base_url,
-            include_types=self.input_data.include_types,
+    @property
+    def output_location(self) -> Path:
+        """The client file, or for a split client its directory."""
+        return output_location(
+            Path(self.input_data.output_path), self.input_data.split_by
         )
-        return generator.generate(self.endpoints)
+
+    def manifest_key(self) -> str:
+        """Hash of every option that shapes the generated client."""
+        return input_key(self.input_data)
+
+    def is_up_to_date(self) -> bool:
+        """
+        Return whether the output's manifest still matches the project.
+
+        Only the project tree is walked and stat'ed; files whose size or
+        mtime changed are hashed. Nothing is read, detected or parsed.
+        """
+        with timing.phase("manifest"):
+            project_path = self.input_data.path
+            names = [p.relative_to(project_path).as_posix() for p in self.index.paths]
+            return outputs_current(
+                project_path, names, [(self.output_location, self.manifest_key())]
+            )
+
+    def save_manifest(self) -> None:
+        """Record the inputs and files of the client last written."""
+        index = self.index
+        inputs = []
+        for path in index.paths:
+            scanned = index.get(path)
+            inputs.append((path, scanned.stat if scanned is not None else None))
+        location = self.output_location
+        with timing.phase("manifest") as stats:
+            manifest = OutputManifest.build(
+                manifest_path(location),
+                self.manifest_key(),
+                self.input_data.path,
+                inputs,
+                self.output_files,
+            )
+            manifest.save()
+            stats.add(files=len(inputs))
+
+    def write_output(self, force: bool = False) -> List[Path]:
+        """
+        Write the client where ``output_path`` and ``split_by`` ask for it.
+
+        Unless ``force`` is set, nothing is parsed or written when the
+        manifest beside the output shows that neither the project sources
+        nor the options changed since it was generated.
+
+        Returns:
+            Paths of the files that were written
+        """
+        if not force and self.is_up_to_date():
+            return []
+        location = self.output_location
+        split_by = self.input_data.split_by
+        if split_by:
+            written = self.write_split_client(location, split_by)
+        else:
+            written = [location] if self.write_client(location) else []
+        self.save_manifest()
+        return written
+
+    def write_targets(
+        self,
+        targets: Sequence[GenerateTarget],
+        parallel: bool = False,
+        force: bool = False,
+    ) -> List[List[Path]]:
+        """
+        Emit several clients from a single detection and parse.
+
+        The project is parsed, and its models resolved, once up front; each
+        target then only renders and writes through a derived generator.
+
+        Args:
+            targets: Clients to emit, with their output paths and options
+            parallel: Render and write the targets concurrently in threads
+            force: Regenerate targets whose manifest shows them up to date
+
+        Returns:
+            Paths written for each target, in target order
+        """
+        results: List[List[Path]] = [[] for _ in targets]
+        stale = [
+            i
+            for i, target in enumerate(targets)
+            if force or not self.derive(**target.options()).is_up_to_date()
+        ]
+        if not stale:
+            return results
+
+        # Fill the shared state before fanning out so no target repeats it
+        endpoints = self.parsed_endpoints
+        generators = [self.derive(**targets[i].options()) for i in stale]
+        typed = [g for g in generators if g.input_data.include_types]
+        if typed:
+            if self.input_data.include_types:
+                models = self.models
+            else:
+                models = typed[0].resolve_models(endpoints)
+            for generator in typed:
+                generator._models = models
+        for generator in generators:
+            generator._generator = generator._create_generator()
+
+        def write(generator: SpoutGenerator) -> List[Path]:
+            return generator.write_output(force=True)
+
+        if not parallel or len(generators) < 2:
+            written = [write(generator) for generator in generators]
+        else:
+            with ThreadPoolExecutor(max_workers=len(generators)) as executor:
+                written = list(executor.map(write, generators))
+        for i, paths in zip(stale, written):
+            results[i] = paths
+        return results
+
+    def write_split_client(self, output_dir: Path, split_by: str) -> List[Path]:
+        """
+        Write a multi-file client, one module per endpoint group.
+
+        Modules are rendered and written concurrently; each write is atomic
+        and skipped when the module is unchanged. Modules the previous run
+        recorded in the manifest but no longer generated are removed.
+
+        Args:
+            output_dir: Directory receiving the modules
+            split_by: How to group endpoints (``tag``, ``file`` or ``prefix``)
+
+        Returns:
+            Paths of the modules that were written
+        """
+        modules = self.generator.generate_modules(
+            self.parsed_endpoints, split_by, self.input_data.path
+        )
+        self.output_files = [output_dir / name for name in modules]
+
+        def write_module(item):
+            name, chunks = item
+            path = output_dir / name
+            return path if write_atomic(path, chunks) else None
+
+        with timing.phase("write") as stats:
+            with ThreadPoolExecutor(max_workers=self.input_data.jobs) as executor:
+                written = [p for p in executor.map(write_module, modules.items()) if p]
+            removed = _remove_stale_modules(output_dir, self.output_files)
+            stats.add(modules=len(modules), written=len(written), removed=removed)
+        return written
+
+
+def _remove_stale_modules(output_dir: Path, current: List[Path]) -> int:
+    """
+    Delete the modules of a split client that are no longer generated.
+
+    Only files the previous manifest recorded inside ``output_dir`` are
+    considered, so nothing the user put there is touched.
+
+    Returns:
+        Number of files removed
+    """
+    manifest = OutputManifest.load(manifest_path(output_dir))
+    if manifest is None:
+        return 0
+    root = output_dir.resolve()
+    keep = {path.resolve() for path in current}
+    removed = 0
+    for name in manifest.outputs:
+        path = (manifest.path.parent / name).resolve()
+        if path.parent != root or path in keep:
+            continue
+        try:
+            path.unlink()
+            removed += 1
+        except FileNotFoundError:
+            pass
+    return removed
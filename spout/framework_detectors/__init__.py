@@ -1,4 +1,17 @@
 """Framework detectors package."""
 
-from .detect_service import detect_framework
-from .base import BaseFrameworkDetector
+import importlib
+from typing import TYPE_CHECKING, Any
+
+from .detect_service import DETECTORS, build_index, detect_framework
+from .scanner import ProjectIndex, ScannedFile
+
+if TYPE_CHECKING:
+    from .base import BaseFrameworkDetector
+
+
+def __getattr__(name: str) -> Any:
+    # The base detector pulls in the pydantic models; import it on demand
+    if name == "BaseFrameworkDetector":
+        return importlib.import_module(".base", __name__).BaseFrameworkDetector
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
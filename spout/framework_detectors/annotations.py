@@ -0,0 +1,131 @@
+"""Conversion of Python type annotations to TypeScript type strings."""
+
+import ast
+from typing import List, Optional
+
+# Bare Python names with a direct TypeScript equivalent
+NAME_MAPPING = {
+    "str": "string",
+    "int": "number",
+    "float": "number",
+    "bool": "boolean",
+    "dict": "object",
+    "list": "any[]",
+    "List": "any[]",
+    "Dict": "object",
+    "None": "null",
+    "Any": "any",
+    "bytes": "string",
+    "Decimal": "string",
+    "UUID": "string",
+    "date": "string",
+    "datetime": "string",
+    "time": "string",
+    "EmailStr": "string",
+    "HttpUrl": "string",
+}
+
+_ARRAY_GENERICS = frozenset(
+    ["List", "list", "Sequence", "Set", "set", "FrozenSet", "frozenset", "Iterable"]
+)
+_MAPPING_GENERICS = frozenset(["Dict", "dict", "Mapping", "MutableMapping"])
+_TRANSPARENT_GENERICS = frozenset(["Annotated", "Final", "Required", "NotRequired"])
+
+
+def _generic_name(node: ast.AST) -> Optional[str]:
+    if isinstance(node, ast.Name):
+        return node.id
+    if isinstance(node, ast.Attribute):
+        return node.attr
+    return None
+
+
+def _subscript_args(node: ast.Subscript) -> List[ast.AST]:
+    slice_node = node.slice
+    if isinstance(slice_node, ast.Tuple):
+        return list(slice_node.elts)
+    return [slice_node]
+
+
+def _union(members: List[str]) -> str:
+    unique = list(dict.fromkeys(members))
+    if "any" in unique:
+        return "any"
+    return " | ".join(unique)
+
+
+def _array(item: str) -> str:
+    if " | " in item:
+        item = f"({item})"
+    return f"{item}[]"
+
+
+def annotation_to_typescript(annotation: ast.AST) -> str:
+    """
+    Convert an AST type annotation to a TypeScript type string.
+
+    Handles builtins, ``typing`` generics (``List``, ``Dict``, ``Optional``,
+    ``Union``, ``Literal``, ``Tuple``, ``Annotated``), PEP 604 unions,
+    dotted names and string forward references. Other names are assumed
+    to be models and kept as-is; anything unrecognized becomes ``any``.
+    """
+    if isinstance(annotation, ast.Name):
+        return NAME_MAPPING.get(annotation.id, annotation.id)
+
+    if isinstance(annotation, ast.Attribute):
+        return NAME_MAPPING.get(annotation.attr, annotation.attr)
+
+    if isinstance(annotation, ast.Constant):
+        if annotation.value is None:
+            return "null"
+        if isinstance(annotation.value, str):
+            # Forward reference such as "User"
+            try:
+                expr = ast.parse(annotation.value, mode="eval").body
+            except SyntaxError:
+                return annotation.value
+            return annotation_to_typescript(expr)
+        return str(annotation.value)
+
+    if isinstance(annotation, ast.BinOp) and isinstance(annotation.op, ast.BitOr):
+        return _union(
+            [
+                annotation_to_typescript(annotation.left),
+                annotation_to_typescript(annotation.right),
+            ]
+        )
+
+    if isinstance(annotation, ast.Subscript):
+        name = _generic_name(annotation.value)
+        args = _subscript_args(annotation)
+
+        if name in _ARRAY_GENERICS:
+            return _array(annotation_to_typescript(args[0]))
+        if name == "Tuple" or name == "tuple":
+            if len(args) == 2 and isinstance(args[1], ast.Constant):
+                if args[1].value is Ellipsis:
+                    return _array(annotation_to_typescript(args[0]))
+            return f"[{', '.join(annotation_to_typescript(a) for a in args)}]"
+        if name == "Optional":
+            return _union([annotation_to_typescript(args[0]), "null"])
+        if name == "Union":
+            return _union([annotation_to_typescript(a) for a in args])
+        if name in _MAPPING_GENERICS and len(args) == 2:
+            key = annotation_to_typescript(args[0])
+            if key not in ("string", "number"):
+                key = "string"
+            return f"Record<{key}, {annotation_to_typescript(args[1])}>"
+        if name == "Literal":
+            literals = []
+            for arg in args:
+                if isinstance(arg, ast.Constant) and isinstance(arg.value, str):
+                    literals.append(f"'{arg.value}'")
+                elif isinstance(arg, ast.Constant) and isinstance(arg.value, bool):
+                    literals.append("true" if arg.value else "false")
+                elif isinstance(arg, ast.Constant):
+                    literals.append(repr(arg.value))
+            return _union(literals) if literals else "any"
+        if name in _TRANSPARENT_GENERICS:
+            return annotation_to_typescript(args[0])
+
+    return "any"  # Fallback for complex types
@@ -1,46 +1,356 @@
 """Base framework detector interface."""
 
+import ast
+import os
 from abc import ABC, abstractmethod
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
-from typing import List, Optional
+from typing import Any, ClassVar, Dict, List, Optional, Pattern, Tuple, Union
 
-from ..models import FrameworkInfo, Endpoint
+from ..models import EndpointMethod, FrameworkInfo, SupportedFramework
+from ..models.ir import EndpointIR, ResponseIR
+from ..shared import timing
+from ..shared.cache import ParseCache
+from ..shared.constants import MAX_CONFIDENCE
 from ..shared.utils import _read_file_safe
+from ..shared.walker import ProjectWalker
+from .annotations import annotation_to_typescript
+from .scanner import ProjectIndex, ScannedFile
+
+FunctionNode = Union[ast.FunctionDef, ast.AsyncFunctionDef]
+
+HTTP_METHODS = frozenset(m.value for m in EndpointMethod)
+
+# Below this many uncached files, parsing serially beats pool startup cost
+PARALLEL_PARSE_THRESHOLD = 32
+
+# ``openapi_extra`` entry holding an endpoint's generated-client options
+CLIENT_OPTIONS_EXTENSION = "x-spout"
 
 
 class BaseFrameworkDetector(ABC):
     """Abstract base class for framework detectors."""
 
-    def __init__(self, project_path: Path, framework_info: FrameworkInfo):
+    # Scan patterns evaluated once per file by the shared ProjectIndex
+    framework: ClassVar[SupportedFramework]
+    import_pattern: ClassVar[Pattern[str]]
+    instantiation_pattern: ClassVar[Pattern[str]]
+
+    # Literals every file matching a scan pattern contains; files with none
+    # of them skip the pattern search. Empty disables the prefilter.
+    prefilter: ClassVar[Tuple[bytes, ...]] = ()
+
+    # Confidence added by each file importing or instantiating the framework
+    import_weight: ClassVar[float] = 0.2
+    instantiation_weight: ClassVar[float] = 0.3
+
+    # Lowest confidence at which the framework counts as detected
+    min_confidence: ClassVar[float] = 0.3
+
+    def __init__(
+        self,
+        project_path: Path,
+        framework_info: FrameworkInfo,
+        index: Optional[ProjectIndex] = None,
+        cache: Optional[ParseCache] = None,
+        jobs: Optional[int] = None,
+    ):
         self.project_path = project_path
         self.framework_info = framework_info
         self.detected_files = framework_info.detected_files
+        self.index = index
+        self.cache = cache
+        self.jobs = jobs
 
     @classmethod
-    @abstractmethod
-    def detect(cls, project_path: Path) -> Optional[FrameworkInfo]:
+    def detect(
+        cls, project_path: Path, index: Optional[ProjectIndex] = None
+    ) -> Optional[FrameworkInfo]:
         """
         Detect if the framework is present in the given project.
 
+        Confidence is the project-level evidence plus the weights of every
+        file importing or instantiating the framework, capped at
+        ``MAX_CONFIDENCE``.
+
         Args:
             project_path: Path to the project directory
+            index: Shared project index; built for this detector alone if omitted
 
         Returns:
             FrameworkInfo if detected, None otherwise
         """
-        pass
+        index = cls._get_index(project_path, index)
+        confidence, detected_files = cls.project_evidence(project_path, index)
+        for scanned in index.files:
+            weight = cls.file_confidence(scanned)
+            if weight:
+                confidence += weight
+                detected_files.append(str(scanned.path))
+        return cls.make_framework_info(confidence, detected_files)
+
+    @classmethod
+    def project_evidence(
+        cls, project_path: Path, index: ProjectIndex
+    ) -> Tuple[float, List[str]]:
+        """
+        Score evidence found outside the Python sources.
+
+        Returns:
+            Confidence and the files providing it, such as requirements
+        """
+        return 0.0, []
+
+    @classmethod
+    def file_confidence(cls, scanned: ScannedFile) -> float:
+        """Return the confidence a single scanned file adds."""
+        key = cls.framework.value
+        weight = 0.0
+        if key in scanned.imports:
+            weight += cls.import_weight
+        if key in scanned.instantiations:
+            weight += cls.instantiation_weight
+        return weight
+
+    @classmethod
+    def make_framework_info(
+        cls, confidence: float, detected_files: List[str]
+    ) -> Optional[FrameworkInfo]:
+        """Build the detection result, or None below ``min_confidence``."""
+        if confidence < cls.min_confidence:
+            return None
+        return FrameworkInfo(
+            name=cls.framework,
+            detected_files=detected_files,
+            confidence=min(confidence, MAX_CONFIDENCE),
+        )
 
     @abstractmethod
-    def parse(self, file_path: Path) -> List[Endpoint]:
-        """Parse the given file and return a list of endpoints."""
+    def _parse_ast_for_endpoints(
+        self, tree: ast.AST, file_path: Path
+    ) -> List[EndpointIR]:
+        """Extract endpoints from the AST of a single file."""
         pass
 
+    def parse(self) -> List[EndpointIR]:
+        """
+        Parse the detected files and return a list of endpoints.
+
+        Endpoints are returned in their internal form; call ``to_model()``
+        on each for the public ``Endpoint`` model.
+        """
+        if self.index is not None and self.index.remaining:
+            # Detection stopped early; collect every file that needs parsing
+            framework_info = self.detect(self.project_path, self.index)
+            if framework_info is not None:
+                self.framework_info = framework_info
+                self.detected_files = framework_info.detected_files
+
+        with timing.phase("parse") as stats:
+            endpoints = self._parse()
+            stats.add(endpoints=len(endpoints))
+        return endpoints
+
+    def _parse(self) -> List[EndpointIR]:
+        sources = []
+        for file_path_str in self.detected_files:
+            if not file_path_str.endswith(".py"):
+                continue
+
+            file_path = Path(file_path_str)
+            content = self._read_source(file_path)
+            if not content:
+                continue
+
+            sources.append((file_path, content))
+
+        # Serve unchanged files from the cache and parse only the rest
+        results: List[List[EndpointIR]] = [[] for _ in sources]
+        keys: List[Optional[str]] = [None] * len(sources)
+        pending = []
+        with timing.phase("cache_lookup") as stats:
+            for i, (file_path, content) in enumerate(sources):
+                if self.cache is not None:
+                    keys[i] = self.cache.key(type(self).__name__, file_path, content)
+                    cached = self.cache.get(keys[i])
+                    if cached is not None:
+                        results[i] = [EndpointIR.from_json(d) for d in cached]
+                        stats.add(hits=1)
+                        continue
+                pending.append(i)
+
+        parsed = self._parse_sources([sources[i] for i in pending])
+
+        with timing.phase("cache_store"):
+            for i, endpoints in zip(pending, parsed):
+                results[i] = endpoints
+                key = keys[i]
+                if self.cache is not None and key is not None:
+                    self.cache.set(key, [e.to_json() for e in endpoints])
+
+            if self.cache is not None:
+                self.cache.prune()
+
+        return [endpoint for endpoints in results for endpoint in endpoints]
+
+    def _parse_sources(self, sources: List[Tuple[Path, str]]) -> List[List[EndpointIR]]:
+        """
+        Parse source files, in a process pool when there are enough of them.
+
+        Results are returned in the same order as ``sources``.
+        """
+        jobs = self.jobs or os.cpu_count() or 1
+        if jobs <= 1 or len(sources) < PARALLEL_PARSE_THRESHOLD:
+            return [self._parse_source(*source) for source in sources]
+
+        jobs = min(jobs, len(sources))
+        chunksize = max(1, len(sources) // (jobs * 4))
+        # Workers do not record timings; the pool is timed as a whole
+        with timing.phase("parse_pool") as stats:
+            stats.add(files=len(sources), jobs=jobs)
+            with ProcessPoolExecutor(
+                max_workers=jobs,
+                initializer=_init_parse_worker,
+                initargs=(self,),
+            ) as executor:
+                return list(
+                    executor.map(_parse_in_worker, sources, chunksize=chunksize)
+                )
+
+    def _parse_source(self, file_path: Path, content: str) -> List[EndpointIR]:
+        """Parse a single source file."""
+        with timing.phase("ast_parse") as stats:
+            stats.add(files=1, bytes=len(content))
+            try:
+                tree = ast.parse(content)
+            except SyntaxError:
+                # Skip files with syntax errors
+                return []
+        with timing.phase("extract"):
+            return self._parse_ast_for_endpoints(tree, file_path)
+
+    def __getstate__(self) -> Dict[str, Any]:
+        # The index and cache stay in the parent process; workers only parse
+        state = self.__dict__.copy()
+        state["index"] = None
+        state["cache"] = None
+        return state
+
+    @staticmethod
+    def _parse_decorator_tags(decorator: ast.Call) -> Tuple[str, ...]:
+        """Extract a literal ``tags=[...]`` keyword from a route decorator."""
+        for keyword in decorator.keywords:
+            if keyword.arg == "tags" and isinstance(keyword.value, (ast.List, ast.Tuple)):
+                return tuple(
+                    elt.value
+                    for elt in keyword.value.elts
+                    if isinstance(elt, ast.Constant) and isinstance(elt.value, str)
+                )
+        return ()
+
+    @staticmethod
+    def _parse_decorator_client_options(
+        decorator: ast.Call,
+    ) -> Tuple[Tuple[str, Any], ...]:
+        """
+        Extract client options from a literal ``openapi_extra`` keyword.
+
+        Options are read from its ``CLIENT_OPTIONS_EXTENSION`` entry, e.g.
+        ``openapi_extra={"x-spout": {"dedupe": False}}``.
+        """
+        for keyword in decorator.keywords:
+            if keyword.arg != "openapi_extra":
+                continue
+            try:
+                extra = ast.literal_eval(keyword.value)
+            except (ValueError, TypeError, SyntaxError, RecursionError):
+                return ()
+            if isinstance(extra, dict):
+                options = extra.get(CLIENT_OPTIONS_EXTENSION)
+                if isinstance(options, dict):
+                    return tuple(
+                        (name, value)
+                        for name, value in options.items()
+                        if isinstance(name, str)
+                    )
+        return ()
+
+    @staticmethod
+    def _parse_responses(
+        decorator: ast.Call, func_node: FunctionNode, keyword: str
+    ) -> Tuple[ResponseIR, ...]:
+        """
+        Extract the success response type of a route.
+
+        The decorator keyword (``response_model=`` or ``response=``) takes
+        precedence over the function's return annotation. A status-code
+        mapping such as ``response={200: Out}`` uses its 2xx entry.
+        """
+        annotation = None
+        status_code = 200
+        for kw in decorator.keywords:
+            if kw.arg == keyword:
+                annotation = kw.value
+        if isinstance(annotation, ast.Dict):
+            responses = [
+                (key.value, value)
+                for key, value in zip(annotation.keys, annotation.values)
+                if isinstance(key, ast.Constant) and isinstance(key.value, int)
+            ]
+            annotation = None
+            for code, value in sorted(responses, key=lambda r: r[0]):
+                if 200 <= code < 300:
+                    status_code, annotation = code, value
+                    break
+        if annotation is None:
+            annotation = func_node.returns
+        if annotation is None:
+            return ()
+        return (
+            ResponseIR(
+                status_code=status_code,
+                type=annotation_to_typescript(annotation),
+                python_type=ast.unparse(annotation),
+            ),
+        )
+
+    @classmethod
+    def _get_index(
+        cls, project_path: Path, index: Optional[ProjectIndex]
+    ) -> ProjectIndex:
+        """Return the shared index, or scan the project for this detector."""
+        if index is None:
+            index = ProjectIndex.build(project_path, [cls])
+        return index
+
+    def _read_source(self, file_path: Path) -> Optional[str]:
+        """Return file content from the shared index, falling back to disk."""
+        if self.index is not None:
+            content = self.index.get_content(file_path)
+            if content is not None:
+                return content
+        return self._read_file_safe(file_path)
+
     @classmethod
     def _find_python_files(cls, project_path: Path) -> List[Path]:
-        """Find all Python files in the project."""
-        return list(project_path.rglob("*.py"))
+        """Find the project's Python files, pruning excluded directories."""
+        return ProjectWalker(project_path).walk()
 
     @classmethod
     def _read_file_safe(cls, file_path: Path) -> Optional[str]:
         """Safely read a file, returning None if it fails."""
         return _read_file_safe(file_path)
+
+
+# Detector used by each parse worker process, set once by the pool initializer
+_worker_detector: Optional[BaseFrameworkDetector] = None
+
+
+def _init_parse_worker(detector: BaseFrameworkDetector) -> None:
+    global _worker_detector
+    _worker_detector = detector
+
+
+def _parse_in_worker(source: Tuple[Path, str]) -> List[EndpointIR]:
+    assert _worker_detector is not None
+    return _worker_detector._parse_source(*source)
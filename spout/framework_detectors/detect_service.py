@@ -1,33 +1,167 @@
+import warnings
 from pathlib import Path
-from typing import Optional, Type
+from typing import TYPE_CHECKING, Dict, List, Optional, Tuple, Type
 
-from .base import BaseFrameworkDetector
-from .django_ninja import DjangoNinjaDetector
-from .fastapi import FastAPIDetector
+from .scanner import ProjectIndex
+from ..shared import timing
+from ..shared.constants import MAX_CONFIDENCE
+from ..shared.plugins import DETECTOR_GROUP
+from ..shared.registry import LazyRegistry
+from ..shared.walker import ProjectWalker
 
-DETECTORS = [FastAPIDetector, DjangoNinjaDetector]
+if TYPE_CHECKING:
+    from ..models.framework import FrameworkInfo
+    from .base import BaseFrameworkDetector
 
+# Registry of framework detectors, extended by "spout.detectors" plugins and
+# imported when detection first runs
+DETECTORS = LazyRegistry(
+    {
+        "fastapi": ".fastapi:FastAPIDetector",
+        "django-ninja": ".django_ninja:DjangoNinjaDetector",
+    },
+    package=__package__,
+    group=DETECTOR_GROUP,
+)
 
-def detect_framework(project_path: Path) -> Optional[BaseFrameworkDetector]:
+
+def detector_classes() -> List[Type["BaseFrameworkDetector"]]:
+    """
+    Return every registered detector class, importing them as needed.
+
+    A plugin that fails to import is skipped with a warning so that it
+    cannot break detection of the other frameworks.
+    """
+    classes = []
+    for name in DETECTORS:
+        try:
+            classes.append(DETECTORS[name])
+        except (ImportError, AttributeError) as e:
+            warnings.warn(f"Could not load detector plugin {name!r}: {e}")
+    return classes
+
+
+def build_index(
+    project_path: Path, walker: Optional[ProjectWalker] = None, lazy: bool = False
+) -> ProjectIndex:
+    """
+    Scan the project once for every registered detector.
+
+    With ``lazy`` the tree is only walked; ``detect_framework`` then reads
+    files until the framework is decided and the rest are read on demand.
+    """
+    return ProjectIndex.build(project_path, detector_classes(), walker, lazy)
+
+
+def detect_framework(
+    project_path: Path, index: Optional[ProjectIndex] = None
+) -> Optional["BaseFrameworkDetector"]:
     """
     Detect the web framework used in the given project.
 
+    On a lazily built index, files are read one at a time and detection
+    stops as soon as its outcome is decided. The index is then narrowed to
+    the winning detector, so the files read later for parsing are only
+    matched against its patterns.
+
     Args:
         project_path: Path to the Python project
+        index: Pre-built project index shared by all detectors; built
+            lazily when omitted
 
     Returns:
         FrameworkInfo if a supported framework is detected, None otherwise
     """
+    if index is None:
+        index = build_index(project_path, lazy=True)
+
+    detectors = detector_classes()
     best_match = None
-    best_confidence = 0.0
-    best_detector: Optional[Type[BaseFrameworkDetector]] = None
-
-    for detector in DETECTORS:
-        framework_info = detector.detect(project_path)
-        if framework_info and framework_info.confidence > best_confidence:
-            best_match = framework_info
-            best_confidence = framework_info.confidence
-            best_detector = detector
+    best_detector: Optional[Type["BaseFrameworkDetector"]] = None
+
+    with timing.phase("detect") as stats:
+        if index.remaining:
+            best_detector, best_match = _detect_early(project_path, index, detectors)
+            stats.add(files=len(index.paths) - index.remaining, skipped=index.remaining)
+            if best_detector is not None:
+                index.detectors = [best_detector]
+        else:
+            best_confidence = 0.0
+            for detector in detectors:
+                framework_info = detector.detect(project_path, index)
+                if framework_info and framework_info.confidence > best_confidence:
+                    best_match = framework_info
+                    best_confidence = framework_info.confidence
+                    best_detector = detector
     if best_detector and best_match:
-        return best_detector(project_path, best_match)
+        return best_detector(project_path, best_match, index=index)
     return None
+
+
+def _detect_early(
+    project_path: Path,
+    index: ProjectIndex,
+    detectors: List[Type["BaseFrameworkDetector"]],
+) -> Tuple[Optional[Type["BaseFrameworkDetector"]], Optional["FrameworkInfo"]]:
+    """
+    Score detectors file by file until the winner is decided.
+
+    Scanning stops when no detector could overtake the leader, or tie with
+    it while registered earlier, even if every unread file counted for it.
+    The result then reflects only the files read so far.
+    """
+    scores = {d: d.project_evidence(project_path, index) for d in detectors}
+    while True:
+        leader, decided = _leader(scores, detectors, index.remaining)
+        if decided:
+            break
+        scanned = index.scan_next()
+        if scanned is None:
+            continue
+        for detector in detectors:
+            weight = detector.file_confidence(scanned)
+            if weight:
+                confidence, files = scores[detector]
+                files.append(str(scanned.path))
+                scores[detector] = (confidence + weight, files)
+
+    if leader is None:
+        return None, None
+    return leader, leader.make_framework_info(*scores[leader])
+
+
+def _leader(
+    scores: Dict[Type["BaseFrameworkDetector"], Tuple[float, List[str]]],
+    detectors: List[Type["BaseFrameworkDetector"]],
+    remaining: int,
+) -> Tuple[Optional[Type["BaseFrameworkDetector"]], bool]:
+    """
+    Return the current winner and whether unread files could still change it.
+
+    Ties go to the detector registered first, as in a full scan, so a
+    leader at ``MAX_CONFIDENCE`` is only decided once no earlier detector
+    could reach it too.
+    """
+    capped = {d: min(scores[d][0], MAX_CONFIDENCE) for d in detectors}
+    leader = None
+    best = 0.0
+    for detector in detectors:
+        if capped[detector] >= detector.min_confidence and capped[detector] > best:
+            leader, best = detector, capped[detector]
+
+    if not remaining:
+        return leader, True
+
+    leader_rank = detectors.index(leader) if leader is not None else len(detectors)
+    for rank, detector in enumerate(detectors):
+        if detector is leader:
+            continue
+        most = (
+            detector.import_weight + detector.instantiation_weight
+        ) * remaining + capped[detector]
+        most = min(most, MAX_CONFIDENCE)
+        if most < detector.min_confidence:
+            continue
+        if most > best or (most == best and rank < leader_rank):
+            return leader, False
+    return leader, True
@@ -3,95 +3,47 @@
 import ast
 import re
 from pathlib import Path
-from typing import List, Optional
+from typing import List, Optional, Tuple
 
-from ..models.endpoint import Endpoint, EndpointMethod, EndpointParameter, ParameterType
-from ..models.framework import FrameworkInfo, SupportedFramework
-from .base import BaseFrameworkDetector
+from ..models.endpoint import ParameterType
+from ..models.framework import SupportedFramework
+from ..models.ir import EndpointIR, ParameterIR
+from .annotations import annotation_to_typescript
+from .base import HTTP_METHODS, BaseFrameworkDetector, FunctionNode
+from .scanner import ProjectIndex
 
 
 class FastAPIDetector(BaseFrameworkDetector):
     """Detector for FastAPI framework."""
 
+    framework = SupportedFramework.FASTAPI
+    import_pattern = re.compile(r"from\s+fastapi\s+import|import\s+fastapi")
+    instantiation_pattern = re.compile(r"FastAPI\s*\(|app\s*=\s*FastAPI")
+    prefilter = (b"fastapi", b"FastAPI")
+
     @classmethod
-    def detect(cls, project_path: Path) -> Optional[FrameworkInfo]:
-        """Detect FastAPI framework in the project."""
+    def project_evidence(
+        cls, project_path: Path, index: ProjectIndex
+    ) -> Tuple[float, List[str]]:
+        """Check for FastAPI in requirements files."""
         confidence = 0.0
         detected_files = []
-
-        # Check for FastAPI in requirements files
-        req_files = ["requirements.txt", "pyproject.toml", "Pipfile"]
-        for req_file in req_files:
-            req_path = project_path / req_file
-            if req_path.exists():
-                content = cls._read_file_safe(req_path)
-                if content and ("fastapi" in content.lower()):
-                    confidence += 0.3
-                    detected_files.append(str(req_path))
-
-        # Check for FastAPI imports in Python files
-        python_files = cls._find_python_files(project_path)
-        fastapi_files = []
-
-        for py_file in python_files:
-            content = cls._read_file_safe(py_file)
-            if content:
-                # Look for FastAPI imports
-                if re.search(r"from\s+fastapi\s+import|import\s+fastapi", content):
-                    confidence += 0.2
-                    fastapi_files.append(str(py_file))
-
-                # Look for FastAPI app instantiation
-                if re.search(r"FastAPI\s*\(|app\s*=\s*FastAPI", content):
-                    confidence += 0.3
-                    if str(py_file) not in fastapi_files:
-                        fastapi_files.append(str(py_file))
-
-        detected_files.extend(fastapi_files)
-
-        if confidence >= 0.3:  # Minimum confidence threshold
-            return FrameworkInfo(
-                name=SupportedFramework.FASTAPI,
-                detected_files=detected_files,
-                confidence=min(confidence, 1.0),
-            )
-
-        return None
-
-    def parse(self) -> List[Endpoint]:
-        """Parse FastAPI endpoints from the project."""
-        endpoints = []
-
-        for file_path_str in self.detected_files:
-            if not file_path_str.endswith(".py"):
-                continue
-
-            file_path = Path(file_path_str)
-            if not file_path.exists():
-                continue
-
-            content = self._read_file_safe(file_path)
-            if not content:
-                continue
-
-            try:
-                tree = ast.parse(content)
-                endpoints.extend(self._parse_ast_for_endpoints(tree, file_path))
-            except SyntaxError:
-                # Skip files with syntax errors
-                continue
-
-        return endpoints
+        for req_file in ["requirements.txt", "pyproject.toml", "Pipfile"]:
+            content = index.read_root_file(req_file)
+            if content and ("fastapi" in content.lower()):
+                confidence += 0.3
+                detected_files.append(str(project_path / req_file))
+        return confidence, detected_files
 
     def _parse_ast_for_endpoints(
         self, tree: ast.AST, file_path: Path
-    ) -> List[Endpoint]:
+    ) -> List[EndpointIR]:
         """Parse AST tree for FastAPI endpoints."""
         endpoints = []
 
         for node in ast.walk(tree):
             # Look for decorator calls like @app.get("/path")
-            if isinstance(node, ast.FunctionDef):
+            if isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef)):
                 for decorator in node.decorator_list:
                     endpoint = self._parse_decorator_endpoint(
                         decorator, node, file_path
@@ -102,8 +54,8 @@ class FastAPIDetector(BaseFrameworkDetector):
         return endpoints
 
     def _parse_decorator_endpoint(
-        self, decorator: ast.AST, func_node: ast.FunctionDef, file_path: Path
-    ) -> Optional[Endpoint]:
+        self, decorator: ast.AST, func_node: FunctionNode, file_path: Path
+    ) -> Optional[EndpointIR]:
         """Parse a FastAPI decorator to extract endpoint information."""
         # Handle @app.get(), @router.post(), etc.
         if not isinstance(decorator, ast.Call):
@@ -113,7 +65,7 @@ class FastAPIDetector(BaseFrameworkDetector):
             return None
 
         method_name = decorator.func.attr.upper()
-        if method_name not in [m.value for m in EndpointMethod]:
+        if method_name not in HTTP_METHODS:
             return None
 
         # Extract path from the first argument
@@ -127,21 +79,22 @@ class FastAPIDetector(BaseFrameworkDetector):
         # Parse function parameters
         parameters = self._parse_function_parameters(func_node)
 
-        return Endpoint(
+        return EndpointIR(
             path=path,
-            method=EndpointMethod(method_name),
+            method=method_name,
             function_name=func_node.name,
             parameters=parameters,
+            responses=self._parse_responses(decorator, func_node, "response_model"),
             description=ast.get_docstring(func_node),
-            framework_data={
-                "file_path": str(file_path),
-                "line_number": func_node.lineno,
-            },
+            tags=self._parse_decorator_tags(decorator),
+            file_path=str(file_path),
+            line_number=func_node.lineno,
+            client_options=self._parse_decorator_client_options(decorator),
         )
 
     def _parse_function_parameters(
-        self, func_node: ast.FunctionDef
-    ) -> List[EndpointParameter]:
+        self, func_node: FunctionNode
+    ) -> Tuple[ParameterIR, ...]:
         """Parse function parameters to extract endpoint parameters."""
         parameters = []
 
@@ -150,44 +103,27 @@ class FastAPIDetector(BaseFrameworkDetector):
                 continue
 
             param_type = "any"  # Default type
+            python_type = "Any"
             if arg.annotation:
-                param_type = self._ast_to_type_string(arg.annotation)
+                param_type = annotation_to_typescript(arg.annotation)
+                python_type = ast.unparse(arg.annotation)
 
             # Determine parameter type based on name patterns (simple heuristic)
             if "path" in arg.arg.lower() or "id" in arg.arg.lower():
-                parameter_type = ParameterType.PATH
+                parameter_type = ParameterType.PATH.value
             elif "body" in arg.arg.lower() or "data" in arg.arg.lower():
-                parameter_type = ParameterType.BODY
+                parameter_type = ParameterType.BODY.value
             else:
-                parameter_type = ParameterType.QUERY
+                parameter_type = ParameterType.QUERY.value
 
             parameters.append(
-                EndpointParameter(
+                ParameterIR(
                     name=arg.arg,
                     type=param_type,
-                    python_type=param_type,
+                    python_type=python_type,
                     parameter_type=parameter_type,
                     required=True,  # TODO: Detect optional parameters
                 )
             )
 
-        return parameters
-
-    def _ast_to_type_string(self, annotation: ast.AST) -> str:
-        """Convert AST type annotation to TypeScript type string."""
-        if isinstance(annotation, ast.Name):
-            type_mapping = {
-                "str": "string",
-                "int": "number",
-                "float": "number",
-                "bool": "boolean",
-                "dict": "object",
-                "list": "any[]",
-                "List": "any[]",
-                "Dict": "object",
-            }
-            return type_mapping.get(annotation.id, annotation.id)
-        elif isinstance(annotation, ast.Constant):
-            return str(annotation.value)
-        else:
-            return "any"  # Fallback for complex types
+        return tuple(parameters)
@@ -0,0 +1,329 @@
+"""Single-pass project scanner shared by all framework detectors."""
+
+import mmap
+import os
+import re
+from collections import deque
+from functools import lru_cache
+from pathlib import Path
+from typing import (
+    TYPE_CHECKING,
+    Deque,
+    Dict,
+    Iterable,
+    List,
+    Optional,
+    Pattern,
+    Sequence,
+    Set,
+    Tuple,
+    Type,
+    Union,
+)
+
+from ..shared import timing
+from ..shared.utils import _read_file_safe, decode_source
+from ..shared.walker import ProjectWalker
+
+if TYPE_CHECKING:
+    from .base import BaseFrameworkDetector
+
+# Files at least this large are prefiltered through mmap, not read whole
+MMAP_THRESHOLD = 256 * 1024
+
+Buffer = Union[bytes, mmap.mmap]
+
+
+class ScannedFile:
+    """
+    A Python source file read once during the project scan.
+
+    Files are matched as bytes; ``content`` is decoded on first access.
+    Large files that no detector cares about are not kept in memory and
+    are read again if their content is ever needed.
+    """
+
+    __slots__ = ("path", "imports", "instantiations", "stat", "_data", "_content")
+
+    def __init__(
+        self,
+        path: Path,
+        content: Optional[str] = None,
+        imports: Optional[Set[str]] = None,
+        instantiations: Optional[Set[str]] = None,
+        data: Optional[bytes] = None,
+        stat: Optional[Tuple[int, int]] = None,
+    ):
+        self.path = path
+        # Size and mtime (ns) of the file when it was read
+        self.stat = stat
+        self.imports: Set[str] = imports if imports is not None else set()
+        self.instantiations: Set[str] = (
+            instantiations if instantiations is not None else set()
+        )
+        self._data = data
+        self._content = content
+
+    @property
+    def content(self) -> str:
+        """The decoded source, empty if it is unreadable or not UTF-8."""
+        if self._content is None:
+            data = self._data
+            if data is None:
+                try:
+                    data = self.path.read_bytes()
+                except OSError:
+                    data = b""
+            self._content = decode_source(data) or ""
+            self._data = None
+        return self._content
+
+    def __repr__(self) -> str:
+        return f"ScannedFile({str(self.path)!r})"
+
+
+class PatternMatcher:
+    """
+    Every detector's scan patterns compiled once for searching bytes.
+
+    Before searching a file with a detector's patterns, the file is checked
+    for that detector's ``prefilter`` literals with plain substring search,
+    which is far cheaper than the regex engine. Files containing none of
+    them are never searched or decoded.
+    """
+
+    def __init__(self, detectors: Sequence[Type["BaseFrameworkDetector"]]):
+        self._detectors = [
+            (
+                detector.framework.value,
+                detector.prefilter,
+                _byte_pattern(detector.import_pattern),
+                _byte_pattern(detector.instantiation_pattern),
+            )
+            for detector in detectors
+        ]
+
+    def match(self, scanned: ScannedFile, data: Buffer) -> bool:
+        """
+        Record the detectors whose patterns match ``data``.
+
+        Returns:
+            Whether any detector's prefilter let the file through
+        """
+        candidate = False
+        for key, literals, import_pattern, instantiation_pattern in self._detectors:
+            if literals and all(data.find(literal) == -1 for literal in literals):
+                continue
+            candidate = True
+            if import_pattern.search(data):
+                scanned.imports.add(key)
+            if instantiation_pattern.search(data):
+                scanned.instantiations.add(key)
+        return candidate
+
+
+def _byte_pattern(pattern: Pattern[str]) -> Pattern[bytes]:
+    """Compile a str scan pattern for searching undecoded source."""
+    if not pattern.pattern.isascii():
+        raise ValueError(f"Scan pattern must be ASCII: {pattern.pattern!r}")
+    return re.compile(pattern.pattern.encode(), pattern.flags & ~re.UNICODE)
+
+
+@lru_cache(maxsize=None)
+def pattern_matcher(
+    detectors: Tuple[Type["BaseFrameworkDetector"], ...]
+) -> PatternMatcher:
+    """Return the matcher for a set of detectors, compiled once."""
+    return PatternMatcher(detectors)
+
+
+def scan_path(file_path: Path, matcher: PatternMatcher) -> Optional[ScannedFile]:
+    """
+    Read a file as bytes and record which detectors' patterns it matches.
+
+    Files of ``MMAP_THRESHOLD`` bytes or more are mapped rather than read,
+    so rejecting one costs no copy. Reading and matching are timed as the
+    ``read`` and ``match`` phases.
+
+    Returns:
+        The scanned file, or None if it could not be read
+    """
+    try:
+        with open(file_path, "rb") as f:
+            stat = os.fstat(f.fileno())
+            file_stat = (stat.st_size, stat.st_mtime_ns)
+            if stat.st_size < MMAP_THRESHOLD:
+                with timing.phase("read") as stats:
+                    data = f.read()
+                    stats.add(files=1, bytes=len(data))
+                scanned = ScannedFile(file_path, data=data, stat=file_stat)
+                with timing.phase("match") as stats:
+                    matcher.match(scanned, data)
+                    stats.add(files=1)
+                return scanned
+
+            scanned = ScannedFile(file_path, stat=file_stat)
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                # Mapped pages are only read as the match touches them
+                with timing.phase("match") as stats:
+                    candidate = matcher.match(scanned, mapped)
+                    stats.add(files=1)
+                with timing.phase("read") as stats:
+                    if candidate:
+                        scanned._data = mapped[:]
+                    stats.add(files=1, bytes=len(mapped))
+            return scanned
+    except (OSError, ValueError):
+        return None
+
+
+class ProjectIndex:
+    """
+    In-memory index of a project's Python files.
+
+    The project tree is walked once and every file is read once. Each
+    registered detector's import and instantiation patterns are evaluated
+    during that pass, so detectors only consult the precomputed hits.
+
+    A lazily built index walks the tree but leaves the files unread, so
+    detection can read them one at a time with ``scan_next`` and stop once
+    its outcome is decided. The remaining files are read on first access
+    to ``files``, matching only the patterns of ``detectors`` at that time.
+    """
+
+    def __init__(
+        self,
+        project_path: Path,
+        files: List[ScannedFile],
+        walker: Optional[ProjectWalker] = None,
+        detectors: Sequence[Type["BaseFrameworkDetector"]] = (),
+        pending: Iterable[Path] = (),
+    ):
+        self.project_path = project_path
+        self.walker = walker
+        self.detectors = detectors
+        self._files = files
+        self._pending: Deque[Path] = deque(pending)
+        # Every walked file, read or not
+        self.paths: List[Path] = [f.path for f in files] + list(self._pending)
+        self._by_path: Dict[str, ScannedFile] = {str(f.path): f for f in files}
+        self._root_files: Dict[str, Optional[str]] = {}
+
+    @classmethod
+    def build(
+        cls,
+        project_path: Path,
+        detectors: Sequence[Type["BaseFrameworkDetector"]],
+        walker: Optional[ProjectWalker] = None,
+        lazy: bool = False,
+    ) -> "ProjectIndex":
+        """
+        Walk the project once and record pattern hits for every detector.
+
+        Args:
+            project_path: Path to the project directory
+            detectors: Detector classes whose patterns should be evaluated
+            walker: Walker deciding which files to scan
+            lazy: Only walk the tree, leaving files to be read on demand
+
+        Returns:
+            The populated project index
+        """
+        if walker is None:
+            walker = ProjectWalker(project_path)
+
+        index = cls(project_path, [], walker, detectors, pending=walker.walk())
+        if not lazy:
+            index.finish()
+        return index
+
+    @property
+    def files(self) -> List[ScannedFile]:
+        """Every readable file of the project, scanned on first access."""
+        if self._pending:
+            self.finish()
+        return self._files
+
+    @property
+    def remaining(self) -> int:
+        """Number of walked files not read yet."""
+        return len(self._pending)
+
+    def scan_next(self) -> Optional[ScannedFile]:
+        """
+        Read and match the next unread file.
+
+        Returns:
+            The scanned file, or None if it could not be read
+        """
+        file_path = self._pending.popleft()
+        scanned = scan_path(file_path, self.matcher)
+        if scanned is not None:
+            self._add(scanned)
+        return scanned
+
+    def finish(self) -> None:
+        """Read and match every file not read yet."""
+        matcher = self.matcher
+        while self._pending:
+            scanned = scan_path(self._pending.popleft(), matcher)
+            if scanned is not None:
+                self._add(scanned)
+
+    @property
+    def matcher(self) -> PatternMatcher:
+        """Matcher for the current ``detectors``."""
+        return pattern_matcher(tuple(self.detectors))
+
+    def _add(self, scanned: ScannedFile) -> None:
+        self._files.append(scanned)
+        self._by_path[str(scanned.path)] = scanned
+
+    def update(self, file_path: Path) -> Optional[ScannedFile]:
+        """
+        Rescan a single file after it changed on disk.
+
+        Returns:
+            The refreshed entry, or None if the file is gone or unreadable
+        """
+        self.remove(file_path)
+        scanned = scan_path(file_path, self.matcher)
+        if scanned is None:
+            return None
+
+        self._add(scanned)
+        self.paths.append(file_path)
+        return scanned
+
+    def remove(self, file_path: Path) -> None:
+        """Drop a file from the index."""
+        scanned = self._by_path.pop(str(file_path), None)
+        if scanned is not None:
+            self.files.remove(scanned)
+        if file_path in self.paths:
+            self.paths.remove(file_path)
+
+    def get(self, file_path: Path) -> Optional[ScannedFile]:
+        """Return the scanned file for a path, if it was indexed."""
+        if self._pending:
+            self.finish()
+        return self._by_path.get(str(file_path))
+
+    def get_content(self, file_path: Path) -> Optional[str]:
+        """Return indexed content for a path, if it was indexed."""
+        scanned = self.get(file_path)
+        return scanned.content if scanned else None
+
+    def files_named(self, name: str) -> List[Path]:
+        """Return walked files whose basename equals ``name``."""
+        return [path for path in self.paths if path.name == name]
+
+    def read_root_file(self, name: str) -> Optional[str]:
+        """Read a file at the project root once, caching the result."""
+        if name not in self._root_files:
+            root_file = self.project_path / name
+            self._root_files[name] = (
+                _read_file_safe(root_file) if root_file.exists() else None
+            )
+        return self._root_files[name]
+
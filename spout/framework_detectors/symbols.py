@@ -0,0 +1,281 @@
+"""Project-wide index of module-level symbols."""
+
+import ast
+from pathlib import Path
+from typing import Any, Dict, FrozenSet, List, NamedTuple, Optional, Set, Tuple
+
+from ..shared import timing
+from ..shared.cache import ParseCache
+from .scanner import ProjectIndex
+
+# Cache namespace of per-file symbol entries
+SYMBOLS_NAMESPACE = "symbols"
+
+
+class ModuleSymbols(NamedTuple):
+    """Top-level names defined and imported by one module."""
+
+    module: str
+    path: str
+    classes: FrozenSet[str] = frozenset()
+    # Assigned name -> dotted local name it re-binds, or "" for other values
+    assignments: Dict[str, str] = {}
+    # Imported name -> absolute dotted target, e.g. {"User": "app.schemas.User"}
+    aliases: Dict[str, str] = {}
+    # Modules imported with ``from x import *``
+    star_imports: Tuple[str, ...] = ()
+
+    def to_json(self) -> List[Any]:
+        """Serialize to a compact JSON-compatible list."""
+        return [
+            self.module,
+            self.path,
+            sorted(self.classes),
+            self.assignments,
+            self.aliases,
+            list(self.star_imports),
+        ]
+
+    @classmethod
+    def from_json(cls, data: List[Any]) -> "ModuleSymbols":
+        """Rebuild from the output of ``to_json``."""
+        module, path, classes, assignments, aliases, star_imports = data
+        return cls(
+            module,
+            path,
+            frozenset(classes),
+            assignments,
+            aliases,
+            tuple(star_imports),
+        )
+
+
+def module_name(project_path: Path, file_path: Path) -> str:
+    """Return the dotted module name of a file within the project."""
+    try:
+        parts = list(file_path.relative_to(project_path).with_suffix("").parts)
+    except ValueError:
+        parts = [file_path.stem]
+    if parts and parts[-1] == "__init__":
+        parts.pop()
+    return ".".join(parts)
+
+
+def _absolute_module(module: str, is_package: bool, node: ast.ImportFrom) -> str:
+    """Resolve the module of a possibly relative ``from`` import."""
+    if not node.level:
+        return node.module or ""
+    package = module.split(".") if is_package else module.split(".")[:-1]
+    if node.level > 1:
+        package = package[: len(package) - (node.level - 1)]
+    if node.module:
+        package.append(node.module)
+    return ".".join(p for p in package if p)
+
+
+def extract_symbols(module: str, file_path: Path, content: str) -> ModuleSymbols:
+    """
+    Extract the top-level symbols of a module from its source.
+
+    Args:
+        module: Dotted module name
+        file_path: Path of the source file
+        content: Source code
+
+    Returns:
+        The module's symbols; empty if the source does not parse
+    """
+    try:
+        tree = ast.parse(content, filename=str(file_path))
+    except SyntaxError:
+        return ModuleSymbols(module, str(file_path))
+
+    is_package = file_path.name == "__init__.py"
+    classes = set()
+    assignments: Dict[str, str] = {}
+    aliases: Dict[str, str] = {}
+    star_imports = []
+
+    for node in tree.body:
+        if isinstance(node, ast.ClassDef):
+            classes.add(node.name)
+        elif isinstance(node, ast.Import):
+            for alias in node.names:
+                if alias.asname:
+                    aliases[alias.asname] = alias.name
+                else:
+                    top = alias.name.split(".")[0]
+                    aliases[top] = top
+        elif isinstance(node, ast.ImportFrom):
+            source = _absolute_module(module, is_package, node)
+            for alias in node.names:
+                if alias.name == "*":
+                    star_imports.append(source)
+                else:
+                    target = f"{source}.{alias.name}" if source else alias.name
+                    aliases[alias.asname or alias.name] = target
+        elif isinstance(node, (ast.Assign, ast.AnnAssign)):
+            targets = node.targets if isinstance(node, ast.Assign) else [node.target]
+            # Simple re-bindings such as ``UserOut = schemas.User`` are kept
+            value = ""
+            if isinstance(node.value, (ast.Name, ast.Attribute)):
+                value = ast.unparse(node.value)
+            for target in targets:
+                if isinstance(target, ast.Name):
+                    assignments[target.id] = value
+
+    return ModuleSymbols(
+        module=module,
+        path=str(file_path),
+        classes=frozenset(classes),
+        assignments=assignments,
+        aliases=aliases,
+        star_imports=tuple(star_imports),
+    )
+
+
+class SymbolIndex:
+    """
+    Index of every module's top-level classes, assignments and imports.
+
+    Built once per run from the shared ``ProjectIndex``. With a cache,
+    per-file entries are keyed by content hash, so a rebuild only parses
+    files that changed. ``update`` and ``remove`` patch single modules in
+    place for watch mode. All lookups are dictionary accesses.
+    """
+
+    def __init__(self, project_path: Path, modules: List[ModuleSymbols]):
+        self.project_path = project_path
+        self._modules: Dict[str, ModuleSymbols] = {}
+        self._by_path: Dict[str, str] = {}
+        self._class_modules: Dict[str, List[str]] = {}
+        for symbols in modules:
+            self._add(symbols)
+
+    @classmethod
+    def build(
+        cls, index: ProjectIndex, cache: Optional[ParseCache] = None
+    ) -> "SymbolIndex":
+        """
+        Build the symbol index for every file in a project index.
+
+        Args:
+            index: Shared project index providing file contents
+            cache: Optional on-disk cache of per-file symbols
+
+        Returns:
+            The populated symbol index
+        """
+        with timing.phase("symbols") as stats:
+            modules = []
+            for scanned in index.files:
+                module = module_name(index.project_path, scanned.path)
+                key = None
+                if cache is not None:
+                    key = cache.key(SYMBOLS_NAMESPACE, scanned.path, scanned.content)
+                    cached = cache.get(key)
+                    if cached is not None:
+                        modules.append(ModuleSymbols.from_json(cached))
+                        continue
+                symbols = extract_symbols(module, scanned.path, scanned.content)
+                if cache is not None and key is not None:
+                    cache.set(key, symbols.to_json())
+                modules.append(symbols)
+            if cache is not None:
+                cache.prune()
+            stats.add(modules=len(modules))
+        return cls(index.project_path, modules)
+
+    def get(self, module: str) -> Optional[ModuleSymbols]:
+        """Return the symbols of a module, if it is part of the project."""
+        return self._modules.get(module)
+
+    def module_for_path(self, file_path: Path) -> Optional[str]:
+        """Return the module name of an indexed file."""
+        return self._by_path.get(str(file_path))
+
+    def modules_defining(self, name: str) -> List[str]:
+        """Return the modules defining a top-level class called ``name``."""
+        return self._class_modules.get(name, [])
+
+    def resolve_class(self, module: str, name: str) -> Optional[Tuple[str, str]]:
+        """
+        Follow imports and aliases from ``module`` to a class definition.
+
+        Args:
+            module: Module in which ``name`` is used
+            name: Local name, optionally dotted (``schemas.User``)
+
+        Returns:
+            ``(defining_module, class_name)``, or None if the name does not
+            lead to a class defined in the project
+        """
+        return self._resolve_class(module, name, set())
+
+    def _resolve_class(
+        self, module: str, name: str, seen: Set[Tuple[str, str]]
+    ) -> Optional[Tuple[str, str]]:
+        # ``seen`` is shared with star imports, which may import each other
+        while (module, name) not in seen:
+            seen.add((module, name))
+            head, _, rest = name.partition(".")
+            symbols = self._modules.get(module)
+            if symbols is None:
+                return None
+
+            if not rest and head in symbols.classes:
+                return module, head
+
+            local = symbols.assignments.get(head)
+            if local:
+                name = f"{local}.{rest}" if rest else local
+                continue
+
+            target = symbols.aliases.get(head)
+            if target is None:
+                if rest:
+                    return None
+                for star in symbols.star_imports:
+                    found = self._resolve_class(star, head, seen)
+                    if found is not None:
+                        return found
+                return None
+
+            dotted = f"{target}.{rest}" if rest else target
+            module, name = self._split_target(dotted)
+            if module is None:
+                return None
+        return None
+
+    def update(self, module: str, file_path: Path, content: str) -> ModuleSymbols:
+        """Re-extract the symbols of a changed file."""
+        self.remove(file_path)
+        symbols = extract_symbols(module, file_path, content)
+        self._add(symbols)
+        return symbols
+
+    def remove(self, file_path: Path) -> None:
+        """Drop the symbols of a deleted file."""
+        module = self._by_path.pop(str(file_path), None)
+        symbols = self._modules.pop(module, None) if module is not None else None
+        if symbols is None:
+            return
+        for class_name in symbols.classes:
+            modules = self._class_modules.get(class_name, [])
+            if module in modules:
+                modules.remove(module)
+
+    def _add(self, symbols: ModuleSymbols) -> None:
+        self._modules[symbols.module] = symbols
+        self._by_path[symbols.path] = symbols.module
+        for class_name in sorted(symbols.classes):
+            self._class_modules.setdefault(class_name, []).append(symbols.module)
+
+    def _split_target(self, dotted: str) -> Tuple[Optional[str], str]:
+        """Split a dotted target into the longest known module and the rest."""
+        parts = dotted.split(".")
+        for i in range(len(parts) - 1, 0, -1):
+            module = ".".join(parts[:i])
+            if module in self._modules:
+                return module, ".".join(parts[i:])
+        return None, dotted
@@ -0,0 +1,243 @@
+"""Resolution of model classes referenced by endpoint types."""
+
+import ast
+import warnings
+from collections import deque
+from pathlib import Path
+from typing import Deque, Dict, Iterable, List, Optional, Set, Tuple
+
+from ..models.ir import AnyEndpoint, ModelFieldIR, ModelIR
+from ..shared import timing
+from ..shared.typescript import referenced_type_names
+from .annotations import annotation_to_typescript
+from .scanner import ProjectIndex
+from .symbols import SymbolIndex
+
+# Base classes that carry no fields of their own
+FRAMEWORK_BASES = frozenset(
+    ["BaseModel", "Schema", "ModelSchema", "Generic", "object", "TypedDict"]
+)
+
+ENUM_BASES = frozenset(
+    ["Enum", "IntEnum", "StrEnum", "Flag", "TextChoices", "IntegerChoices"]
+)
+
+
+def _base_name(node: ast.AST) -> Optional[str]:
+    if isinstance(node, ast.Name):
+        return node.id
+    if isinstance(node, ast.Attribute):
+        return node.attr
+    if isinstance(node, ast.Subscript):
+        return _base_name(node.value)
+    return None
+
+
+def _is_required(value: Optional[ast.AST]) -> bool:
+    """Whether a class-level field assignment leaves the field required."""
+    if value is None:
+        return True
+    if isinstance(value, ast.Call) and _base_name(value.func) == "Field":
+        if value.args:
+            first = value.args[0]
+            return isinstance(first, ast.Constant) and first.value is Ellipsis
+        return not any(
+            kw.arg in ("default", "default_factory") for kw in value.keywords
+        )
+    return False
+
+
+def endpoint_type_names(endpoints: Iterable[AnyEndpoint]) -> Set[str]:
+    """Collect the model names referenced directly by endpoint signatures."""
+    names: Set[str] = set()
+    for endpoint in endpoints:
+        for param in endpoint.parameters:
+            names |= referenced_type_names(param.type)
+        for response in endpoint.responses:
+            names |= referenced_type_names(response.type)
+    return names
+
+
+class TypeResolver:
+    """
+    Resolve model classes referenced by endpoint types.
+
+    Names are looked up through the project ``SymbolIndex`` from the module
+    that uses them, following imports and aliases to the defining module;
+    only files that define a requested class are parsed, each at most once.
+    Every name is resolved once per module using it, so same-named classes
+    of different modules stay apart, and the dependency graph is walked
+    from the endpoint types so only reachable models are returned. Cycles
+    are harmless because models refer to each other by name.
+    """
+
+    def __init__(self, index: ProjectIndex, symbols: Optional[SymbolIndex] = None):
+        self.index = index
+        self.symbols = symbols if symbols is not None else SymbolIndex.build(index)
+        self._classes: Dict[str, Dict[str, ast.ClassDef]] = {}
+        # Keyed by the module a name is used in, as names are module-local
+        self._resolved: Dict[Tuple[Optional[str], str], Optional[ModelIR]] = {}
+        # Keyed by defining module, class name and the name it is used as
+        self._built: Dict[Tuple[str, str, str], Optional[ModelIR]] = {}
+
+    def resolve(self, name: str, module: Optional[str] = None) -> Optional[ModelIR]:
+        """
+        Return the model for a type name, or None if it isn't found.
+
+        Args:
+            name: Type name as referenced, e.g. ``User``
+            module: Module the name is used in; when omitted, or when the
+                name can't be traced from it, any project class of that
+                name is used
+        """
+        key = (module, name)
+        if key in self._resolved:
+            return self._resolved[key]
+
+        self._resolved[key] = None  # Guards against inheritance cycles
+        model = None
+        location = self._locate(name, module)
+        if location is not None:
+            defining_module, class_name = location
+            built = (defining_module, class_name, name)
+            if built in self._built:
+                model = self._built[built]
+            else:
+                self._built[built] = None
+                node = self._class_nodes(defining_module).get(class_name)
+                if node is not None:
+                    model = self._build_model(name, node, defining_module)
+                self._built[built] = model
+        self._resolved[key] = model
+        return model
+
+    def resolve_endpoints(
+        self, endpoints: Iterable[AnyEndpoint]
+    ) -> Dict[str, ModelIR]:
+        """
+        Resolve every model reachable from the given endpoints.
+
+        Models are emitted under their bare names. When one name leads to
+        classes in different files, the first one reached in endpoint order
+        is kept and a warning names both files.
+
+        Returns:
+            Resolved models keyed by name, in sorted order
+        """
+        with timing.phase("types") as stats:
+            pending: Deque[Tuple[str, Optional[str]]] = deque()
+            for endpoint in endpoints:
+                file_path = endpoint.framework_data.get("file_path", "")
+                module = self.symbols.module_for_path(Path(file_path))
+                pending.extend(
+                    (name, module) for name in endpoint_type_names([endpoint])
+                )
+
+            resolved: Dict[str, ModelIR] = {}
+            conflicts: Set[Tuple[str, str]] = set()
+            while pending:
+                name, module = pending.popleft()
+                model = self.resolve(name, module)
+                if model is None:
+                    continue
+                kept = resolved.get(name)
+                if kept is not None:
+                    if kept.file_path != model.file_path:
+                        self._warn_conflict(name, kept, model, conflicts)
+                    continue
+                resolved[name] = model
+                model_module = self.symbols.module_for_path(Path(model.file_path))
+                pending.extend((ref, model_module) for ref in model.references)
+            stats.add(models=len(resolved), files=len(self._classes))
+        return {name: resolved[name] for name in sorted(resolved)}
+
+    @staticmethod
+    def _warn_conflict(
+        name: str, kept: ModelIR, dropped: ModelIR, seen: Set[Tuple[str, str]]
+    ) -> None:
+        if (name, dropped.file_path) in seen:
+            return
+        seen.add((name, dropped.file_path))
+        warnings.warn(
+            f"Model name {name!r} refers to classes in {kept.file_path} and "
+            f"{dropped.file_path}; only the first is emitted. Rename one of "
+            "them to type both correctly."
+        )
+
+    def _locate(
+        self, name: str, module: Optional[str]
+    ) -> Optional[Tuple[str, str]]:
+        if module is not None:
+            found = self.symbols.resolve_class(module, name)
+            if found is not None:
+                return found
+        modules = self.symbols.modules_defining(name)
+        return (modules[0], name) if modules else None
+
+    def _class_nodes(self, module: str) -> Dict[str, ast.ClassDef]:
+        classes = self._classes.get(module)
+        if classes is None:
+            classes = {}
+            symbols = self.symbols.get(module)
+            file_path = Path(symbols.path) if symbols else None
+            content = self.index.get_content(file_path) if file_path else None
+            try:
+                tree = ast.parse(content or "", filename=str(file_path))
+            except SyntaxError:
+                tree = None
+            if tree is not None:
+                for node in tree.body:
+                    if isinstance(node, ast.ClassDef):
+                        classes[node.name] = node
+            self._classes[module] = classes
+        return classes
+
+    def _build_model(self, name: str, node: ast.ClassDef, module: str) -> ModelIR:
+        file_path = self.symbols.get(module).path
+        base_names = [base for base in map(_base_name, node.bases) if base]
+
+        if any(base in ENUM_BASES for base in base_names):
+            values = []
+            for stmt in node.body:
+                if not isinstance(stmt, ast.Assign):
+                    continue
+                if isinstance(stmt.value, ast.Constant):
+                    value = stmt.value.value
+                    literal = f"'{value}'" if isinstance(value, str) else repr(value)
+                    values.append(literal)
+            return ModelIR(
+                name=name,
+                kind="enum",
+                values=tuple(values),
+                file_path=file_path,
+            )
+
+        fields = []
+        for stmt in node.body:
+            if not isinstance(stmt, ast.AnnAssign):
+                continue
+            if not isinstance(stmt.target, ast.Name):
+                continue
+            if stmt.target.id.startswith("_"):
+                continue
+            if _base_name(stmt.annotation) == "ClassVar":
+                continue
+            fields.append(
+                ModelFieldIR(
+                    name=stmt.target.id,
+                    type=annotation_to_typescript(stmt.annotation),
+                    required=_is_required(stmt.value),
+                )
+            )
+
+        bases = tuple(
+            base
+            for base in base_names
+            if base not in FRAMEWORK_BASES and self.resolve(base, module) is not None
+        )
+        return ModelIR(
+            name=name,
+            fields=tuple(fields),
+            bases=bases,
+            file_path=file_path,
+        )
@@ -1,18 +1,91 @@
-"""TypeScript client generators package."""
+"""
+TypeScript client generators package.
 
-from .axios import AxiosClientGenerator
-from .base import BaseClientGenerator
-from .fetch import FetchClientGenerator
+Generator modules are imported on first use: looking up a client type in
+``GENERATORS`` imports only that generator, and the classes below are
+resolved through the module ``__getattr__``.
+"""
 
-# Registry of available generators
-GENERATORS = {
-    "fetch": FetchClientGenerator,
-    "axios": AxiosClientGenerator,
+import importlib
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, List
+
+from ..shared.plugins import GENERATOR_GROUP
+from ..shared.registry import LazyRegistry
+
+if TYPE_CHECKING:
+    from .axios import AxiosClientGenerator
+    from .base import BaseClientGenerator
+    from .fetch import FetchClientGenerator
+    from .templated import TemplateClientGenerator, template_generator
+
+TEMPLATES_DIR = Path(__file__).parent / "templates"
+
+# Name of the template defining a client type's macros
+CLIENT_TEMPLATE = "client.ts.j2"
+
+
+def template_client_types() -> List[str]:
+    """Return the client types that have a template directory."""
+    return sorted(
+        path.parent.name for path in TEMPLATES_DIR.glob(f"*/{CLIENT_TEMPLATE}")
+    )
+
+
+class _TemplateLoader:
+    """Registry target building the generator of one template directory."""
+
+    def __init__(self, client_type: str):
+        self.client_type = client_type
+
+    def __call__(self) -> Any:
+        from .templated import template_generator
+
+        return template_generator(self.client_type)
+
+
+# Registry of available generators, extended by "spout.generators" plugins
+GENERATORS = LazyRegistry(
+    {
+        "fetch": ".fetch:FetchClientGenerator",
+        "axios": ".axios:AxiosClientGenerator",
+    },
+    package=__name__,
+    group=GENERATOR_GROUP,
+)
+
+# Client types defined only by a template directory
+for _client_type in template_client_types():
+    GENERATORS.register(_client_type, _TemplateLoader(_client_type), replace=False)
+
+# How generator code is produced: hand-written f-strings or Jinja2 templates
+ENGINES = ("fstring", "template")
+
+_LAZY_ATTRIBUTES = {
+    "BaseClientGenerator": ".base",
+    "FetchClientGenerator": ".fetch",
+    "AxiosClientGenerator": ".axios",
+    "TemplateClientGenerator": ".templated",
+    "template_generator": ".templated",
 }
 
+
+def __getattr__(name: str) -> Any:
+    module = _LAZY_ATTRIBUTES.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module, __name__), name)
+    globals()[name] = value
+    return value
+
+
 __all__ = [
     "BaseClientGenerator",
     "FetchClientGenerator",
     "AxiosClientGenerator",
+    "TemplateClientGenerator",
+    "template_client_types",
+    "template_generator",
     "GENERATORS",
+    "ENGINES",
 ]
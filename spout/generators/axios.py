@@ -2,153 +2,165 @@
 
 from typing import List
 
-from ..models.endpoint import Endpoint, ParameterType
+from ..models.ir import AnyEndpoint
 from .base import BaseClientGenerator
+from .runtime import (
+    DEFAULT_CACHE_ENTRIES,
+    format_policy,
+    request_policy,
+    ts_literal,
+)
+
+# Milliseconds a request may take when the configuration sets no timeout
+DEFAULT_TIMEOUT = 10000
 
 
 class AxiosClientGenerator(BaseClientGenerator):
     """Generator for axios-based TypeScript clients."""
 
-    def generate(self, endpoints: List[Endpoint]) -> str:
-        """Generate axios-based TypeScript client."""
-        parts = [
-            "// Generated TypeScript client using axios",
-            "// This file was automatically generated by Spout",
-            "",
+    header_comment = "// Generated TypeScript client using axios"
+
+    runtime_features = frozenset({"cache"})
+    styles = frozenset({"class", "functions"})
+
+    def _generate_imports(self) -> List[str]:
+        """Import axios and the types used by the client."""
+        return [
             "import axios, { AxiosInstance, AxiosRequestConfig } from 'axios';",
             "",
         ]
 
-        # Add types if requested
-        types_section = self._generate_types(endpoints)
-        if types_section:
-            parts.append(types_section)
-
-        # Add configuration interface
-        parts.extend(
-            [
-                "export interface ApiConfig {",
-                f"  baseURL?: string;",
-                "  headers?: Record<string, string>;",
-                "  timeout?: number;",
-                "}",
-                "",
-                "export class ApiClient {",
-                "  private client: AxiosInstance;",
-                "",
-                "  constructor(config: ApiConfig = {}) {",
-                "    this.client = axios.create({",
-                f"      baseURL: '{self.base_url}',",
-                "      timeout: 10000,",
-                "      headers: {",
-                "        'Content-Type': 'application/json',",
-                "      },",
-                "      ...config,",
-                "    });",
-                "  }",
-                "",
-            ]
-        )
-
-        # Generate methods for each endpoint
-        for endpoint in endpoints:
-            method_code = self._generate_endpoint_method(endpoint)
-            parts.append(method_code)
-            parts.append("")
-
-        parts.append("}")
-
-        return "\n".join(parts)
-
-    def _generate_endpoint_method(self, endpoint: Endpoint) -> str:
-        """Generate a method for a single endpoint."""
-        method_name = self._sanitize_method_name(endpoint.typescript_method_name)
-
-        # Separate parameters by type
-        path_params = [
-            p for p in endpoint.parameters if p.parameter_type == ParameterType.PATH
+    def _generate_module_imports(self) -> List[str]:
+        """Import the axios types referenced by endpoint methods."""
+        return ["import type { AxiosRequestConfig } from 'axios';"]
+
+    def _generate_config_interface(self) -> List[str]:
+        """Generate the ApiConfig interface."""
+        return [
+            "export interface ApiConfig {",
+            f"  baseURL?: string;",
+            "  headers?: Record<string, string>;",
+            "  timeout?: number;",
+            "}",
+            "",
         ]
-        query_params = [
-            p for p in endpoint.parameters if p.parameter_type == ParameterType.QUERY
+
+    def _generate_client_members(self, visibility: str = "private") -> List[str]:
+        """Generate the client's axios instance and constructor."""
+        if self.runtime.cached:
+            return self._generate_cached_members(visibility)
+        return [
+            f"  {visibility} client: AxiosInstance;",
+            "",
+            "  constructor(config: ApiConfig = {}) {",
+            "    this.client = axios.create({",
+            f"      baseURL: '{self.base_url}',",
+            f"      timeout: {self.runtime.timeout or DEFAULT_TIMEOUT},",
+            "      headers: {",
+            "        'Content-Type': 'application/json',",
+            "      },",
+            "      ...config,",
+            "    });",
+            "  }",
+            "",
         ]
-        body_params = [
-            p for p in endpoint.parameters if p.parameter_type == ParameterType.BODY
+
+    def _generate_cached_members(self, visibility: str) -> List[str]:
+        """Generate the members of a client keeping a response cache."""
+        max_entries = self.runtime.cache_max_entries or DEFAULT_CACHE_ENTRIES
+        return [
+            f"  {visibility} client: AxiosInstance;",
+            f"  {visibility} cache: ResponseCache;",
+            "",
+            "  constructor(config: ApiConfig = {}) {",
+            "    this.client = axios.create({",
+            f"      baseURL: '{self.base_url}',",
+            f"      timeout: {self.runtime.timeout or DEFAULT_TIMEOUT},",
+            "      headers: {",
+            "        'Content-Type': 'application/json',",
+            "      },",
+            "      ...config,",
+            "    });",
+            f"    this.cache = new ResponseCache({max_entries});",
+            "  }",
+            "",
+            f"  {visibility} async cached<T>(",
+            "    requestConfig: AxiosRequestConfig,",
+            "    policy: RequestPolicy",
+            "  ): Promise<T> {",
+            "    const key = this.client.getUri(requestConfig);",
+            "    const body = await this.cache.resolve("
+            "key, policy, async (headers) => {",
+            "      const response = await this.client.request({",
+            "        ...requestConfig,",
+            "        headers: { ...requestConfig.headers, ...headers },",
+            "        validateStatus: (status) =>",
+            "          (status >= 200 && status < 300) || status === 304,",
+            "      });",
+            "      const etag = response.headers['etag'] as string | undefined;",
+            "      return { status: response.status, etag, body: response.data };",
+            "    });",
+            "    return body as T;",
+            "  }",
+            "",
+            f"  {visibility} invalidate(prefix: string): void {{",
+            "    this.cache.invalidate(this.client.getUri({ url: prefix }));",
+            "  }",
+            "",
         ]
 
-        # Build parameter list
-        params = []
-        for param in path_params + query_params:
-            optional = "?" if not param.required else ""
-            params.append(f"{param.name}{optional}: {param.type}")
-
-        if body_params:
-            # For body parameters, create a single data object
-            if len(body_params) == 1:
-                param = body_params[0]
-                optional = "?" if not param.required else ""
-                params.append(f"data{optional}: {param.type}")
-            else:
-                # Multiple body parameters - create an object type
-                body_props = []
-                for param in body_params:
-                    optional = "?" if not param.required else ""
-                    body_props.append(f"{param.name}{optional}: {param.type}")
-                params.append(f"data: {{ {'; '.join(body_props)} }}")
+    def _generate_endpoint_method(self, endpoint: AnyEndpoint) -> str:
+        """Generate a method for a single endpoint."""
+        spec = self._method_spec(endpoint)
 
         # Add optional config parameter
-        params.append("config?: AxiosRequestConfig")
-        param_str = ", ".join(params)
+        params = spec.params + ("config?: AxiosRequestConfig",)
+        return_type = spec.return_type
+        client = self._receiver
 
-        # Determine return type
-        if endpoint.responses:
-            return_type = endpoint.responses[0].type
-        else:
-            return_type = "any"
-
-        # Build method signature
-        lines = []
-        if endpoint.description:
-            lines.append(f"  /**")
-            lines.append(f"   * {endpoint.description}")
-            lines.append(f"   */")
-
-        lines.append(f"  async {method_name}({param_str}): Promise<{return_type}> {{")
-
-        # Build path with parameter substitution
-        path = endpoint.path
-        for param in path_params:
-            path = path.replace(f"{{{param.name}}}", f"${{{param.name}}}")
-
-        lines.append(f"    const url = `{path}`;")
+        lines = [f"const url = `{spec.path}`;"]
 
         # Build axios config
-        lines.append("    const requestConfig: AxiosRequestConfig = {")
-        lines.append(f"      method: '{endpoint.method.lower()}',")
-        lines.append("      url,")
+        lines.append("const requestConfig: AxiosRequestConfig = {")
+        lines.append(f"  method: '{spec.http_method.lower()}',")
+        lines.append("  url,")
 
         # Add query parameters
-        if query_params:
-            lines.append("      params: {")
-            for param in query_params:
+        if spec.query_params:
+            lines.append("  params: {")
+            for param in spec.query_params:
                 if param.required:
-                    lines.append(f"        {param.name},")
+                    lines.append(f"    {param.name},")
                 else:
                     lines.append(
-                        f"        ...(({param.name} !== undefined) && {{ {param.name} }}),"
+                        f"    ...(({param.name} !== undefined) && {{ {param.name} }}),"
                     )
-            lines.append("      },")
+            lines.append("  },")
 
         # Add body data
-        if body_params:
-            lines.append("      data,")
+        if spec.has_body:
+            lines.append("  data,")
 
-        lines.append("      ...config,")
-        lines.append("    };")
+        lines.append("  ...config,")
+        lines.append("};")
         lines.append("")
-        lines.append(
-            f"    const response = await this.client.request<{return_type}>(requestConfig);"
-        )
-        lines.append("    return response.data;")
-        lines.append("  }")
 
-        return "\n".join(lines)
+        policy = {}
+        if self.runtime.cached:
+            policy = request_policy(endpoint, spec.http_method, self.runtime)
+        if "cacheTtl" in policy:
+            cache_policy = format_policy({"cacheTtl": policy["cacheTtl"]})
+            lines.append(
+                f"return {client}.cached<{return_type}>(requestConfig, {cache_policy});"
+            )
+        else:
+            lines.append(
+                f"const response = await {client}.client.request<{return_type}>"
+                "(requestConfig);"
+            )
+            if "invalidate" in policy:
+                prefix = ts_literal(policy["invalidate"])
+                lines.append(f"{client}.invalidate({prefix});")
+            lines.append("return response.data;")
+
+        return self._wrap_endpoint(spec, params, lines)
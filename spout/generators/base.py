@@ -1,27 +1,103 @@
 """Base TypeScript client generator."""
 
 from abc import ABC, abstractmethod
-from typing import List
+from pathlib import Path
+from typing import (
+    Dict,
+    FrozenSet,
+    Iterable,
+    Iterator,
+    List,
+    NamedTuple,
+    Optional,
+    Sequence,
+    Set,
+    TextIO,
+    Tuple,
+)
 
-from ..models.endpoint import Endpoint
+from ..models.endpoint import ParameterType
+from ..models.ir import AnyEndpoint, ModelIR
+from ..shared import timing
+from ..shared.typescript import referenced_type_names
+from .interning import TypeTable
+from .runtime import RuntimeOptions, runtime_lines
+from .split import group_endpoints, module_class_name
+
+
+class MethodSpec(NamedTuple):
+    """Client-independent description of one endpoint method."""
+
+    name: str
+    description: Optional[str]
+    http_method: str
+    # Path as a template literal body, e.g. ``/users/${user_id}``
+    path: str
+    # Signature entries such as ``user_id: number`` or ``data: UserCreate``
+    params: Tuple[str, ...]
+    query_params: Tuple
+    has_body: bool
+    return_type: str
 
 
 class BaseClientGenerator(ABC):
     """Abstract base class for TypeScript client generators."""
 
-    def __init__(self, base_url: str = "", include_types: bool = True):
+    # First line of every generated single-file client
+    header_comment = "// Generated TypeScript client"
+
+    # RuntimeOptions features this client type can emit
+    runtime_features: FrozenSet[str] = frozenset()
+
+    # Output styles (see ``STYLES``) this client type can emit
+    styles: FrozenSet[str] = frozenset({"class"})
+
+    def __init__(
+        self,
+        base_url: str = "",
+        include_types: bool = True,
+        models: Optional[Dict[str, ModelIR]] = None,
+        runtime: Optional[RuntimeOptions] = None,
+        style: str = "class",
+    ):
         """
         Initialize the generator.
 
         Args:
             base_url: Base URL for API calls
             include_types: Whether to include TypeScript type definitions
+            models: Resolved model definitions keyed by name; referenced
+                types without one are emitted as open interfaces
+            runtime: Request scheduling and caching features of the emitted
+                client
+            style: ``class`` for an ``ApiClient`` class with one method per
+                endpoint, or ``functions`` for one exported function per
+                endpoint taking a shared ``ApiContext``
+
+        Raises:
+            ValueError: If the client type cannot emit a runtime feature
+                or the style
         """
         self.base_url = base_url
         self.include_types = include_types
+        self.models: Dict[str, ModelIR] = models or {}
+        self.runtime = runtime or RuntimeOptions()
+        self.style = style
+        self.type_table = TypeTable()
 
-    @abstractmethod
-    def generate(self, endpoints: List[Endpoint]) -> str:
+        if style not in self.styles:
+            raise ValueError(
+                f"{type(self).__name__} does not support the {style!r} style"
+            )
+
+        unsupported = self.runtime.features - self.runtime_features
+        if unsupported:
+            raise ValueError(
+                f"{type(self).__name__} does not support runtime features: "
+                f"{', '.join(sorted(unsupported))}"
+            )
+
+    def generate(self, endpoints: List[AnyEndpoint]) -> str:
         """
         Generate TypeScript client code from endpoints.
 
@@ -31,46 +107,419 @@ class BaseClientGenerator(ABC):
         Returns:
             Generated TypeScript code as string
         """
+        with timing.phase("generate") as stats:
+            code = "".join(self.generate_iter(endpoints))
+            stats.add(endpoints=len(endpoints), bytes=len(code))
+        return code
+
+    def generate_iter(self, endpoints: List[AnyEndpoint]) -> Iterator[str]:
+        """
+        Generate TypeScript client code as a stream of chunks.
+
+        Methods are rendered one at a time as the stream is consumed, so the
+        complete client never has to be held in memory.
+
+        Args:
+            endpoints: List of API endpoints to generate client for
+
+        Yields:
+            Consecutive chunks of the generated TypeScript code
+        """
+        self.intern_types(endpoints)
+        methods = (self._generate_endpoint_method(e) for e in endpoints)
+        return self.assemble_iter(endpoints, methods)
+
+    def generate_to(self, fp: TextIO, endpoints: List[AnyEndpoint]) -> int:
+        """
+        Stream TypeScript client code into a text file object.
+
+        Returns:
+            Number of characters written
+        """
+        written = 0
+        for chunk in self.generate_iter(endpoints):
+            written += fp.write(chunk)
+        return written
+
+    def intern_types(self, endpoints: List[AnyEndpoint]) -> bool:
+        """
+        Rebuild the table of shared type aliases for a set of endpoints.
+
+        Must run before endpoint methods are rendered, since methods refer
+        to the aliases. ``generate_iter`` and ``generate_modules`` call it
+        themselves; callers rendering methods directly should too.
+
+        Returns:
+            True if the aliases differ from the previous table
+        """
+        if not self.include_types:
+            return False
+        reserved = set(self.models) | self._collect_types(endpoints)
+        table = TypeTable.build(endpoints, reserved)
+        changed = table.definitions() != self.type_table.definitions()
+        self.type_table = table
+        return changed
+
+    def assemble(self, endpoints: List[AnyEndpoint], methods: Iterable[str]) -> str:
+        """
+        Assemble a client from already rendered endpoint methods.
+
+        Args:
+            endpoints: All endpoints in the client, used for the header
+            methods: Rendered methods, one per endpoint, in output order
+
+        Returns:
+            Generated TypeScript code as string
+        """
+        return "".join(self.assemble_iter(endpoints, methods))
+
+    def assemble_iter(
+        self, endpoints: List[AnyEndpoint], methods: Iterable[str]
+    ) -> Iterator[str]:
+        """Stream a client assembled from rendered endpoint methods."""
+        yield self._generate_header(endpoints)
+        for method_code in methods:
+            yield f"\n{method_code}\n"
+        if not self.functions:
+            yield f"\n{self._generate_footer()}"
+
+    def generate_modules(
+        self,
+        endpoints: List[AnyEndpoint],
+        split_by: str,
+        root: Optional[Path] = None,
+    ) -> Dict[str, Iterator[str]]:
+        """
+        Generate a multi-file client with one module per endpoint group.
+
+        Besides one ``<group>.ts`` module per group, the output contains a
+        shared ``runtime.ts`` (config and base class), ``types.ts`` and a
+        barrel ``index.ts``. Each value is a lazy chunk stream, so modules
+        can be emitted independently and in parallel.
+
+        Args:
+            endpoints: List of API endpoints to generate client for
+            split_by: How to group endpoints; one of ``SPLIT_MODES``
+            root: Project directory that ``file`` module names are
+                relative to
+
+        Returns:
+            Mapping of file name to a stream of its TypeScript code
+        """
+        self.intern_types(endpoints)
+        groups = group_endpoints(endpoints, split_by, root)
+        modules: Dict[str, Iterator[str]] = {
+            "runtime.ts": self._generate_runtime_module(),
+            "types.ts": self._generate_types_module(endpoints),
+        }
+        for name, group in groups.items():
+            modules[f"{name}.ts"] = self._generate_endpoint_module(name, group)
+        modules["index.ts"] = self._generate_index_module(list(groups))
+        return modules
+
+    def _generate_header(self, endpoints: List[AnyEndpoint]) -> str:
+        """Generate everything that precedes the endpoint methods."""
+        parts = [
+            self.header_comment,
+            "// This file was automatically generated by Spout",
+            "",
+        ]
+        parts.extend(self._generate_imports())
+
+        # Add types if requested
+        types_section = self._generate_types(endpoints)
+        if types_section:
+            parts.append(types_section)
+
+        parts.extend(self._generate_config_interface())
+        parts.extend(self._generate_runtime_support())
+        if self.functions:
+            parts.extend(self._generate_context_class())
+            parts.append("")
+        else:
+            parts.append("export class ApiClient {")
+            parts.extend(self._generate_client_members())
+
+        return "\n".join(parts)
+
+    @abstractmethod
+    def _generate_imports(self) -> List[str]:
+        """Generate the import lines of a single-file client."""
         pass
 
-    def _generate_types(self, endpoints: List[Endpoint]) -> str:
-        """Generate TypeScript type definitions from endpoints."""
+    def _generate_module_imports(self) -> List[str]:
+        """Generate the import lines endpoint methods need in split modules."""
+        return []
+
+    @abstractmethod
+    def _generate_config_interface(self) -> List[str]:
+        """Generate the ApiConfig interface."""
+        pass
+
+    def _generate_runtime_support(self) -> List[str]:
+        """Generate the scheduler and cache used by the enabled features."""
+        return runtime_lines(self.runtime)
+
+    @abstractmethod
+    def _generate_client_members(self, visibility: str = "private") -> List[str]:
+        """Generate the client class members shared by every endpoint method."""
+        pass
+
+    @abstractmethod
+    def _generate_endpoint_method(self, endpoint: AnyEndpoint) -> str:
+        """Generate a method for a single endpoint."""
+        pass
+
+    @property
+    def functions(self) -> bool:
+        """Whether endpoints are emitted as standalone functions."""
+        return self.style == "functions"
+
+    @property
+    def _receiver(self) -> str:
+        """Expression endpoint code reaches the shared client members through."""
+        return "ctx" if self.functions else "this"
+
+    def _wrap_endpoint(
+        self, spec: MethodSpec, params: Sequence[str], body: List[str]
+    ) -> str:
+        """
+        Wrap an endpoint's body in a class method or an exported function.
+
+        Args:
+            spec: The endpoint's method spec
+            params: Signature entries; functions take the context first
+            body: Statements of the body, indented relative to it
+        """
+        indent = "" if self.functions else "  "
+        lines = []
+        if spec.description:
+            lines.append(f"{indent}/**")
+            lines.append(f"{indent} * {spec.description}")
+            lines.append(f"{indent} */")
+
+        if self.functions:
+            signature = f"export async function {spec.name}"
+            params = ("ctx: ApiContext", *params)
+        else:
+            signature = f"  async {spec.name}"
+        param_str = ", ".join(params)
+        lines.append(f"{signature}({param_str}): Promise<{spec.return_type}> {{")
+        lines.extend(f"{indent}  {line}" if line else "" for line in body)
+        lines.append(f"{indent}}}")
+        return "\n".join(lines)
+
+    def _generate_context_class(self) -> List[str]:
+        """
+        Generate the ``ApiContext`` every endpoint function takes.
+
+        It holds the client members a class-style client keeps privately,
+        but no endpoint methods, so bundlers can drop unused functions.
+        """
+        return [
+            "export class ApiContext {",
+            *self._generate_client_members("public"),
+            "}",
+        ]
+
+    def _generate_footer(self) -> str:
+        """Generate everything that follows the endpoint methods."""
+        return "}"
+
+    def _generate_runtime_module(self) -> Iterator[str]:
+        """Generate the shared config and base class of a split client."""
+        parts = [
+            self.header_comment,
+            "// This file was automatically generated by Spout",
+            "",
+        ]
+        parts.extend(self._generate_imports())
+        parts.extend(self._generate_config_interface())
+        parts.extend(self._generate_runtime_support())
+        if self.functions:
+            parts.extend(self._generate_context_class())
+        else:
+            parts.append("export class BaseApi {")
+            parts.extend(self._generate_client_members("protected"))
+            parts.append("}")
+        yield "\n".join(parts) + "\n"
+
+    def _generate_types_module(self, endpoints: List[AnyEndpoint]) -> Iterator[str]:
+        """Generate the type definitions shared by every module."""
+        yield "// This file was automatically generated by Spout\n\n"
+        yield self._generate_types(endpoints) or "export {};\n"
+
+    def _generate_endpoint_module(
+        self, name: str, endpoints: List[AnyEndpoint]
+    ) -> Iterator[str]:
+        """Generate one module holding a group's endpoint methods."""
+        base = "ApiContext" if self.functions else "BaseApi"
+        lines = [
+            "// This file was automatically generated by Spout",
+            "",
+            f"import {{ {base} }} from './runtime';",
+        ]
+        lines.extend(self._generate_module_imports())
+        type_names = sorted(self.type_table.signature_names(endpoints))
+        if type_names:
+            lines.append(f"import type {{ {', '.join(type_names)} }} from './types';")
+        lines.append("")
+        if not self.functions:
+            lines.append(f"export class {module_class_name(name)} extends BaseApi {{")
+        yield "\n".join(lines)
+
+        for endpoint in endpoints:
+            yield f"\n{self._generate_endpoint_method(endpoint)}\n"
+        if not self.functions:
+            yield f"\n{self._generate_footer()}\n"
+
+    def _generate_index_module(self, names: List[str]) -> Iterator[str]:
+        """Generate the barrel module re-exporting every other module."""
+        lines = [
+            "// This file was automatically generated by Spout",
+            "",
+            "export * from './runtime';",
+            "export * from './types';",
+        ]
+        for name in names:
+            if self.functions:
+                lines.append(f"export * from './{name}';")
+            else:
+                lines.append(f"export {{ {module_class_name(name)} }} from './{name}';")
+        yield "\n".join(lines) + "\n"
+
+    def _collect_types(self, endpoints: List[AnyEndpoint]) -> Set[str]:
+        """Collect the non-primitive type names referenced by endpoints."""
         if not self.include_types:
-            return ""
+            return set()
 
         types = set()
 
         for endpoint in endpoints:
             # Generate parameter types
             for param in endpoint.parameters:
-                if param.type not in ["string", "number", "boolean", "any", "object"]:
-                    types.add(param.type)
+                types |= referenced_type_names(param.type)
 
             # Generate response types
             for response in endpoint.responses:
-                if response.type not in [
-                    "string",
-                    "number",
-                    "boolean",
-                    "any",
-                    "object",
-                ]:
-                    types.add(response.type)
-
-        if not types:
+                types |= referenced_type_names(response.type)
+
+        return types
+
+    def _reachable_types(self, names: Iterable[str]) -> Set[str]:
+        """Close a set of type names over the models they depend on."""
+        reachable: Set[str] = set()
+        pending = list(names)
+        while pending:
+            name = pending.pop()
+            if name in reachable:
+                continue
+            reachable.add(name)
+            model = self.models.get(name)
+            if model is not None:
+                pending.extend(model.references)
+        return reachable
+
+    def _generate_types(self, endpoints: List[AnyEndpoint]) -> str:
+        """Generate TypeScript type definitions from endpoints."""
+        types = self._collect_types(endpoints)
+        aliases = self.type_table.definitions()
+        if not types and not aliases:
             return ""
 
         type_definitions = ["// Type definitions"]
-        for type_name in sorted(types):
-            # This is a simplified type definition - in practice, you'd want
-            # more sophisticated type extraction from Python models
-            type_definitions.append(f"export interface {type_name} {{")
-            type_definitions.append("  // TODO: Extract actual type definition")
-            type_definitions.append("}")
+        for type_name in sorted(self._reachable_types(types)):
+            type_definitions.extend(self._generate_model(type_name))
+            type_definitions.append("")
+
+        if aliases:
+            type_definitions.append("// Shared types")
+            type_definitions.extend(aliases)
             type_definitions.append("")
 
         return "\n".join(type_definitions)
 
+    def _generate_model(self, name: str) -> List[str]:
+        """Generate the definition of a single referenced type."""
+        model = self.models.get(name)
+        if model is None:
+            # Not resolvable from the project source
+            return [f"export interface {name} {{", "  [key: string]: any;", "}"]
+
+        if model.kind == "enum":
+            values = " | ".join(model.values) or "never"
+            return [f"export type {name} = {values};"]
+
+        extends = f" extends {', '.join(model.bases)}" if model.bases else ""
+        lines = [f"export interface {name}{extends} {{"]
+        for field in model.fields:
+            optional = "" if field.required else "?"
+            lines.append(f"  {field.name}{optional}: {field.type};")
+        lines.append("}")
+        return lines
+
+    def _method_spec(self, endpoint: AnyEndpoint) -> MethodSpec:
+        """Split an endpoint into the pieces every client method is built from."""
+        method_name = self._sanitize_method_name(endpoint.typescript_method_name)
+
+        # Separate parameters by type
+        path_params = []
+        query_params = []
+        body_params = []
+        for param in endpoint.parameters:
+            if param.parameter_type == ParameterType.PATH:
+                path_params.append(param)
+            elif param.parameter_type == ParameterType.QUERY:
+                query_params.append(param)
+            elif param.parameter_type == ParameterType.BODY:
+                body_params.append(param)
+
+        # Build parameter list
+        params = []
+        for param in path_params + query_params:
+            optional = "?" if not param.required else ""
+            params.append(f"{param.name}{optional}: {self._type_ref(param.type)}")
+
+        if body_params:
+            # For body parameters, create a single data object
+            if len(body_params) == 1:
+                param = body_params[0]
+                optional = "?" if not param.required else ""
+                params.append(f"data{optional}: {self._type_ref(param.type)}")
+            else:
+                # Multiple body parameters - create an object type
+                params.append(f"data: {self._body_type(body_params)}")
+
+        # Determine return type
+        if endpoint.responses:
+            return_type = self._type_ref(endpoint.responses[0].type)
+        else:
+            return_type = "any"
+
+        # Build path with parameter substitution
+        path = endpoint.path
+        for param in path_params:
+            path = path.replace(f"{{{param.name}}}", f"${{{param.name}}}")
+
+        return MethodSpec(
+            name=method_name,
+            description=endpoint.description,
+            http_method=f"{endpoint.method}",
+            path=path,
+            params=tuple(params),
+            query_params=tuple(query_params),
+            has_body=bool(body_params),
+            return_type=return_type,
+        )
+
+    def _type_ref(self, ts_type: str) -> str:
+        """Return how a type is referenced, using its shared alias if any."""
+        return self.type_table.ref(ts_type)
+
+    def _body_type(self, body_params: List) -> str:
+        """Return the type of a request body merged from several parameters."""
+        return self.type_table.body_ref(body_params)
+
     def _sanitize_method_name(self, name: str) -> str:
         """Sanitize method name for TypeScript."""
         # Remove invalid characters and ensure it starts with a letter
@@ -2,172 +2,256 @@
 
 from typing import List
 
-from ..models.endpoint import Endpoint, ParameterType
+from ..models.ir import AnyEndpoint
 from .base import BaseClientGenerator
+from .runtime import DEFAULT_CACHE_ENTRIES, format_policy, request_policy
 
 
 class FetchClientGenerator(BaseClientGenerator):
     """Generator for fetch-based TypeScript clients."""
 
-    def generate(self, endpoints: List[Endpoint]) -> str:
-        """Generate fetch-based TypeScript client."""
-        parts = [
-            "// Generated TypeScript client using fetch API",
-            "// This file was automatically generated by Spout",
+    header_comment = "// Generated TypeScript client using fetch API"
+
+    runtime_features = frozenset(
+        {"dedupe", "batch", "concurrency", "cache", "retry"}
+    )
+    styles = frozenset({"class", "functions"})
+
+    def _generate_imports(self) -> List[str]:
+        """Fetch is built in, so nothing is imported."""
+        return []
+
+    def _generate_config_interface(self) -> List[str]:
+        """Generate the ApiConfig interface."""
+        bases = []
+        if self.runtime.scheduled:
+            bases.append("SchedulerConfig")
+        if self.runtime.retrying:
+            bases.append("RetryConfig")
+        extends = f" extends {', '.join(bases)}" if bases else ""
+        return [
+            f"export interface ApiConfig{extends} {{",
+            f"  baseUrl?: string;",
+            "  headers?: Record<string, string>;",
+            "  timeout?: number;",
+            "}",
             "",
         ]
 
-        # Add types if requested
-        types_section = self._generate_types(endpoints)
-        if types_section:
-            parts.append(types_section)
-
-        # Add configuration interface
-        parts.extend(
-            [
-                "export interface ApiConfig {",
-                f"  baseUrl?: string;",
-                "  headers?: Record<string, string>;",
-                "  timeout?: number;",
-                "}",
-                "",
-                "export class ApiClient {",
-                "  private config: ApiConfig;",
+    def _generate_client_members(self, visibility: str = "private") -> List[str]:
+        """Generate the client's config, constructor and request helper."""
+        runtime = self.runtime
+        defaults = [f"baseUrl: '{self.base_url}'"]
+        if runtime.max_concurrency:
+            defaults.append(f"maxConcurrency: {runtime.max_concurrency}")
+        if runtime.batch_path:
+            defaults.append(f"batchPath: '{runtime.batch_path}'")
+        for name, value in (
+            ("timeout", runtime.timeout),
+            ("retries", runtime.retries),
+            ("retryBaseDelay", runtime.retry_base_delay),
+            ("retryMaxDelay", runtime.retry_max_delay),
+        ):
+            if value is not None:
+                defaults.append(f"{name}: {value}")
+        if runtime.retry_statuses:
+            defaults.append(f"retryStatuses: {list(runtime.retry_statuses)}")
+
+        members = [f"  {visibility} config: ApiConfig;"]
+        if not runtime.enabled:
+            return [
+                *members,
                 "",
                 "  constructor(config: ApiConfig = {}) {",
-                f"    this.config = {{ baseUrl: '{self.base_url}', ...config }};",
-                "  }",
-                "",
-            ]
-        )
-
-        # Add utility methods
-        parts.extend(
-            [
-                "  private async request<T>(",
-                "    path: string,",
-                "    options: RequestInit = {}",
-                "  ): Promise<T> {",
-                "    const url = `${this.config.baseUrl}${path}`;",
-                "    const headers = {",
-                "      'Content-Type': 'application/json',",
-                "      ...this.config.headers,",
-                "      ...options.headers,",
-                "    };",
-                "",
-                "    const response = await fetch(url, {",
-                "      ...options,",
-                "      headers,",
-                "    });",
-                "",
-                "    if (!response.ok) {",
-                "      throw new Error(`HTTP error! status: ${response.status}`);",
-                "    }",
-                "",
-                "    return response.json();",
+                *self._generate_config_defaults(defaults),
                 "  }",
                 "",
+                *self._generate_fetch(visibility),
             ]
-        )
-
-        # Generate methods for each endpoint
-        for endpoint in endpoints:
-            method_code = self._generate_endpoint_method(endpoint)
-            parts.append(method_code)
-            parts.append("")
 
-        parts.append("}")
+        if runtime.scheduled:
+            members.append(f"  {visibility} scheduler: RequestScheduler;")
+        if runtime.cached:
+            members.append(f"  {visibility} cache: ResponseCache;")
+        members += [
+            "",
+            "  constructor(config: ApiConfig = {}) {",
+            *self._generate_config_defaults(defaults),
+        ]
+        if runtime.scheduled:
+            members += [
+                "    this.scheduler = new RequestScheduler(",
+                "      this.config,",
+                "      (path: string, init: RequestInit) => this.send(path, init)",
+                "    );",
+            ]
+        if runtime.cached:
+            max_entries = runtime.cache_max_entries or DEFAULT_CACHE_ENTRIES
+            members.append(f"    this.cache = new ResponseCache({max_entries});")
+        members += [
+            "  }",
+            "",
+            f"  {visibility} async request<T>(",
+            "    path: string,",
+            "    options: RequestInit = {},",
+            "    policy: RequestPolicy = {}",
+            "  ): Promise<T> {",
+        ]
 
-        return "\n".join(parts)
+        def dispatch(init: str) -> str:
+            if runtime.scheduled:
+                return f"this.scheduler.schedule(path, {init}, policy)"
+            return f"this.send(path, {init})"
 
-    def _generate_endpoint_method(self, endpoint: Endpoint) -> str:
-        """Generate a method for a single endpoint."""
-        method_name = self._sanitize_method_name(endpoint.typescript_method_name)
+        if runtime.cached:
+            members += [
+                "    const body = await this.cache.resolve("
+                "path, policy, (headers) => {",
+                "      const init = "
+                "{ ...options, headers: { ...options.headers, ...headers } };",
+                f"      return {dispatch('init')};",
+                "    });",
+                "    return body as T;",
+            ]
+        else:
+            members += [
+                f"    const reply = await {dispatch('options')};",
+                "    return reply.body as T;",
+            ]
+        members += ["  }", "", *self._generate_send(visibility)]
+        return members
 
-        # Separate parameters by type
-        path_params = [
-            p for p in endpoint.parameters if p.parameter_type == ParameterType.PATH
+    @staticmethod
+    def _generate_config_defaults(defaults: List[str]) -> List[str]:
+        """Generate the constructor line merging ``config`` over ``defaults``."""
+        if len(defaults) == 1:
+            return [f"    this.config = {{ {defaults[0]}, ...config }};"]
+        return [
+            "    this.config = {",
+            *(f"      {default}," for default in defaults),
+            "      ...config,",
+            "    };",
         ]
-        query_params = [
-            p for p in endpoint.parameters if p.parameter_type == ParameterType.QUERY
+
+    def _generate_fetch(self, visibility: str) -> List[str]:
+        """Generate the helper fetching a path and parsing its JSON body."""
+        return [
+            f"  {visibility} async request<T>(",
+            "    path: string,",
+            "    options: RequestInit = {}",
+            "  ): Promise<T> {",
+            *self._generate_response_lines(),
+            "    return response.json();",
+            "  }",
+            "",
         ]
-        body_params = [
-            p for p in endpoint.parameters if p.parameter_type == ParameterType.BODY
+
+    def _generate_send(self, visibility: str) -> List[str]:
+        """Generate the helper performing a single fetch for the runtime."""
+        lines = [
+            f"  {visibility} async send(",
+            "    path: string,",
+            "    options: RequestInit = {}",
+            "  ): Promise<Reply> {",
+            *self._generate_response_lines(),
         ]
+        reply = "status: response.status, body: await response.json()"
+        if self.runtime.cached:
+            lines.append("    const etag = response.headers.get('ETag') ?? undefined;")
+            reply += ", etag"
+        lines.append(f"    return {{ {reply} }};")
+        lines += ["  }", ""]
+        return lines
 
-        # Build parameter list
-        params = []
-        for param in path_params + query_params:
-            optional = "?" if not param.required else ""
-            params.append(f"{param.name}{optional}: {param.type}")
-
-        if body_params:
-            # For body parameters, create a single data object
-            if len(body_params) == 1:
-                param = body_params[0]
-                optional = "?" if not param.required else ""
-                params.append(f"data{optional}: {param.type}")
-            else:
-                # Multiple body parameters - create an object type
-                body_props = []
-                for param in body_params:
-                    optional = "?" if not param.required else ""
-                    body_props.append(f"{param.name}{optional}: {param.type}")
-                params.append(f"data: {{ {'; '.join(body_props)} }}")
-
-        param_str = ", ".join(params)
-
-        # Determine return type
-        if endpoint.responses:
-            return_type = endpoint.responses[0].type
+    def _generate_response_lines(self) -> List[str]:
+        """Generate the fetch call and its status check."""
+        lines = [
+            "    const url = `${this.config.baseUrl}${path}`;",
+            "    const headers = {",
+            "      'Content-Type': 'application/json',",
+            "      ...this.config.headers,",
+            "      ...options.headers,",
+            "    };",
+            "",
+        ]
+        if self.runtime.retrying:
+            lines.append(
+                "    const response = await fetchWithRetry("
+                "url, { ...options, headers }, this.config);"
+            )
         else:
-            return_type = "any"
-
-        # Build method signature
-        lines = []
-        if endpoint.description:
-            lines.append(f"  /**")
-            lines.append(f"   * {endpoint.description}")
-            lines.append(f"   */")
-
-        lines.append(f"  async {method_name}({param_str}): Promise<{return_type}> {{")
+            lines += [
+                "    const controller = new AbortController();",
+                "    const timer = this.config.timeout",
+                "      ? setTimeout(() => controller.abort(), this.config.timeout)",
+                "      : undefined;",
+                "    const response = await fetch(url, {",
+                "      ...options,",
+                "      headers,",
+                "      signal: controller.signal,",
+                "    }).finally(() => clearTimeout(timer));",
+            ]
+        lines.append("")
+        if self.runtime.cached:
+            lines += [
+                "    if (response.status === 304) {",
+                "      return { status: 304, body: undefined };",
+                "    }",
+            ]
+        lines += [
+            "    if (!response.ok) {",
+            "      throw new Error(`HTTP error! status: ${response.status}`);",
+            "    }",
+            "",
+        ]
+        return lines
 
-        # Build path with parameter substitution
-        path = endpoint.path
-        for param in path_params:
-            path = path.replace(f"{{{param.name}}}", f"${{{param.name}}}")
+    def _generate_endpoint_method(self, endpoint: AnyEndpoint) -> str:
+        """Generate a method for a single endpoint."""
+        spec = self._method_spec(endpoint)
+        params = spec.params
+        if self.runtime.retrying:
+            # Lets callers cancel a request, including its retries
+            params += ("signal?: AbortSignal",)
+        return_type = spec.return_type
+        client = self._receiver
 
-        lines.append(f"    let path = `{path}`;")
+        lines = [f"let path = `{spec.path}`;"]
 
         # Add query parameters
-        if query_params:
-            lines.append("    const params = new URLSearchParams();")
-            for param in query_params:
+        if spec.query_params:
+            lines.append("const params = new URLSearchParams();")
+            for param in spec.query_params:
                 if param.required:
                     lines.append(
-                        f"    params.append('{param.name}', String({param.name}));"
+                        f"params.append('{param.name}', String({param.name}));"
                     )
                 else:
-                    lines.append(f"    if ({param.name} !== undefined) {{")
+                    lines.append(f"if ({param.name} !== undefined) {{")
                     lines.append(
-                        f"      params.append('{param.name}', String({param.name}));"
+                        f"  params.append('{param.name}', String({param.name}));"
                     )
-                    lines.append("    }")
-            lines.append("    const queryString = params.toString();")
-            lines.append("    if (queryString) path += `?${queryString}`;")
+                    lines.append("}")
+            lines.append("const queryString = params.toString();")
+            lines.append("if (queryString) path += `?${queryString}`;")
             lines.append("")
 
         # Build request options
-        method = endpoint.method
-        lines.append("    const options: RequestInit = {")
-        lines.append(f"      method: '{method}',")
+        lines.append("const options: RequestInit = {")
+        lines.append(f"  method: '{spec.http_method}',")
 
-        if body_params:
-            lines.append("      body: JSON.stringify(data),")
+        if spec.has_body:
+            lines.append("  body: JSON.stringify(data),")
+        if self.runtime.retrying:
+            lines.append("  signal,")
 
-        lines.append("    };")
+        lines.append("};")
         lines.append("")
-        lines.append(f"    return this.request<{return_type}>(path, options);")
-        lines.append("  }")
+        policy = ""
+        if self.runtime.enabled:
+            resolved = request_policy(endpoint, spec.http_method, self.runtime)
+            if resolved:
+                policy = f", {format_policy(resolved)}"
+        lines.append(f"return {client}.request<{return_type}>(path, options{policy});")
 
-        return "\n".join(lines)
+        return self._wrap_endpoint(spec, params, lines)
@@ -0,0 +1,176 @@
+"""Structural interning of TypeScript types shared across endpoints."""
+
+import re
+from collections import Counter
+from typing import Dict, Hashable, Iterable, List, Sequence, Set, Tuple
+
+from ..models.endpoint import ParameterType
+from ..models.ir import AnyEndpoint
+from ..shared.typescript import referenced_type_names
+
+# A type is only given a name once it is used at least this many times
+MIN_SHARED_USES = 2
+
+_BARE_NAME = re.compile(r"^[A-Za-z_$][\w$]*$")
+_WORD = re.compile(r"[A-Za-z_$][\w$]*")
+
+# (name, optional, type) for each property of an inline object type
+BodyShape = Tuple[Tuple[str, bool, str], ...]
+
+
+def body_params(endpoint: AnyEndpoint) -> List:
+    """Return the parameters sent in the request body."""
+    return [p for p in endpoint.parameters if p.parameter_type == ParameterType.BODY]
+
+
+def object_type(params: Iterable) -> str:
+    """Render parameters as an inline TypeScript object type."""
+    props = []
+    for param in params:
+        optional = "?" if not param.required else ""
+        props.append(f"{param.name}{optional}: {param.type}")
+    return f"{{ {'; '.join(props)} }}"
+
+
+def _signature_parts(endpoint: AnyEndpoint) -> Tuple[List[str], List]:
+    """
+    Split an endpoint's signature into standalone types and an inline body.
+
+    Returns:
+        Types of the path, query and single body parameters and of the
+        response, plus the body parameters when several are merged into
+        one inline object
+    """
+    body = body_params(endpoint)
+    types = [
+        p.type for p in endpoint.parameters if p.parameter_type != ParameterType.BODY
+    ]
+    if len(body) == 1:
+        types.append(body[0].type)
+    types.extend(r.type for r in endpoint.responses[:1])
+    return types, body if len(body) > 1 else []
+
+
+def _body_shape(params: Sequence) -> BodyShape:
+    return tuple(sorted((p.name, not p.required, p.type) for p in params))
+
+
+def _pascal(word: str) -> str:
+    return word[:1].upper() + word[1:]
+
+
+def _alias_base(ts_type: str) -> str:
+    """Derive a readable alias name from a compound type."""
+    words = [
+        _pascal(w)
+        for w in dict.fromkeys(_WORD.findall(ts_type))
+        if w not in ("Record", "null", "undefined")
+    ]
+    stem = "".join(words) or "Shared"
+    if ts_type.endswith("[]"):
+        return f"{stem}List"
+    if ts_type.startswith("Record<"):
+        return f"{stem}Map"
+    if ts_type.endswith(" | null"):
+        return f"{stem}OrNull"
+    return f"{stem}Type"
+
+
+class TypeTable:
+    """
+    Table of structurally identical types emitted once as named aliases.
+
+    Compound types that mention a model (``User[]``,
+    ``Record<string, User>``) and inline multi-property request bodies are
+    hashed by structure while scanning the endpoints. Those used at least
+    ``MIN_SHARED_USES`` times get an alias; every reference then resolves
+    to the alias name with a dictionary lookup instead of rebuilding the
+    type text.
+    """
+
+    def __init__(self) -> None:
+        self._aliases: Dict[Hashable, str] = {}
+        self._definitions: Dict[str, str] = {}
+
+    @classmethod
+    def build(
+        cls, endpoints: Iterable[AnyEndpoint], reserved: Iterable[str] = ()
+    ) -> "TypeTable":
+        """
+        Intern the shared types of a set of endpoints.
+
+        Args:
+            endpoints: Endpoints in output order; aliases are named after
+                the first endpoint using them
+            reserved: Names that aliases must not collide with
+
+        Returns:
+            The populated table
+        """
+        counts: Counter = Counter()
+        texts: Dict[Hashable, str] = {}
+        owners: Dict[Hashable, str] = {}
+
+        for endpoint in endpoints:
+            types, params = _signature_parts(endpoint)
+            for ts_type in types:
+                if _BARE_NAME.match(ts_type) or not referenced_type_names(ts_type):
+                    continue
+                counts[ts_type] += 1
+                texts.setdefault(ts_type, ts_type)
+
+            if params:
+                shape = _body_shape(params)
+                counts[shape] += 1
+                if shape not in texts:
+                    texts[shape] = object_type(params)
+                    owners[shape] = endpoint.typescript_method_name
+
+        table = cls()
+        taken: Set[str] = set(reserved)
+        for key, text in texts.items():
+            if counts[key] < MIN_SHARED_USES:
+                continue
+            if key in owners:
+                base = f"{_pascal(owners[key])}Body"
+            else:
+                base = _alias_base(text)
+            name = base
+            suffix = 2
+            while name in taken:
+                name = f"{base}{suffix}"
+                suffix += 1
+            taken.add(name)
+            table._aliases[key] = name
+            table._definitions[name] = text
+        return table
+
+    def __len__(self) -> int:
+        return len(self._definitions)
+
+    def ref(self, ts_type: str) -> str:
+        """Return the alias of a type, or the type itself if not interned."""
+        return self._aliases.get(ts_type, ts_type)
+
+    def body_ref(self, params: Sequence) -> str:
+        """Return the type of a multi-property request body."""
+        alias = self._aliases.get(_body_shape(params))
+        return alias if alias is not None else object_type(params)
+
+    def signature_names(self, endpoints: Iterable[AnyEndpoint]) -> Set[str]:
+        """Return the type names method signatures of ``endpoints`` mention."""
+        names: Set[str] = set()
+        for endpoint in endpoints:
+            types, params = _signature_parts(endpoint)
+            for ts_type in types:
+                names |= referenced_type_names(self.ref(ts_type))
+            if params:
+                names |= referenced_type_names(self.body_ref(params))
+        return names
+
+    def definitions(self) -> List[str]:
+        """Render one ``export type`` line per alias, sorted by name."""
+        return [
+            f"export type {name} = {self._definitions[name]};"
+            for name in sorted(self._definitions)
+        ]
@@ -0,0 +1,628 @@
+"""Request scheduling, caching and retry runtime emitted into generated clients."""
+
+import json
+from typing import Any, Dict, FrozenSet, List, NamedTuple, Optional, Tuple
+
+from ..models.ir import CLIENT_OPTIONS_KEY, AnyEndpoint
+
+# Per-endpoint client options that override the generator's defaults
+POLICY_OPTIONS = ("dedupe", "batch")
+
+# Features served by the RequestScheduler
+SCHEDULER_FEATURES = frozenset({"dedupe", "batch", "concurrency"})
+
+# GenerateInput fields that override the configuration file's runtime options
+INPUT_OPTIONS = (
+    "dedupe",
+    "batch_path",
+    "max_concurrency",
+    "cache_ttl",
+    "timeout",
+    "retries",
+)
+
+# Responses a client keeps when the configuration does not say
+DEFAULT_CACHE_ENTRIES = 500
+
+# Methods whose success invalidates cached responses under their path
+MUTATING_METHODS = frozenset({"POST", "PUT", "PATCH", "DELETE"})
+
+
+class RuntimeOptions(NamedTuple):
+    """
+    Request scheduling and caching features of a generated client.
+
+    With any of them enabled, each endpoint method passes the policy
+    resolved from these defaults and the endpoint's own client options to
+    the runtime emitted into the client: a ``RequestScheduler`` for
+    deduplication, batching and concurrency limits, and a ``ResponseCache``
+    for GET responses.
+    """
+
+    # Share one request between identical concurrent GETs (method + URL)
+    dedupe: bool = False
+    # Path requests issued in the same microtask are batched to
+    batch_path: Optional[str] = None
+    # Most requests in flight at once; None or 0 for no limit
+    max_concurrency: Optional[int] = None
+    # Seconds GET responses are cached for; None or 0 caches none by default
+    cache_ttl: Optional[float] = None
+    # Most responses the cache keeps before evicting the least recently used
+    cache_max_entries: Optional[int] = None
+    # Per-route TTL overrides as (route path, seconds); 0 disables caching
+    cache_endpoints: Tuple[Tuple[str, float], ...] = ()
+    # Default request timeout in milliseconds; a client default, not a feature
+    timeout: Optional[int] = None
+    # Times a failed idempotent request is retried
+    retries: Optional[int] = None
+    # First backoff delay and backoff cap in milliseconds
+    retry_base_delay: Optional[int] = None
+    retry_max_delay: Optional[int] = None
+    # Response statuses worth retrying; empty keeps the runtime's defaults
+    retry_statuses: Tuple[int, ...] = ()
+
+    @property
+    def features(self) -> FrozenSet[str]:
+        """Names of the enabled features."""
+        enabled = set()
+        if self.dedupe:
+            enabled.add("dedupe")
+        if self.batch_path:
+            enabled.add("batch")
+        if self.max_concurrency:
+            enabled.add("concurrency")
+        if self.cache_ttl or any(ttl for _, ttl in self.cache_endpoints):
+            enabled.add("cache")
+        if self.retries:
+            enabled.add("retry")
+        return frozenset(enabled)
+
+    @property
+    def enabled(self) -> bool:
+        return bool(self.features)
+
+    @property
+    def scheduled(self) -> bool:
+        """Whether requests go through a ``RequestScheduler``."""
+        return bool(self.features & SCHEDULER_FEATURES)
+
+    @property
+    def retrying(self) -> bool:
+        """Whether requests go through ``fetchWithRetry``."""
+        return "retry" in self.features
+
+    @property
+    def cached(self) -> bool:
+        """Whether the client keeps a ``ResponseCache``."""
+        return "cache" in self.features
+
+    def endpoint_ttl(self, route_path: str) -> float:
+        """Return how many seconds a route's GET responses are cached for."""
+        for path, ttl in self.cache_endpoints:
+            if path == route_path:
+                return ttl
+        return self.cache_ttl or 0
+
+
+def runtime_options(
+    config: Optional[Dict[str, Any]], **overrides: Any
+) -> RuntimeOptions:
+    """
+    Combine a configuration file's runtime options with explicit ones.
+
+    Args:
+        config: Loaded configuration file
+        overrides: ``INPUT_OPTIONS`` values; None keeps the configuration's
+
+    Raises:
+        ValueError: If the configuration is malformed
+    """
+    options = {**cache_options(config), **retry_options(config)}
+    options.update(
+        (name, value) for name, value in overrides.items() if value is not None
+    )
+    return RuntimeOptions(**options)
+
+
+def cache_options(config: Optional[Dict[str, Any]]) -> Dict[str, Any]:
+    """
+    Read the ``cache`` object of a configuration file.
+
+    ``{"ttl": 60, "maxEntries": 500, "endpoints": {"/users/{id}": 300}}``
+    caches every GET for 60 seconds except ``/users/{id}``, whose TTL is
+    overridden; a TTL of 0 disables caching for that route.
+
+    Returns:
+        The ``RuntimeOptions`` fields the configuration sets
+
+    Raises:
+        ValueError: If the cache configuration is malformed
+    """
+    cache = (config or {}).get("cache")
+    if cache is None:
+        return {}
+    if not isinstance(cache, dict):
+        raise ValueError(f"cache must be an object, got {cache!r}")
+    unknown = set(cache) - {"ttl", "maxEntries", "endpoints"}
+    if unknown:
+        raise ValueError(f"Unknown cache options: {', '.join(sorted(unknown))}")
+
+    options: Dict[str, Any] = {}
+    if "ttl" in cache:
+        options["cache_ttl"] = _seconds("cache.ttl", cache["ttl"])
+    if "maxEntries" in cache:
+        max_entries = cache["maxEntries"]
+        if type(max_entries) is not int or max_entries < 1:
+            raise ValueError(
+                f"cache.maxEntries must be a positive integer, got {max_entries!r}"
+            )
+        options["cache_max_entries"] = max_entries
+    endpoints = cache.get("endpoints", {})
+    if not isinstance(endpoints, dict):
+        raise ValueError(f"cache.endpoints must be an object, got {endpoints!r}")
+    if endpoints:
+        options["cache_endpoints"] = tuple(
+            (path, _seconds(f"cache.endpoints[{path!r}]", ttl))
+            for path, ttl in endpoints.items()
+        )
+    return options
+
+
+def retry_options(config: Optional[Dict[str, Any]]) -> Dict[str, Any]:
+    """
+    Read the ``timeout`` and ``retry`` options of a configuration file.
+
+    ``{"timeout": 10000, "retry": {"retries": 3, "baseDelay": 200,
+    "maxDelay": 5000, "statuses": [429, 503]}}`` aborts requests after 10
+    seconds and retries idempotent ones up to three times. Times are in
+    milliseconds.
+
+    Returns:
+        The ``RuntimeOptions`` fields the configuration sets
+
+    Raises:
+        ValueError: If the timeout or retry configuration is malformed
+    """
+    config = config or {}
+    options: Dict[str, Any] = {}
+    if config.get("timeout") is not None:
+        options["timeout"] = _count("timeout", config["timeout"])
+    retry = config.get("retry")
+    if retry is None:
+        return options
+    if not isinstance(retry, dict):
+        raise ValueError(f"retry must be an object, got {retry!r}")
+    fields = {
+        "retries": "retries",
+        "baseDelay": "retry_base_delay",
+        "maxDelay": "retry_max_delay",
+    }
+    unknown = set(retry) - set(fields) - {"statuses"}
+    if unknown:
+        raise ValueError(f"Unknown retry options: {', '.join(sorted(unknown))}")
+    for key, name in fields.items():
+        if key in retry:
+            options[name] = _count(f"retry.{key}", retry[key])
+    if "statuses" in retry:
+        statuses = retry["statuses"]
+        if not isinstance(statuses, list) or not all(
+            type(status) is int and 100 <= status < 600 for status in statuses
+        ):
+            raise ValueError(
+                f"retry.statuses must be a list of HTTP statuses, got {statuses!r}"
+            )
+        options["retry_statuses"] = tuple(statuses)
+    return options
+
+
+def _count(name: str, value: Any) -> int:
+    if type(value) is not int or value < 0:
+        raise ValueError(f"{name} must be a non-negative integer, got {value!r}")
+    return value
+
+
+def _seconds(name: str, value: Any) -> float:
+    if isinstance(value, bool) or not isinstance(value, (int, float)) or value < 0:
+        raise ValueError(f"{name} must be a non-negative number, got {value!r}")
+    return value
+
+
+def endpoint_client_options(endpoint: AnyEndpoint) -> Dict[str, Any]:
+    """Return the client options an endpoint declares, if any."""
+    options = endpoint.framework_data.get(CLIENT_OPTIONS_KEY)
+    return options if isinstance(options, dict) else {}
+
+
+def invalidation_prefix(route_path: str) -> str:
+    """
+    Return the path prefix a mutating route invalidates.
+
+    The prefix is the route's static leading segments, so ``PUT
+    /users/{id}`` (or Django's ``/users/<int:id>``) drops cached ``/users``
+    and ``/users/...`` responses.
+    """
+    segments = []
+    for segment in route_path.strip("/").split("/"):
+        if not segment or "{" in segment or "<" in segment:
+            break
+        segments.append(segment)
+    return "/" + "/".join(segments)
+
+
+def request_policy(
+    endpoint: AnyEndpoint, http_method: str, runtime: RuntimeOptions
+) -> Dict[str, Any]:
+    """
+    Resolve how the runtime treats one endpoint's requests.
+
+    Endpoint options win over the generator defaults. Only GETs are ever
+    deduplicated or cached, and mutating methods invalidate the cache
+    under their path when it is enabled.
+
+    Returns:
+        The policy entries that are set, in ``POLICY_OPTIONS`` order
+        followed by ``cacheTtl`` and ``invalidate``
+    """
+    options = endpoint_client_options(endpoint)
+    defaults = {"dedupe": runtime.dedupe, "batch": bool(runtime.batch_path)}
+    policy: Dict[str, Any] = {}
+    for name in POLICY_OPTIONS:
+        if bool(options.get(name, defaults[name])):
+            policy[name] = True
+    method = http_method.upper()
+    if method != "GET":
+        policy.pop("dedupe", None)
+    if runtime.cached:
+        if method == "GET":
+            ttl = runtime.endpoint_ttl(endpoint.path)
+            if ttl:
+                policy["cacheTtl"] = ttl
+        elif method in MUTATING_METHODS:
+            policy["invalidate"] = invalidation_prefix(endpoint.path)
+    return policy
+
+
+def format_policy(policy: Dict[str, Any]) -> str:
+    """Render a request policy as a TypeScript object literal."""
+    entries = ", ".join(
+        f"{name}: {ts_literal(value)}" for name, value in policy.items()
+    )
+    return "{ " + entries + " }"
+
+
+def ts_literal(value: Any) -> str:
+    """Render a string, number or boolean as a TypeScript literal."""
+    if isinstance(value, str):
+        return "'" + value.replace("\\", "\\\\").replace("'", "\\'") + "'"
+    if isinstance(value, float) and value.is_integer():
+        # --cache-ttl parses as float; 5.0 reads better as 5
+        value = int(value)
+    return json.dumps(value)
+
+
+RUNTIME_TYPES = """\
+export interface RequestPolicy {
+  dedupe?: boolean;
+  batch?: boolean;
+  cacheTtl?: number;
+  invalidate?: string;
+}
+
+export interface Reply {
+  status: number;
+  etag?: string;
+  body: unknown;
+}
+"""
+
+
+REQUEST_SCHEDULER = """\
+export interface SchedulerConfig {
+  maxConcurrency?: number;
+  batchPath?: string;
+}
+
+type Send = (path: string, init: RequestInit) => Promise<Reply>;
+
+interface BatchEntry {
+  path: string;
+  init: RequestInit;
+  resolve: (reply: Reply) => void;
+  reject: (reason: unknown) => void;
+}
+
+export class RequestScheduler {
+  private inFlight = new Map<string, Promise<Reply>>();
+  private active = 0;
+  private waiting: Array<() => void> = [];
+  private queue: BatchEntry[] = [];
+
+  constructor(private config: SchedulerConfig, private send: Send) {}
+
+  schedule(path: string, init: RequestInit, policy: RequestPolicy): Promise<Reply> {
+    const method = (init.method ?? 'GET').toUpperCase();
+    // A caller's own signal must not abort requests shared with others
+    if (!policy.dedupe || method !== 'GET' || init.signal) {
+      return this.dispatch(path, init, policy);
+    }
+    const key = `${method} ${path}`;
+    const existing = this.inFlight.get(key);
+    if (existing) {
+      return existing;
+    }
+    const request = this.dispatch(path, init, policy).finally(() => {
+      this.inFlight.delete(key);
+    });
+    this.inFlight.set(key, request);
+    return request;
+  }
+
+  private dispatch(
+    path: string,
+    init: RequestInit,
+    policy: RequestPolicy
+  ): Promise<Reply> {
+    if (!policy.batch || !this.config.batchPath || init.signal) {
+      return this.limit(() => this.send(path, init));
+    }
+    return new Promise<Reply>((resolve, reject) => {
+      if (this.queue.length === 0) {
+        queueMicrotask(() => this.flush());
+      }
+      this.queue.push({ path, init, resolve, reject });
+    });
+  }
+
+  private flush(): void {
+    const batch = this.queue.splice(0);
+    if (batch.length === 1) {
+      const [entry] = batch;
+      this.limit(() => this.send(entry.path, entry.init)).then(
+        entry.resolve,
+        entry.reject
+      );
+      return;
+    }
+    const requests = batch.map(({ path, init }) => ({
+      method: (init.method ?? 'GET').toUpperCase(),
+      path,
+      body: typeof init.body === 'string' ? JSON.parse(init.body) : undefined,
+    }));
+    const init = { method: 'POST', body: JSON.stringify(requests) };
+    const batchPath = this.config.batchPath!;
+    this.limit(() => this.send(batchPath, init)).then(
+      (reply) => {
+        const results = reply.body as Reply[];
+        batch.forEach((entry, i) => {
+          const result = results[i];
+          if (result && result.status >= 200 && result.status < 300) {
+            entry.resolve({ status: result.status, body: result.body });
+          } else {
+            const status = result ? result.status : 'missing';
+            entry.reject(new Error(`HTTP error! status: ${status}`));
+          }
+        });
+      },
+      (error) => batch.forEach((entry) => entry.reject(error)),
+    );
+  }
+
+  private async limit<T>(task: () => Promise<T>): Promise<T> {
+    const max = this.config.maxConcurrency ?? 0;
+    if (max > 0 && this.active >= max) {
+      // The finishing request hands its slot over instead of releasing it
+      await new Promise<void>((resolve) => this.waiting.push(resolve));
+    } else {
+      this.active++;
+    }
+    try {
+      return await task();
+    } finally {
+      const next = this.waiting.shift();
+      if (next) {
+        next();
+      } else {
+        this.active--;
+      }
+    }
+  }
+}
+"""
+
+RESPONSE_CACHE = """\
+interface CacheEntry {
+  body: unknown;
+  etag?: string;
+  expires: number;
+}
+
+export class ResponseCache {
+  private entries = new Map<string, CacheEntry>();
+  // Bumped by every invalidation so responses already in flight are dropped
+  private generation = 0;
+
+  constructor(private maxEntries: number) {}
+
+  async resolve(
+    key: string,
+    policy: RequestPolicy,
+    send: (headers: Record<string, string>) => Promise<Reply>
+  ): Promise<unknown> {
+    const ttl = policy.cacheTtl ?? 0;
+    const entry = ttl > 0 ? this.entries.get(key) : undefined;
+    if (entry && entry.expires > Date.now()) {
+      this.store(key, entry);
+      return entry.body;
+    }
+
+    const generation = this.generation;
+    const headers: Record<string, string> = {};
+    if (entry && entry.etag) {
+      headers['If-None-Match'] = entry.etag;
+    }
+    const reply = await send(headers);
+    if (reply.status === 304 && entry) {
+      if (generation === this.generation) {
+        this.store(key, { ...entry, expires: Date.now() + ttl * 1000 });
+      }
+      return entry.body;
+    }
+    if (ttl > 0 && generation === this.generation) {
+      const expires = Date.now() + ttl * 1000;
+      this.store(key, { body: reply.body, etag: reply.etag, expires });
+    }
+    if (policy.invalidate) {
+      this.invalidate(policy.invalidate);
+    }
+    return reply.body;
+  }
+
+  invalidate(prefix: string): void {
+    const base = prefix.endsWith('/') ? prefix : `${prefix}/`;
+    for (const key of Array.from(this.entries.keys())) {
+      if (key === prefix || key.startsWith(base) || key.startsWith(`${prefix}?`)) {
+        this.entries.delete(key);
+      }
+    }
+    this.generation++;
+  }
+
+  clear(): void {
+    this.entries.clear();
+    this.generation++;
+  }
+
+  private store(key: string, entry: CacheEntry): void {
+    // Map order doubles as recency order: the first key is the LRU entry
+    this.entries.delete(key);
+    this.entries.set(key, entry);
+    while (this.entries.size > this.maxEntries) {
+      this.entries.delete(this.entries.keys().next().value!);
+    }
+  }
+}
+"""
+
+
+FETCH_WITH_RETRY = """\
+export interface RetryConfig {
+  timeout?: number;
+  retries?: number;
+  retryBaseDelay?: number;
+  retryMaxDelay?: number;
+  retryStatuses?: number[];
+}
+
+const IDEMPOTENT_METHODS = ['GET', 'HEAD', 'OPTIONS', 'PUT', 'DELETE'];
+const RETRY_STATUSES = [408, 429, 500, 502, 503, 504];
+
+export async function fetchWithRetry(
+  url: string,
+  init: RequestInit,
+  config: RetryConfig
+): Promise<Response> {
+  const method = (init.method ?? 'GET').toUpperCase();
+  const retries = IDEMPOTENT_METHODS.includes(method) ? config.retries ?? 0 : 0;
+  const statuses = config.retryStatuses ?? RETRY_STATUSES;
+  for (let attempt = 0; ; attempt++) {
+    let response: Response | undefined;
+    try {
+      response = await fetchWithTimeout(url, init, config.timeout);
+    } catch (error) {
+      // Network errors and timeouts are retried; the caller's abort is not
+      if (attempt >= retries || init.signal?.aborted) {
+        throw error;
+      }
+    }
+    if (response && (attempt >= retries || !statuses.includes(response.status))) {
+      return response;
+    }
+    const delay = retryDelay(attempt, config, response);
+    if (delay === undefined) {
+      return response!;
+    }
+    await sleep(delay, init.signal);
+  }
+}
+
+async function fetchWithTimeout(
+  url: string,
+  init: RequestInit,
+  timeout?: number
+): Promise<Response> {
+  if (!timeout) {
+    return fetch(url, init);
+  }
+  const controller = new AbortController();
+  const signal = init.signal;
+  const abort = () => controller.abort(signal?.reason);
+  if (signal?.aborted) {
+    abort();
+  }
+  signal?.addEventListener('abort', abort, { once: true });
+  const timer = setTimeout(
+    () => controller.abort(new DOMException('Request timed out', 'TimeoutError')),
+    timeout
+  );
+  try {
+    return await fetch(url, { ...init, signal: controller.signal });
+  } finally {
+    clearTimeout(timer);
+    signal?.removeEventListener('abort', abort);
+  }
+}
+
+function retryDelay(
+  attempt: number,
+  config: RetryConfig,
+  response?: Response
+): number | undefined {
+  const maxDelay = config.retryMaxDelay ?? 5000;
+  const retryAfter = response?.headers.get('Retry-After');
+  if (retryAfter) {
+    const seconds = Number(retryAfter);
+    const delay = Number.isNaN(seconds)
+      ? Date.parse(retryAfter) - Date.now()
+      : seconds * 1000;
+    if (!Number.isNaN(delay)) {
+      // Retrying sooner than the server asked would only be rejected again
+      return delay <= maxDelay ? Math.max(delay, 0) : undefined;
+    }
+  }
+  // Exponential backoff with full jitter
+  const ceiling = Math.min(maxDelay, (config.retryBaseDelay ?? 200) * 2 ** attempt);
+  return Math.random() * ceiling;
+}
+
+function sleep(ms: number, signal?: AbortSignal | null): Promise<void> {
+  return new Promise((resolve, reject) => {
+    if (signal?.aborted) {
+      reject(signal.reason);
+      return;
+    }
+    const onAbort = () => {
+      clearTimeout(timer);
+      reject(signal!.reason);
+    };
+    const timer = setTimeout(() => {
+      signal?.removeEventListener('abort', onAbort);
+      resolve();
+    }, ms);
+    signal?.addEventListener('abort', onAbort, { once: true });
+  });
+}
+"""
+
+
+def runtime_lines(runtime: RuntimeOptions) -> List[str]:
+    """Return the runtime a client with ``runtime`` needs, one line per entry."""
+    if not runtime.enabled:
+        return []
+    sections = [RUNTIME_TYPES]
+    if runtime.scheduled:
+        sections.append(REQUEST_SCHEDULER)
+    if runtime.cached:
+        sections.append(RESPONSE_CACHE)
+    if runtime.retrying:
+        sections.append(FETCH_WITH_RETRY)
+    return "\n".join(sections).split("\n")
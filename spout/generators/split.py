@@ -0,0 +1,76 @@
+"""Grouping of endpoints into modules for split client output."""
+
+import os
+import re
+from pathlib import Path
+from typing import Dict, List, Optional
+
+from ..models.endpoint import GENERIC_PATH_PARTS
+from ..models.ir import AnyEndpoint
+from ..shared.constants import SPLIT_MODES
+
+DEFAULT_GROUP = "default"
+
+# Module names that would collide with the shared files of a split client
+_RESERVED_MODULES = frozenset(["index", "runtime", "types"])
+
+
+def module_name(key: str) -> str:
+    """Turn a tag, module path or path prefix into a kebab-case module name."""
+    words = re.findall(r"[A-Za-z0-9]+", re.sub(r"([a-z0-9])([A-Z])", r"\1 \2", key))
+    name = "-".join(word.lower() for word in words) or DEFAULT_GROUP
+    if name[0].isdigit() or name in _RESERVED_MODULES:
+        name = f"{name}-api"
+    return name
+
+
+def module_class_name(name: str) -> str:
+    """Return the API class name exported by a module."""
+    return "".join(part.capitalize() for part in name.split("-")) + "Api"
+
+
+def _group_key(endpoint: AnyEndpoint, split_by: str, root: Optional[Path]) -> str:
+    if split_by == "tag":
+        return endpoint.tags[0] if endpoint.tags else DEFAULT_GROUP
+    if split_by == "file":
+        file_path = endpoint.framework_data.get("file_path")
+        if not file_path:
+            return DEFAULT_GROUP
+        path = Path(file_path)
+        if root is not None:
+            relative = Path(os.path.relpath(path, root))
+            if relative.parts[0] != os.pardir:
+                return str(relative.with_suffix(""))
+        return path.stem
+    if split_by == "prefix":
+        for part in endpoint.path.split("/"):
+            if part and part.lower() not in GENERIC_PATH_PARTS and part[0] not in "{<":
+                return part
+        return DEFAULT_GROUP
+    raise ValueError(f"Unsupported split mode: {split_by}. Available: {SPLIT_MODES}")
+
+
+def group_endpoints(
+    endpoints: List[AnyEndpoint], split_by: str, root: Optional[Path] = None
+) -> Dict[str, List[AnyEndpoint]]:
+    """
+    Group endpoints into modules, preserving first-seen order.
+
+    With ``file``, modules are named after each source file's path relative
+    to ``root``, so ``a/views.py`` and ``b/views.py`` become ``a-views`` and
+    ``b-views`` and names do not change as files are added. Without a
+    ``root``, or for files outside it, the file stem is used.
+
+    Args:
+        endpoints: Endpoints to group
+        split_by: One of ``SPLIT_MODES``
+        root: Project directory that ``file`` module names are relative to
+
+    Returns:
+        Mapping of module name to the endpoints it holds
+    """
+    groups: Dict[str, List[AnyEndpoint]] = {}
+    for endpoint in endpoints:
+        name = module_name(_group_key(endpoint, split_by, root))
+        groups.setdefault(name, []).append(endpoint)
+    return groups
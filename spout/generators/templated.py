@@ -0,0 +1,159 @@
+"""Template-backed TypeScript client generators."""
+
+from functools import lru_cache
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, Type
+
+from jinja2 import Environment, FileSystemBytecodeCache, FileSystemLoader
+from jinja2 import StrictUndefined, Template
+
+from ..models.ir import AnyEndpoint, ModelIR
+from . import CLIENT_TEMPLATE, TEMPLATES_DIR, template_client_types
+from .base import BaseClientGenerator
+from .runtime import RuntimeOptions
+
+# Endpoint methods rendered per template call
+DEFAULT_BATCH_SIZE = 256
+
+
+@lru_cache(maxsize=None)
+def get_environment(bytecode_cache_dir: Optional[str] = None) -> Environment:
+    """
+    Return the process-wide template environment.
+
+    Templates are compiled on first use and kept in the environment's
+    cache for the life of the process. With ``bytecode_cache_dir`` the
+    compiled bytecode is also stored on disk, so later processes skip
+    compilation.
+
+    Args:
+        bytecode_cache_dir: Directory for compiled template bytecode
+    """
+    bytecode_cache = None
+    if bytecode_cache_dir is not None:
+        Path(bytecode_cache_dir).mkdir(parents=True, exist_ok=True)
+        bytecode_cache = FileSystemBytecodeCache(bytecode_cache_dir)
+    return Environment(
+        loader=FileSystemLoader(str(TEMPLATES_DIR)),
+        autoescape=False,
+        trim_blocks=True,
+        lstrip_blocks=True,
+        keep_trailing_newline=False,
+        auto_reload=False,
+        undefined=StrictUndefined,
+        bytecode_cache=bytecode_cache,
+    )
+
+
+def _lines(text: str) -> List[str]:
+    return text.split("\n") if text else []
+
+
+class TemplateClientGenerator(BaseClientGenerator):
+    """
+    Generator rendering every part of a client from Jinja2 templates.
+
+    Each client type is a directory under ``templates/`` whose
+    ``client.ts.j2`` defines the macros ``header_comment``, ``imports``,
+    ``module_imports``, ``config_interface``, ``client_members`` and
+    ``method``; adding a client type needs no Python. Methods receive the
+    ``MethodSpec`` built by the base class and are rendered in batches of
+    ``batch_size`` per template call.
+    """
+
+    # Template directory of the client type
+    client_type: str = ""
+
+    batch_size = DEFAULT_BATCH_SIZE
+
+    def __init__(
+        self,
+        base_url: str = "",
+        include_types: bool = True,
+        models: Optional[Dict[str, ModelIR]] = None,
+        client_type: Optional[str] = None,
+        bytecode_cache_dir: Optional[Path] = None,
+        runtime: Optional[RuntimeOptions] = None,
+        style: str = "class",
+    ):
+        """
+        Initialize the generator.
+
+        Args:
+            base_url: Base URL for API calls
+            include_types: Whether to include TypeScript type definitions
+            models: Resolved model definitions keyed by name
+            client_type: Template directory; defaults to the class attribute
+            bytecode_cache_dir: Directory for compiled template bytecode
+            runtime: Request scheduling features; templates only apply the
+                default ``timeout``
+            style: Output style; templates only emit ``class``
+
+        Raises:
+            ValueError: If a runtime feature or another style is requested
+        """
+        super().__init__(base_url, include_types, models, runtime, style)
+        if client_type is not None:
+            self.client_type = client_type
+        env = get_environment(str(bytecode_cache_dir) if bytecode_cache_dir else None)
+        self._client_path = f"{self.client_type}/{CLIENT_TEMPLATE}"
+        self._client: Any = env.get_template(self._client_path).module
+        self._batch: Template = env.get_template("_batch.ts.j2")
+
+    @property
+    def header_comment(self) -> str:  # type: ignore[override]
+        return str(self._client.header_comment())
+
+    def generate_iter(self, endpoints: List[AnyEndpoint]) -> Iterator[str]:
+        """Generate the client as a stream, one chunk per batch of methods."""
+        self.intern_types(endpoints)
+        return self._generate_batched(endpoints)
+
+    def _generate_batched(self, endpoints: List[AnyEndpoint]) -> Iterator[str]:
+        yield self._generate_header(endpoints)
+        for start in range(0, len(endpoints), self.batch_size):
+            batch = endpoints[start : start + self.batch_size]
+            yield self._batch.render(
+                client_template=self._client_path,
+                methods=[self._method_spec(e) for e in batch],
+            )
+        yield f"\n{self._generate_footer()}"
+
+    def _generate_imports(self) -> List[str]:
+        return _lines(str(self._client.imports()))
+
+    def _generate_module_imports(self) -> List[str]:
+        return _lines(str(self._client.module_imports()))
+
+    def _generate_config_interface(self) -> List[str]:
+        return _lines(str(self._client.config_interface()))
+
+    def _generate_client_members(self, visibility: str = "private") -> List[str]:
+        members = self._client.client_members(
+            visibility, self.base_url, self.runtime.timeout
+        )
+        return _lines(str(members))
+
+    def _generate_endpoint_method(self, endpoint: AnyEndpoint) -> str:
+        return str(self._client.method(self._method_spec(endpoint)))
+
+
+@lru_cache(maxsize=None)
+def template_generator(client_type: str) -> Type[TemplateClientGenerator]:
+    """
+    Return a generator class bound to one template directory.
+
+    Raises:
+        ValueError: If there is no template for ``client_type``
+    """
+    if client_type not in template_client_types():
+        raise ValueError(f"No client template for {client_type!r}")
+    name = "".join(part.title() for part in client_type.split("-"))
+    return type(
+        f"{name}TemplateClientGenerator",
+        (TemplateClientGenerator,),
+        {
+            "client_type": client_type,
+            "__doc__": f"Template-based generator for {client_type} clients.",
+        },
+    )
@@ -8,11 +8,12 @@ from .endpoint import (
     ParameterType,
 )
 from .framework import FrameworkInfo, SupportedFramework, ParserInput
-from .cli_input import DetectInput, GenerateInput
+from .cli_input import DetectInput, GenerateInput, GenerateTarget
 
 __all__ = [
     "DetectInput",
     "GenerateInput",
+    "GenerateTarget",
     "Endpoint",
     "EndpointMethod",
     "EndpointParameter",
@@ -1,14 +1,19 @@
 from pathlib import Path
-from typing import Any, Optional
+from typing import Any, Optional, Union
 
 from pydantic import BaseModel
 
+from ..shared.utils import parse_target_spec
+
 
 class DetectInput(BaseModel):
     """Input model for CLI detect command."""
 
     project_path: str
     verbose: bool = False
+    use_cache: bool = True
+    jobs: Optional[int] = None
+    config: Optional[dict[str, Any]] = None
 
     @property
     def path(self) -> Path:
@@ -21,5 +26,53 @@ class GenerateInput(DetectInput):
     output_path: str
     include_types: bool = True
     client_type: str = "fetch"
-    config: Optional[dict[str, Any]] = None
+    engine: str = "fstring"
+    split_by: Optional[str] = None
     base_url: Optional[str] = None
+    dedupe: bool = False
+    batch_path: Optional[str] = None
+    max_concurrency: Optional[int] = None
+    cache_ttl: Optional[float] = None
+    timeout: Optional[int] = None
+    retries: Optional[int] = None
+    style: str = "class"
+
+    def for_target(self, target: "GenerateTarget") -> "GenerateInput":
+        """Return these options with ``target``'s overrides applied."""
+        return self.model_copy(update=target.options())
+
+
+class GenerateTarget(BaseModel):
+    """
+    One client to emit in a multi-target run.
+
+    Options left as None take the run's value from ``GenerateInput``.
+    """
+
+    client_type: str
+    output_path: str
+    include_types: Optional[bool] = None
+    base_url: Optional[str] = None
+    engine: Optional[str] = None
+    split_by: Optional[str] = None
+    dedupe: Optional[bool] = None
+    batch_path: Optional[str] = None
+    max_concurrency: Optional[int] = None
+    cache_ttl: Optional[float] = None
+    timeout: Optional[int] = None
+    retries: Optional[int] = None
+    style: Optional[str] = None
+
+    @classmethod
+    def parse(cls, spec: Union[str, dict[str, Any]]) -> "GenerateTarget":
+        """
+        Build a target from ``TYPE:PATH`` or a configuration file object.
+
+        Raises:
+            ValueError: If the spec is malformed
+        """
+        return cls(**parse_target_spec(spec))
+
+    def options(self) -> dict[str, Any]:
+        """Return the ``GenerateInput`` fields this target overrides."""
+        return self.model_dump(exclude_none=True)
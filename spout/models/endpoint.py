@@ -1,6 +1,7 @@
 """Models for API endpoint definitions."""
 
 from enum import Enum
+from functools import lru_cache
 from typing import Any, Dict, List, Optional
 
 from pydantic import BaseModel
@@ -77,35 +78,38 @@ class Endpoint(BaseModel):
     @property
     def typescript_method_name(self) -> str:
         """Generate a TypeScript-friendly method name."""
-        # Convert path parameters and method to camelCase
-        method_prefix = self.method.lower()
-
-        generic_parts = ["api", "v1", "v2", "v3", "v4", "v5"]
-
-        def exclude_part(part: str) -> bool:
-            fast_style = part.startswith("{") and part.endswith("}")
-            django_style = part.startswith("<") and part.endswith(">")
-            generic_style = part.lower() in generic_parts
-            return fast_style or django_style or generic_style
-
-        path_parts = [
-            part for part in self.path.split("/") if part and not exclude_part(part)
-        ]
-
-        if not path_parts:
-            return method_prefix
-        print("path_parts before:", path_parts)
-
-        # Convert kebab-case to camelCase
-        camel_parts = []
-        print("path_parts:", path_parts)
-        for part in path_parts:
-            words = part.replace("-", "_").split("_")
-            camel_parts.extend([words[0].lower()] + [w.capitalize() for w in words[1:]])
-        if camel_parts and len(camel_parts) > 1:
-            first = camel_parts[0]
-            if first.endswith("s"):
-                # Plural to singular (basic heuristic)
-                first = first[:-1]
-                camel_parts[0] = first
-        return method_prefix + "".join(word.capitalize() for word in camel_parts)
+        return typescript_method_name(self.method, self.path)
+
+
+GENERIC_PATH_PARTS = frozenset(["api", "v1", "v2", "v3", "v4", "v5"])
+
+
+@lru_cache(maxsize=None)
+def typescript_method_name(method: str, path: str) -> str:
+    """Generate a TypeScript-friendly method name from an HTTP method and path."""
+    # Convert path parameters and method to camelCase
+    method_prefix = method.lower()
+
+    def exclude_part(part: str) -> bool:
+        fast_style = part.startswith("{") and part.endswith("}")
+        django_style = part.startswith("<") and part.endswith(">")
+        generic_style = part.lower() in GENERIC_PATH_PARTS
+        return fast_style or django_style or generic_style
+
+    path_parts = [part for part in path.split("/") if part and not exclude_part(part)]
+
+    if not path_parts:
+        return method_prefix
+
+    # Convert kebab-case to camelCase
+    camel_parts = []
+    for part in path_parts:
+        words = part.replace("-", "_").split("_")
+        camel_parts.extend([words[0].lower()] + [w.capitalize() for w in words[1:]])
+    if camel_parts and len(camel_parts) > 1:
+        first = camel_parts[0]
+        if first.endswith("s"):
+            # Plural to singular (basic heuristic)
+            first = first[:-1]
+            camel_parts[0] = first
+    return method_prefix + "".join(word.capitalize() for word in camel_parts)
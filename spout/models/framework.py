@@ -1,6 +1,6 @@
 """Models for framework information and detection."""
 
-from typing import Any, List, Optional
+from typing import Any, List, Optional, Union
 
 from pydantic import BaseModel
 
@@ -10,7 +10,8 @@ from ..shared.constants import SupportedFramework
 class FrameworkInfo(BaseModel):
     """Information about a detected framework."""
 
-    name: SupportedFramework
+    # Plugin detectors may report frameworks outside SupportedFramework
+    name: Union[SupportedFramework, str]
     version: Optional[str] = None
     entry_point: Optional[str] = None
     config_files: List[str] = []
@@ -0,0 +1,183 @@
+"""
+Compact internal representation of endpoints.
+
+Detectors build these immutable tuples in the parse hot path instead of
+validated pydantic models. Generators read them through the same attribute
+names as the public models, and ``to_model()`` converts to the public
+``Endpoint`` only when a caller asks for it.
+"""
+
+from typing import Any, Dict, List, NamedTuple, Optional, Set, Tuple, Union
+
+from .endpoint import (
+    Endpoint,
+    EndpointParameter,
+    EndpointResponse,
+    typescript_method_name,
+)
+from ..shared.typescript import referenced_type_names
+
+# Key of ``framework_data`` holding an endpoint's client options
+CLIENT_OPTIONS_KEY = "spout"
+
+
+class ParameterIR(NamedTuple):
+    """Internal form of ``EndpointParameter``."""
+
+    name: str
+    type: str
+    python_type: str
+    parameter_type: str
+    required: bool = True
+    default: Any = None
+    description: Optional[str] = None
+
+    def to_model(self) -> EndpointParameter:
+        return EndpointParameter(**self._asdict())
+
+
+class ResponseIR(NamedTuple):
+    """Internal form of ``EndpointResponse``."""
+
+    status_code: int
+    type: str
+    python_type: str
+    description: Optional[str] = None
+
+    def to_model(self) -> EndpointResponse:
+        return EndpointResponse(**self._asdict())
+
+
+class EndpointIR(NamedTuple):
+    """Internal form of ``Endpoint``."""
+
+    path: str
+    method: str
+    function_name: str
+    parameters: Tuple[ParameterIR, ...] = ()
+    responses: Tuple[ResponseIR, ...] = ()
+    description: Optional[str] = None
+    tags: Tuple[str, ...] = ()
+    deprecated: bool = False
+    file_path: str = ""
+    line_number: int = 0
+    # Options for the generated client, as (name, value) pairs
+    client_options: Tuple[Tuple[str, Any], ...] = ()
+
+    @property
+    def typescript_method_name(self) -> str:
+        """Generate a TypeScript-friendly method name."""
+        return typescript_method_name(self.method, self.path)
+
+    @property
+    def framework_data(self) -> Dict[str, Any]:
+        data: Dict[str, Any] = {
+            "file_path": self.file_path,
+            "line_number": self.line_number,
+        }
+        if self.client_options:
+            data[CLIENT_OPTIONS_KEY] = dict(self.client_options)
+        return data
+
+    def to_model(self) -> Endpoint:
+        """Convert to the public pydantic model."""
+        return Endpoint(
+            path=self.path,
+            method=self.method,
+            function_name=self.function_name,
+            parameters=[p.to_model() for p in self.parameters],
+            responses=[r.to_model() for r in self.responses],
+            description=self.description,
+            tags=list(self.tags),
+            deprecated=self.deprecated,
+            framework_data=self.framework_data,
+        )
+
+    def to_json(self) -> List[Any]:
+        """Serialize to a compact JSON-compatible list."""
+        return [
+            self.path,
+            self.method,
+            self.function_name,
+            [list(p) for p in self.parameters],
+            [list(r) for r in self.responses],
+            self.description,
+            list(self.tags),
+            self.deprecated,
+            self.file_path,
+            self.line_number,
+            [list(option) for option in self.client_options],
+        ]
+
+    @classmethod
+    def from_json(cls, data: List[Any]) -> "EndpointIR":
+        """Rebuild from the output of ``to_json``."""
+        (
+            path,
+            method,
+            function_name,
+            parameters,
+            responses,
+            description,
+            tags,
+            deprecated,
+            file_path,
+            line_number,
+            client_options,
+        ) = data
+        return cls(
+            path,
+            method,
+            function_name,
+            tuple(ParameterIR(*p) for p in parameters),
+            tuple(ResponseIR(*r) for r in responses),
+            description,
+            tuple(tags),
+            deprecated,
+            file_path,
+            line_number,
+            tuple((name, value) for name, value in client_options),
+        )
+
+
+# Anything generators accept: the public model or its internal form
+AnyEndpoint = Union[Endpoint, EndpointIR]
+
+
+def to_endpoint_model(endpoint: AnyEndpoint) -> Endpoint:
+    """Return the public pydantic model for an endpoint."""
+    if isinstance(endpoint, EndpointIR):
+        return endpoint.to_model()
+    return endpoint
+
+
+class ModelFieldIR(NamedTuple):
+    """A field of a resolved model."""
+
+    name: str
+    type: str
+    required: bool = True
+
+
+class ModelIR(NamedTuple):
+    """
+    A model class resolved from the project source.
+
+    ``kind`` is ``"interface"`` for classes with annotated fields and
+    ``"enum"`` for enumerations, whose TypeScript literals are in ``values``.
+    """
+
+    name: str
+    kind: str = "interface"
+    fields: Tuple[ModelFieldIR, ...] = ()
+    bases: Tuple[str, ...] = ()
+    values: Tuple[str, ...] = ()
+    file_path: str = ""
+
+    @property
+    def references(self) -> Set[str]:
+        """Names of the other models this one depends on."""
+        names = set(self.bases)
+        for field in self.fields:
+            names |= referenced_type_names(field.type)
+        return names
@@ -0,0 +1,497 @@
+"""Long-running daemon answering Spout requests over JSON-RPC."""
+
+import hmac
+import inspect
+import json
+import logging
+import os
+import secrets
+import socket
+import socketserver
+import threading
+import time
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Set, Tuple, Union
+
+from . import __version__
+from .core import SpoutGenerator
+from .models.cli_input import GenerateInput
+from .models.ir import AnyEndpoint
+from .shared.cache import CACHE_DIR_NAME
+from .watch import group_by_file, open_change_source, refresh_files
+
+logger = logging.getLogger(__name__)
+
+# Seconds without a request before the daemon exits
+DEFAULT_IDLE_TIMEOUT = 900.0
+
+SOCKET_NAME = "spout.sock"
+
+# Holds the token TCP clients must send, readable by the owner only
+TOKEN_NAME = "spout.token"
+
+# JSON-RPC 2.0 error codes
+PARSE_ERROR = -32700
+INVALID_REQUEST = -32600
+METHOD_NOT_FOUND = -32601
+INVALID_PARAMS = -32602
+SERVER_ERROR = -32000
+UNAUTHORIZED = -32001
+
+# Options a generate request may override
+GENERATE_OPTIONS = frozenset(
+    (
+        "output_path",
+        "client_type",
+        "base_url",
+        "include_types",
+        "engine",
+        "split_by",
+        "dedupe",
+        "batch_path",
+        "max_concurrency",
+        "cache_ttl",
+        "timeout",
+        "retries",
+        "style",
+    )
+)
+
+Address = Union[str, Tuple[str, int]]
+
+
+def default_socket_path(project_path: Path) -> Path:
+    """Return the socket a daemon for ``project_path`` listens on by default."""
+    return project_path / CACHE_DIR_NAME / SOCKET_NAME
+
+
+def default_token_path(project_path: Path) -> Path:
+    """Return the token file of a TCP daemon for ``project_path``."""
+    return project_path / CACHE_DIR_NAME / TOKEN_NAME
+
+
+class DaemonError(Exception):
+    """Error returned by a daemon for a failed request."""
+
+    def __init__(self, message: str, code: int = SERVER_ERROR):
+        super().__init__(message)
+        self.code = code
+
+
+class ProjectSession:
+    """
+    Warm state of one project shared by all daemon requests.
+
+    The detector, index, symbols and parsed endpoints live in a single
+    ``SpoutGenerator``; every request and every refresh holds ``lock``, so
+    concurrent clients see a consistent snapshot of the project.
+    """
+
+    def __init__(self, input_data: GenerateInput):
+        self.input_data = input_data
+        self.lock = threading.RLock()
+        self.spout = SpoutGenerator(input_data)
+        self.file_endpoints: Optional[Dict[str, List[AnyEndpoint]]] = None
+
+    def warm(self) -> SpoutGenerator:
+        """Parse the project if needed and return its generator."""
+        with self.lock:
+            if self.file_endpoints is None:
+                self.file_endpoints = group_by_file(self.spout.parsed_endpoints)
+            return self.spout
+
+    def refresh(self, changed: Set[Path]) -> None:
+        """
+        Invalidate the state derived from changed files.
+
+        Changed files are rescanned and reparsed in place; everything built
+        from the full endpoint list is dropped and rebuilt on next use.
+        """
+        with self.lock:
+            if self.file_endpoints is None:
+                # Nothing parsed yet (or detection failed): start over
+                self.reset()
+                return
+            spout = self.spout
+            refresh_files(spout, self.file_endpoints, changed)
+            spout._parsed_endpoints = [
+                e for endpoints in self.file_endpoints.values() for e in endpoints
+            ]
+            spout._endpoints = None
+            spout._models = None
+            spout._generator = None
+            framework_info = spout.detector.detect(self.input_data.path, spout.index)
+            if framework_info is None:
+                # The framework is gone: detect from scratch on next use
+                self.reset()
+                return
+            spout._framework_info = framework_info
+
+    def reset(self) -> None:
+        """Drop all warm state; the next request parses the project again."""
+        with self.lock:
+            self.spout = SpoutGenerator(self.input_data)
+            self.file_endpoints = None
+
+
+class SpoutDaemon:
+    """
+    Serve ``detect``, ``endpoints`` and ``generate`` from warm project state.
+
+    Requests are newline-delimited JSON-RPC 2.0 messages on a Unix socket or
+    a localhost TCP port, one connection thread per client. The socket is
+    only accessible to its owner; on TCP, which any local user can reach,
+    every request must carry the ``token`` written to
+    ``.spout_cache/spout.token`` with the same permissions. A housekeeping
+    thread polls the project for changed files, refreshing the session, and
+    stops the server once no request arrives for ``idle_timeout`` seconds.
+    """
+
+    def __init__(
+        self,
+        input_data: GenerateInput,
+        idle_timeout: Optional[float] = DEFAULT_IDLE_TIMEOUT,
+        interval: float = 0.5,
+    ):
+        """
+        Initialize the daemon.
+
+        Args:
+            input_data: Project and default generate options
+            idle_timeout: Seconds without requests before shutting down;
+                None to run until stopped
+            interval: Seconds between checks for changed files
+        """
+        self.session = ProjectSession(input_data)
+        self.idle_timeout = idle_timeout
+        self.interval = interval
+        self.address: Optional[Address] = None
+        # Required of every request when serving on TCP
+        self.token: Optional[str] = None
+        self.ready = threading.Event()
+        self.last_activity = time.monotonic()
+        self._server: Optional[socketserver.BaseServer] = None
+        self._stopped = threading.Event()
+        self._methods: Dict[str, Callable[..., Any]] = {
+            "ping": self.ping,
+            "detect": self.detect,
+            "endpoints": self.endpoints,
+            "generate": self.generate,
+            "shutdown": self.shutdown,
+        }
+
+    def ping(self) -> Dict[str, Any]:
+        """Report that the daemon is alive."""
+        return {"version": __version__, "pid": os.getpid()}
+
+    def detect(self) -> Dict[str, Any]:
+        """Return the detected framework."""
+        with self.session.lock:
+            spout = self.session.warm()
+            return spout.framework_info.model_dump(mode="json")
+
+    def endpoints(self) -> List[Dict[str, Any]]:
+        """Return every endpoint of the project."""
+        with self.session.lock:
+            spout = self.session.warm()
+            return [e.model_dump(mode="json") for e in spout.endpoints]
+
+    def generate(self, **options: Any) -> Dict[str, Any]:
+        """
+        Generate a client, overriding the daemon's default options.
+
+        A relative ``output_path`` is resolved against the project
+        directory and must stay inside it. Without any ``output_path`` the
+        code is returned instead of written.
+
+        Returns:
+            ``{"code": ...}``, or ``{"written": ..., "paths": [...]}`` when
+            the client was written to disk
+        """
+        unknown = set(options) - GENERATE_OPTIONS
+        if unknown:
+            names = ", ".join(sorted(unknown))
+            raise DaemonError(f"Unknown options: {names}", INVALID_PARAMS)
+
+        with self.session.lock:
+            base = self.session.warm()
+            spout = base.derive(**options)
+            if not spout.input_data.output_path:
+                return {"code": spout.generate_client()}
+
+            root = self.session.input_data.path.resolve()
+            output_path = (root / spout.input_data.output_path).resolve()
+            if root not in output_path.parents:
+                raise DaemonError(
+                    f"output_path must be inside the project: {output_path}",
+                    INVALID_PARAMS,
+                )
+            split_by = spout.input_data.split_by
+            if split_by:
+                if output_path.suffix == ".ts":
+                    output_path = output_path.with_suffix("")
+                paths = spout.write_split_client(output_path, split_by)
+                written = bool(paths)
+            else:
+                written = spout.write_client(output_path)
+                paths = [output_path] if written else []
+            # Keep what the request resolved for the next one
+            if base._models is None and spout._models is not None:
+                if spout.input_data.include_types == base.input_data.include_types:
+                    base._models = spout._models
+            return {"written": written, "paths": [str(p) for p in paths]}
+
+    def shutdown(self) -> bool:
+        """Stop serving once the current request has been answered."""
+        self._stopped.set()
+        if self._server is not None:
+            threading.Thread(target=self._server.shutdown, daemon=True).start()
+        return True
+
+    def dispatch(self, raw: bytes) -> bytes:
+        """
+        Answer one JSON-RPC request.
+
+        Args:
+            raw: The encoded request
+
+        Returns:
+            The encoded response
+        """
+        self.last_activity = time.monotonic()
+        try:
+            request = json.loads(raw)
+        except ValueError as e:
+            return self._error(None, PARSE_ERROR, f"Parse error: {e}")
+        if not isinstance(request, dict) or not isinstance(
+            request.get("method"), str
+        ):
+            return self._error(None, INVALID_REQUEST, "Invalid request")
+
+        request_id = request.get("id")
+        if self.token is not None and not hmac.compare_digest(
+            str(request.get("token", "")), self.token
+        ):
+            return self._error(request_id, UNAUTHORIZED, "Invalid or missing token")
+        method = self._methods.get(request["method"])
+        if method is None:
+            return self._error(
+                request_id, METHOD_NOT_FOUND, f"Unknown method: {request['method']}"
+            )
+        params = request.get("params") or {}
+        if not isinstance(params, dict):
+            return self._error(request_id, INVALID_PARAMS, "params must be an object")
+
+        try:
+            inspect.signature(method).bind(**params)
+        except TypeError as e:
+            return self._error(request_id, INVALID_PARAMS, str(e))
+
+        try:
+            result = method(**params)
+        except DaemonError as e:
+            return self._error(request_id, e.code, str(e))
+        except Exception as e:  # Answer instead of dropping the connection
+            return self._error(request_id, SERVER_ERROR, str(e))
+        finally:
+            self.last_activity = time.monotonic()
+        return self._encode({"jsonrpc": "2.0", "id": request_id, "result": result})
+
+    def _error(self, request_id: Any, code: int, message: str) -> bytes:
+        error = {"code": code, "message": message}
+        return self._encode({"jsonrpc": "2.0", "id": request_id, "error": error})
+
+    @staticmethod
+    def _encode(message: Dict[str, Any]) -> bytes:
+        return json.dumps(message).encode() + b"\n"
+
+    def serve(
+        self, socket_path: Optional[Path] = None, port: Optional[int] = None
+    ) -> None:
+        """
+        Serve requests until shut down or idle.
+
+        Args:
+            socket_path: Unix socket to listen on; defaults to
+                ``.spout_cache/spout.sock`` in the project
+            port: Listen on this localhost TCP port instead (0 picks a
+                free one); requests must then carry the token written to
+                ``.spout_cache/spout.token``
+
+        Raises:
+            OSError: If the address is in use by a running daemon
+        """
+        daemon = self
+
+        class Handler(socketserver.StreamRequestHandler):
+            def handle(self) -> None:
+                for line in self.rfile:
+                    if line.strip():
+                        self.wfile.write(daemon.dispatch(line))
+                        self.wfile.flush()
+
+        token_path = default_token_path(self.session.input_data.path)
+        if port is not None:
+            server: socketserver.BaseServer = _TCPServer(("127.0.0.1", port), Handler)
+            self.token = secrets.token_urlsafe(32)
+            _write_private(token_path, self.token)
+        else:
+            if socket_path is None:
+                socket_path = default_socket_path(self.session.input_data.path)
+            _claim_socket(socket_path)
+            # Owner-only from the moment it is bound, not after a chmod
+            umask = os.umask(0o177)
+            try:
+                server = _UnixServer(str(socket_path), Handler)
+            finally:
+                os.umask(umask)
+
+        self._server = server
+        self.address = server.server_address
+        self.last_activity = time.monotonic()
+        housekeeping = threading.Thread(target=self._housekeep, daemon=True)
+        housekeeping.start()
+        self.ready.set()
+        try:
+            server.serve_forever(poll_interval=min(self.interval, 0.5))
+        finally:
+            self._stopped.set()
+            server.server_close()
+            housekeeping.join()
+            if port is not None:
+                token_path.unlink(missing_ok=True)
+            elif socket_path is not None:
+                socket_path.unlink(missing_ok=True)
+
+    def _housekeep(self) -> None:
+        """Warm the session, refresh changed files and stop once idle."""
+        with self.session.lock:
+            source = open_change_source(self.session.spout)
+            try:
+                self.session.warm()
+            except ValueError:
+                # No framework yet; requests report it until files change
+                pass
+        try:
+            while not self._stopped.wait(self.interval):
+                changed = source.poll()
+                if changed:
+                    try:
+                        self.session.refresh(changed)
+                    except Exception:
+                        # Keep serving; the next request parses from scratch
+                        logger.exception("Could not refresh changed files")
+                        self.session.reset()
+                idle = time.monotonic() - self.last_activity
+                if self.idle_timeout is not None and idle > self.idle_timeout:
+                    self.shutdown()
+        finally:
+            source.close()
+
+
+class _TCPServer(socketserver.ThreadingTCPServer):
+    daemon_threads = True
+    allow_reuse_address = True
+
+
+if hasattr(socketserver, "ThreadingUnixStreamServer"):
+
+    class _UnixServer(socketserver.ThreadingUnixStreamServer):
+        daemon_threads = True
+
+
+def _write_private(path: Path, content: str) -> None:
+    """Write ``content`` to a file only its owner can read."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.unlink(missing_ok=True)
+    fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o600)
+    with os.fdopen(fd, "w") as f:
+        f.write(content)
+
+
+def _claim_socket(socket_path: Path) -> None:
+    """Remove a stale socket file, refusing if a daemon still answers on it."""
+    socket_path.parent.mkdir(parents=True, exist_ok=True)
+    if not socket_path.exists():
+        return
+    probe = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    try:
+        probe.connect(str(socket_path))
+    except OSError:
+        socket_path.unlink()
+    else:
+        raise OSError(f"A daemon is already listening on {socket_path}")
+    finally:
+        probe.close()
+
+
+class DaemonClient:
+    """Thin client sending one request per connection to a running daemon."""
+
+    def __init__(
+        self,
+        socket_path: Optional[Path] = None,
+        port: Optional[int] = None,
+        timeout: float = 60.0,
+        token: Optional[str] = None,
+    ):
+        """
+        Initialize the client.
+
+        Args:
+            socket_path: Unix socket of the daemon
+            port: Localhost TCP port of the daemon, used instead of a socket
+            timeout: Seconds to wait for a response
+            token: Token a TCP daemon requires, from its ``spout.token``
+        """
+        if socket_path is None and port is None:
+            raise ValueError("Either socket_path or port is required")
+        self.socket_path = socket_path
+        self.port = port
+        self.timeout = timeout
+        self.token = token
+        self._next_id = 0
+
+    def _connect(self) -> socket.socket:
+        if self.port is not None:
+            return socket.create_connection(("127.0.0.1", self.port), self.timeout)
+        sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        sock.settimeout(self.timeout)
+        try:
+            sock.connect(str(self.socket_path))
+        except OSError:
+            sock.close()
+            raise
+        return sock
+
+    def call(self, method: str, **params: Any) -> Any:
+        """
+        Call a daemon method.
+
+        Returns:
+            The method's result
+
+        Raises:
+            DaemonError: If the daemon answered with an error
+            OSError: If the daemon could not be reached
+        """
+        self._next_id += 1
+        request = {
+            "jsonrpc": "2.0",
+            "id": self._next_id,
+            "method": method,
+            "params": params,
+        }
+        if self.token is not None:
+            request["token"] = self.token
+        with self._connect() as sock:
+            sock.sendall(json.dumps(request).encode() + b"\n")
+            with sock.makefile("rb") as stream:
+                line = stream.readline()
+        if not line:
+            raise DaemonError("Daemon closed the connection")
+        response = json.loads(line)
+        if "error" in response:
+            error = response["error"]
+            raise DaemonError(error["message"], error["code"])
+        return response["result"]
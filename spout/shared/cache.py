@@ -0,0 +1,128 @@
+"""Persistent on-disk cache for parsed endpoints."""
+
+import hashlib
+import json
+import os
+import shutil
+from pathlib import Path
+from typing import Any, List, Optional
+
+from .. import __version__
+
+CACHE_DIR_NAME = ".spout_cache"
+
+# Bump when the serialized entry layout changes
+CACHE_FORMAT = "4"
+
+
+class ParseCache:
+    """
+    Content-addressed cache of parse results.
+
+    Entries are stored as one JSON file per source file under
+    ``<cache_dir>/parse``. Keys combine the Spout version, the parser
+    namespace, the source path and a hash of the source content, so any
+    edit or upgrade naturally misses. The least recently used entries are
+    evicted once the cache exceeds ``max_entries`` or ``max_bytes``.
+    """
+
+    def __init__(
+        self,
+        cache_dir: Path,
+        max_entries: int = 5000,
+        max_bytes: int = 64 * 1024 * 1024,
+    ):
+        self.cache_dir = cache_dir
+        self.entries_dir = cache_dir / "parse"
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self._writes = 0
+
+    @classmethod
+    def for_project(cls, project_path: Path) -> "ParseCache":
+        """Return the cache stored inside the given project."""
+        return cls(project_path / CACHE_DIR_NAME)
+
+    def key(self, namespace: str, file_path: Path, content: str) -> str:
+        """Build the cache key for a source file."""
+        digest = hashlib.sha256()
+        for part in (__version__, CACHE_FORMAT, namespace, str(file_path), content):
+            digest.update(part.encode("utf-8"))
+            digest.update(b"\0")
+        return digest.hexdigest()
+
+    def get(self, key: str) -> Optional[List[Any]]:
+        """Return the cached payload for ``key``, or None on a miss."""
+        entry = self._entry_path(key)
+        try:
+            with open(entry, "r", encoding="utf-8") as f:
+                payload = json.load(f)
+        except (OSError, ValueError):
+            self.misses += 1
+            return None
+
+        self.hits += 1
+        try:
+            os.utime(entry)  # Refresh recency for LRU eviction
+        except OSError:
+            pass
+        return payload
+
+    def set(self, key: str, payload: List[Any]) -> None:
+        """Store ``payload`` under ``key``."""
+        entry = self._entry_path(key)
+        try:
+            entry.parent.mkdir(parents=True, exist_ok=True)
+            tmp = entry.with_suffix(".tmp")
+            with open(tmp, "w", encoding="utf-8") as f:
+                json.dump(payload, f, separators=(",", ":"))
+            os.replace(tmp, entry)
+            self._writes += 1
+        except OSError:
+            pass
+
+    def clear(self) -> None:
+        """Remove every cached entry."""
+        shutil.rmtree(self.cache_dir, ignore_errors=True)
+
+    def prune(self) -> int:
+        """
+        Evict least recently used entries until the cache is within bounds.
+
+        Returns:
+            Number of evicted entries
+        """
+        if not self._writes or not self.entries_dir.exists():
+            return 0
+
+        entries = []
+        total_bytes = 0
+        for entry in self.entries_dir.glob("*/*.json"):
+            try:
+                stat = entry.stat()
+            except OSError:
+                continue
+            entries.append((stat.st_mtime, stat.st_size, entry))
+            total_bytes += stat.st_size
+
+        entries.sort()
+        remaining = len(entries)
+        evicted = 0
+        for _, size, entry in entries:
+            if remaining <= self.max_entries and total_bytes <= self.max_bytes:
+                break
+            try:
+                entry.unlink()
+            except OSError:
+                continue
+            remaining -= 1
+            total_bytes -= size
+            evicted += 1
+
+        self._writes = 0
+        return evicted
+
+    def _entry_path(self, key: str) -> Path:
+        return self.entries_dir / key[:2] / f"{key}.json"
@@ -10,3 +10,53 @@ class SupportedFramework(str, Enum):
     DRF = "djangorestframework"
     FLASK = "flask"
     TORNADO = "tornado"
+
+
+# Detection confidence is capped here
+MAX_CONFIDENCE = 1.0
+
+# How endpoints can be grouped into modules for split client output
+SPLIT_MODES = ("tag", "file", "prefix")
+
+# Output styles: an ApiClient class, or one exported function per endpoint
+STYLES = ("class", "functions")
+
+# camelCase keys of a target object in spout.config.json
+TARGET_CONFIG_KEYS = {
+    "clientType": "client_type",
+    "outputPath": "output_path",
+    "includeTypes": "include_types",
+    "baseUrl": "base_url",
+    "engine": "engine",
+    "splitBy": "split_by",
+    "dedupe": "dedupe",
+    "batchPath": "batch_path",
+    "maxConcurrency": "max_concurrency",
+    "cacheTtl": "cache_ttl",
+    "timeout": "timeout",
+    "retries": "retries",
+    "style": "style",
+}
+
+# Directories never descended into when scanning a project
+DEFAULT_EXCLUDED_DIRS = frozenset(
+    {
+        ".git",
+        ".hg",
+        ".svn",
+        ".venv",
+        "venv",
+        ".tox",
+        ".nox",
+        ".eggs",
+        ".mypy_cache",
+        ".pytest_cache",
+        ".ruff_cache",
+        ".spout_cache",
+        "__pycache__",
+        "node_modules",
+        "site-packages",
+        "build",
+        "dist",
+    }
+)
@@ -0,0 +1,283 @@
+"""Manifests recording what a generated client was built from."""
+
+import hashlib
+import json
+import os
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Dict, Iterable, List, Optional, Tuple
+
+from .. import __version__
+from .utils import WRITE_BUFFER_SIZE, write_atomic
+
+if TYPE_CHECKING:
+    from ..models.cli_input import GenerateInput
+
+# Bump when the manifest layout changes
+MANIFEST_FORMAT = "1"
+
+# (size, mtime_ns, sha256 hex digest)
+FileStamp = Tuple[int, int, str]
+
+# GenerateInput fields that shape the generated client
+KEY_OPTIONS = (
+    "project_path",
+    "config",
+    "client_type",
+    "include_types",
+    "engine",
+    "split_by",
+    "base_url",
+    "dedupe",
+    "batch_path",
+    "max_concurrency",
+    "cache_ttl",
+    "timeout",
+    "retries",
+    "style",
+)
+
+
+def manifest_path(output_path: Path) -> Path:
+    """Return where the manifest of a client file or directory is kept."""
+    return output_path.with_name(f".{output_path.name}.spout.json")
+
+
+def manifest_key(options: Dict[str, Any]) -> str:
+    """
+    Hash the Spout version and the options that shape the output.
+
+    Args:
+        options: Generation options; only ``KEY_OPTIONS`` are used
+    """
+    key_options = {name: options.get(name) for name in KEY_OPTIONS}
+    key_options["project_path"] = str(key_options["project_path"])
+    key_options["config"] = key_options["config"] or {}
+    data = json.dumps(
+        {"version": __version__, "format": MANIFEST_FORMAT, "options": key_options},
+        sort_keys=True,
+        default=str,
+    )
+    return hashlib.sha256(data.encode("utf-8")).hexdigest()
+
+
+def input_key(input_data: "GenerateInput") -> str:
+    """Hash the validated options of one output, see ``manifest_key``."""
+    return manifest_key({name: getattr(input_data, name) for name in KEY_OPTIONS})
+
+
+def outputs_current(
+    project_path: Path, names: List[str], outputs: Iterable[Tuple[Path, str]]
+) -> bool:
+    """
+    Return whether every output's manifest still matches the project.
+
+    Args:
+        project_path: Project the outputs were generated from
+        names: Source files the project currently consists of, as
+            ``/``-separated paths relative to ``project_path``
+        outputs: Client file or directory of each output, with its key
+    """
+    return not stale_outputs(project_path, names, outputs)
+
+
+def stale_outputs(
+    project_path: Path, names: List[str], outputs: Iterable[Tuple[Path, str]]
+) -> List[int]:
+    """
+    Return the positions of the outputs whose manifest no longer matches.
+
+    Args:
+        project_path: Project the outputs were generated from
+        names: Source files the project currently consists of, as
+            ``/``-separated paths relative to ``project_path``
+        outputs: Client file or directory of each output, with its key
+    """
+    stale = []
+    for i, (location, key) in enumerate(outputs):
+        manifest = OutputManifest.load(manifest_path(location))
+        if manifest is None or not manifest.is_current(key, project_path, names):
+            stale.append(i)
+    return stale
+
+
+def hash_file(file_path: Path) -> Optional[str]:
+    """Return the SHA-256 hex digest of a file, or None if it is unreadable."""
+    try:
+        digest = hashlib.sha256()
+        with open(file_path, "rb") as f:
+            for block in iter(lambda: f.read(WRITE_BUFFER_SIZE), b""):
+                digest.update(block)
+        return digest.hexdigest()
+    except OSError:
+        return None
+
+
+def stamp_file(
+    file_path: Path, expected: Optional[Tuple[int, int]] = None
+) -> Optional[FileStamp]:
+    """
+    Stat and hash a file.
+
+    Args:
+        file_path: File to stamp
+        expected: Size and mtime the file had when it was read; if it has
+            changed since, the digest is left empty so the stamp never
+            matches the file's current content
+
+    Returns:
+        The stamp, or None if the file is gone
+    """
+    try:
+        stat = os.stat(file_path)
+    except OSError:
+        return None
+    current = (stat.st_size, stat.st_mtime_ns)
+    if expected is not None and expected != current:
+        return (*expected, "")
+    return (*current, hash_file(file_path) or "")
+
+
+def _matches(file_path: str, stamp: FileStamp) -> Tuple[bool, Optional[FileStamp]]:
+    """
+    Check a file against its recorded stamp.
+
+    The file is only hashed when its size and mtime no longer match, so a
+    touched but unchanged file still matches.
+
+    Returns:
+        Whether the content matches, and the refreshed stamp if it was hashed
+    """
+    try:
+        stat = os.stat(file_path)
+    except OSError:
+        return False, None
+    size, mtime_ns, digest = stamp
+    if (stat.st_size, stat.st_mtime_ns) == (size, mtime_ns):
+        return True, None
+    if stat.st_size != size or not digest or hash_file(file_path) != digest:
+        return False, None
+    return True, (size, stat.st_mtime_ns, digest)
+
+
+class OutputManifest:
+    """
+    Record of the inputs and outputs of one generated client.
+
+    The manifest holds a key hashing the Spout version and generation
+    options, plus a stamp of every project source file and every written
+    output file. A later run whose key, file list and file contents all
+    match can skip detection, parsing and generation entirely.
+    """
+
+    def __init__(
+        self,
+        path: Path,
+        key: str,
+        inputs: Dict[str, FileStamp],
+        outputs: Dict[str, FileStamp],
+    ):
+        self.path = path
+        self.key = key
+        self.inputs = inputs
+        self.outputs = outputs
+
+    @classmethod
+    def load(cls, path: Path) -> Optional["OutputManifest"]:
+        """Read a manifest, returning None if it is missing or unreadable."""
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+            return cls(
+                path,
+                data["key"],
+                {name: tuple(stamp) for name, stamp in data["inputs"].items()},
+                {name: tuple(stamp) for name, stamp in data["outputs"].items()},
+            )
+        except (OSError, ValueError, KeyError, AttributeError, TypeError):
+            return None
+
+    @classmethod
+    def build(
+        cls,
+        path: Path,
+        key: str,
+        project_path: Path,
+        inputs: Iterable[Tuple[Path, Optional[Tuple[int, int]]]],
+        outputs: Iterable[Path],
+    ) -> "OutputManifest":
+        """
+        Stamp the inputs a client was generated from and the files written.
+
+        Args:
+            path: Where the manifest will be saved
+            key: Hash of the generation options
+            project_path: Directory input paths are recorded relative to
+            inputs: Source files with the size and mtime they were read at
+            outputs: Every file of the generated client
+        """
+        input_stamps = {}
+        for file_path, read_stat in inputs:
+            stamp = stamp_file(file_path, read_stat)
+            if stamp is not None:
+                input_stamps[_relative(file_path, project_path)] = stamp
+        output_stamps = {}
+        for file_path in outputs:
+            stamp = stamp_file(file_path)
+            if stamp is not None:
+                output_stamps[_relative(file_path, path.parent)] = stamp
+        return cls(path, key, input_stamps, output_stamps)
+
+    def is_current(self, key: str, project_path: Path, names: List[str]) -> bool:
+        """
+        Return whether the recorded output still matches the project.
+
+        Stamps of files that were touched without changing are refreshed
+        and the manifest rewritten, so they are not hashed again next time.
+
+        Args:
+            key: Hash of the current generation options
+            project_path: Directory input paths are recorded relative to
+            names: Source files the project currently consists of, as
+                ``/``-separated paths relative to ``project_path``
+        """
+        if key != self.key or len(names) != len(self.inputs):
+            return False
+
+        checks = [(self.inputs, str(project_path), name) for name in names]
+        checks += [(self.outputs, str(self.path.parent), o) for o in self.outputs]
+
+        refreshed = False
+        for stamps, base, name in checks:
+            stamp = stamps.get(name)
+            if stamp is None:
+                return False
+            matches, updated = _matches(os.path.join(base, name), stamp)
+            if not matches:
+                return False
+            if updated is not None:
+                stamps[name] = updated
+                refreshed = True
+
+        if refreshed:
+            self.save()
+        return True
+
+    def save(self) -> None:
+        """Write the manifest atomically; failures only cost the next skip."""
+        data = {
+            "format": MANIFEST_FORMAT,
+            "key": self.key,
+            "inputs": self.inputs,
+            "outputs": self.outputs,
+        }
+        try:
+            write_atomic(self.path, [json.dumps(data, separators=(",", ":"))])
+        except OSError:
+            pass
+
+
+def _relative(file_path: Path, base: Path) -> str:
+    try:
+        return file_path.relative_to(base).as_posix()
+    except ValueError:
+        return str(file_path)
@@ -0,0 +1,120 @@
+"""Discovery of detector and generator plugins from package entry points."""
+
+import json
+import os
+import sys
+from functools import lru_cache
+from pathlib import Path
+from typing import Dict, Optional
+
+from .utils import write_atomic
+
+# Entry point groups plugins register under
+DETECTOR_GROUP = "spout.detectors"
+GENERATOR_GROUP = "spout.generators"
+PLUGIN_GROUPS = (DETECTOR_GROUP, GENERATOR_GROUP)
+
+# Path of the discovery cache; an empty value disables caching
+CACHE_ENV = "SPOUT_PLUGIN_CACHE"
+
+# Bump when the layout of the cache file changes
+CACHE_FORMAT = "1"
+
+# group -> plugin name -> "module:attribute"
+PluginTargets = Dict[str, Dict[str, str]]
+
+
+def plugin_cache_path() -> Optional[Path]:
+    """Return where discovered plugins are cached, or None if disabled."""
+    configured = os.environ.get(CACHE_ENV)
+    if configured is not None:
+        return Path(configured) if configured else None
+    cache_home = os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache"
+    return Path(cache_home) / "spout" / "plugins.json"
+
+
+def _fingerprint() -> Dict[str, int]:
+    """
+    Identify the installed distributions by their import path directories.
+
+    Installing or removing a distribution adds or deletes its metadata
+    directory, which changes the modification time of the directory on
+    ``sys.path`` holding it. The working directory is left out so the
+    fingerprint does not depend on where spout runs.
+    """
+    cwd = os.getcwd()
+    fingerprint = {}
+    for entry in sys.path:
+        if not entry or os.path.abspath(entry) == cwd:
+            continue
+        try:
+            fingerprint[entry] = os.stat(entry).st_mtime_ns
+        except OSError:
+            continue
+    return fingerprint
+
+
+def _scan_entry_points() -> PluginTargets:
+    from importlib.metadata import entry_points
+
+    plugins: PluginTargets = {group: {} for group in PLUGIN_GROUPS}
+    for group in PLUGIN_GROUPS:
+        for entry_point in entry_points(group=group):
+            target = entry_point.module
+            if entry_point.attr:
+                target = f"{target}:{entry_point.attr}"
+            plugins[group].setdefault(entry_point.name, target)
+    return plugins
+
+
+def discover_plugins(cache_path: Optional[Path] = None) -> PluginTargets:
+    """
+    Find every registered plugin without importing any of them.
+
+    Scanning distribution metadata is slow, so the result is stored in
+    ``cache_path`` together with a fingerprint of the import path and
+    reused until a distribution is installed or removed.
+
+    Args:
+        cache_path: Cache file; nothing is cached when None
+
+    Returns:
+        Module references of the plugins in each entry point group
+    """
+    fingerprint = _fingerprint()
+    if cache_path is not None:
+        try:
+            cached = json.loads(cache_path.read_text())
+            if (
+                cached.get("format") == CACHE_FORMAT
+                and cached.get("executable") == sys.executable
+                and cached.get("fingerprint") == fingerprint
+            ):
+                return cached["plugins"]
+        except (OSError, ValueError, KeyError, AttributeError):
+            pass
+
+    plugins = _scan_entry_points()
+    if cache_path is not None:
+        data = {
+            "format": CACHE_FORMAT,
+            "executable": sys.executable,
+            "fingerprint": fingerprint,
+            "plugins": plugins,
+        }
+        try:
+            write_atomic(cache_path, [json.dumps(data)])
+        except OSError:
+            pass  # A read-only cache only costs the rescan
+    return plugins
+
+
+@lru_cache(maxsize=None)
+def installed_plugins() -> PluginTargets:
+    """Return the plugins discovered for this process, using the user cache."""
+    return discover_plugins(plugin_cache_path())
+
+
+def plugin_targets(group: str) -> Dict[str, str]:
+    """Return the plugins registered under one entry point group."""
+    return installed_plugins().get(group, {})
@@ -0,0 +1,103 @@
+"""Name-keyed registries whose entries are imported on first use."""
+
+import importlib
+from typing import Any, Callable, Dict, Iterator, Mapping, Optional, Union
+
+# "package.module:attribute", or a callable returning the object
+Target = Union[str, Callable[[], Any]]
+
+
+def load_target(target: Target, package: Optional[str] = None) -> Any:
+    """
+    Import the object a registry target points at.
+
+    Args:
+        target: ``module:attribute`` reference or zero-argument loader
+        package: Anchor for relative module references
+    """
+    if callable(target):
+        return target()
+    module_name, _, attribute = target.partition(":")
+    module = importlib.import_module(module_name, package)
+    return getattr(module, attribute) if attribute else module
+
+
+class LazyRegistry(Mapping[str, Any]):
+    """
+    Mapping of names to objects imported only when looked up.
+
+    Entries are registered as ``module:attribute`` references, in the style
+    of packaging entry points, so listing or checking names never imports
+    the modules behind them. Each entry is loaded once and then cached.
+
+    With a ``group``, plugins published under that entry point group are
+    added the first time the registry is used. Built-in entries keep their
+    names when a plugin uses the same one.
+    """
+
+    def __init__(
+        self,
+        targets: Optional[Dict[str, Target]] = None,
+        package: Optional[str] = None,
+        group: Optional[str] = None,
+    ):
+        """
+        Initialize the registry.
+
+        Args:
+            targets: Initial entries, in registry order
+            package: Anchor for relative module references
+            group: Entry point group to discover plugins from
+        """
+        self.package = package
+        self.group = group
+        self._targets: Dict[str, Target] = dict(targets or {})
+        self._loaded: Dict[str, Any] = {}
+        self._discovered = group is None
+
+    def _discover(self) -> None:
+        if self._discovered:
+            return
+        self._discovered = True
+        from .plugins import plugin_targets
+
+        for name, target in plugin_targets(self.group).items():
+            self._targets.setdefault(name, target)
+
+    def register(self, name: str, target: Target, replace: bool = True) -> None:
+        """
+        Add an entry without importing it.
+
+        Args:
+            name: Registry key
+            target: ``module:attribute`` reference or zero-argument loader
+            replace: Whether to override an existing entry of that name
+        """
+        if not replace and name in self._targets:
+            return
+        self._targets[name] = target
+        self._loaded.pop(name, None)
+
+    def is_loaded(self, name: str) -> bool:
+        return name in self._loaded
+
+    def __getitem__(self, name: str) -> Any:
+        self._discover()
+        if name not in self._loaded:
+            self._loaded[name] = load_target(self._targets[name], self.package)
+        return self._loaded[name]
+
+    def __contains__(self, name: object) -> bool:
+        self._discover()
+        return name in self._targets
+
+    def __iter__(self) -> Iterator[str]:
+        self._discover()
+        return iter(list(self._targets))
+
+    def __len__(self) -> int:
+        self._discover()
+        return len(self._targets)
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({list(self)!r})"
@@ -0,0 +1,126 @@
+"""Lightweight per-phase timing instrumentation."""
+
+import time
+from typing import Any, Dict, Optional
+
+
+class PhaseStats:
+    """Accumulated wall time, call count and counters for one phase."""
+
+    __slots__ = ("name", "seconds", "calls", "counters")
+
+    def __init__(self, name: str):
+        self.name = name
+        self.seconds = 0.0
+        self.calls = 0
+        self.counters: Dict[str, int] = {}
+
+    def add(self, **counters: int) -> None:
+        """Add to this phase's counters (files, bytes, endpoints, ...)."""
+        for key, value in counters.items():
+            self.counters[key] = self.counters.get(key, 0) + value
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {"seconds": self.seconds, "calls": self.calls, **self.counters}
+
+
+class _PhaseTimer:
+    __slots__ = ("stats", "_start")
+
+    def __init__(self, stats: PhaseStats):
+        self.stats = stats
+        self._start = 0.0
+
+    def __enter__(self) -> PhaseStats:
+        self._start = time.perf_counter()
+        return self.stats
+
+    def __exit__(self, *exc: Any) -> None:
+        self.stats.seconds += time.perf_counter() - self._start
+        self.stats.calls += 1
+
+
+class _NullStats:
+    __slots__ = ()
+
+    def add(self, **counters: int) -> None:
+        pass
+
+
+class _NullTimer:
+    __slots__ = ()
+
+    def __enter__(self) -> Any:
+        return _NULL_STATS
+
+    def __exit__(self, *exc: Any) -> None:
+        pass
+
+
+_NULL_STATS = _NullStats()
+_NULL_TIMER = _NullTimer()
+
+
+class Timings:
+    """Recorder holding the stats of every phase, in first-seen order."""
+
+    def __init__(self) -> None:
+        self.phases: Dict[str, PhaseStats] = {}
+
+    def stats(self, name: str) -> PhaseStats:
+        if name not in self.phases:
+            self.phases[name] = PhaseStats(name)
+        return self.phases[name]
+
+    def to_dict(self) -> Dict[str, Dict[str, Any]]:
+        return {name: stats.to_dict() for name, stats in self.phases.items()}
+
+    def format_table(self) -> str:
+        """Render the recorded phases as a human-readable table."""
+        lines = [f"{'Phase':<18} {'Time (ms)':>10} {'Calls':>7}  Details"]
+        for stats in self.phases.values():
+            details = " ".join(f"{k}={v}" for k, v in stats.counters.items())
+            lines.append(
+                f"{stats.name:<18} {stats.seconds * 1000:>10.2f} "
+                f"{stats.calls:>7}  {details}"
+            )
+        return "\n".join(lines)
+
+
+# Active recorder; None keeps every hook a no-op
+_recorder: Optional[Timings] = None
+
+
+def enable() -> Timings:
+    """Start recording timings and return the recorder."""
+    global _recorder
+    _recorder = Timings()
+    return _recorder
+
+
+def disable() -> None:
+    """Stop recording timings."""
+    global _recorder
+    _recorder = None
+
+
+def phase(name: str) -> Any:
+    """
+    Time a block as part of phase ``name``.
+
+    Usage::
+
+        with timing.phase("parse") as stats:
+            stats.add(files=1)
+
+    When recording is disabled this returns a shared no-op context manager.
+    """
+    if _recorder is None:
+        return _NULL_TIMER
+    return _PhaseTimer(_recorder.stats(name))
+
+
+def enabled() -> bool:
+    """Return whether timings are being recorded."""
+    return _recorder is not None
+
@@ -0,0 +1,33 @@
+"""Helpers for working with TypeScript type strings."""
+
+import re
+from typing import Set
+
+# Names that can appear in generated type strings without being a model
+BUILTIN_TYPE_NAMES = frozenset(
+    [
+        "string",
+        "number",
+        "boolean",
+        "any",
+        "object",
+        "null",
+        "undefined",
+        "unknown",
+        "never",
+        "void",
+        "Record",
+        "Array",
+    ]
+)
+
+_IDENTIFIER = re.compile(r"'[^']*'|\b([A-Za-z_$][A-Za-z0-9_$]*)\b")
+
+
+def referenced_type_names(ts_type: str) -> Set[str]:
+    """Return the model names referenced by a TypeScript type string."""
+    return {
+        name
+        for name in _IDENTIFIER.findall(ts_type)
+        if name and name not in BUILTIN_TYPE_NAMES
+    }
@@ -1,5 +1,11 @@
+import hashlib
+import os
 from pathlib import Path
-from typing import Optional
+from typing import Any, Dict, Iterable, Optional, Union
+
+from .constants import TARGET_CONFIG_KEYS
+
+WRITE_BUFFER_SIZE = 1024 * 1024
 
 
 def _read_file_safe(file_path: Path) -> Optional[str]:
@@ -10,7 +16,123 @@ def _read_file_safe(file_path: Path) -> Optional[str]:
         return None
 
 
+def decode_source(data: bytes) -> Optional[str]:
+    """
+    Decode UTF-8 source bytes as ``_read_file_safe`` would read them.
+
+    Returns:
+        The text with universal newlines, or None if it is not UTF-8
+    """
+    try:
+        text = data.decode("utf-8")
+    except UnicodeDecodeError:
+        return None
+    if "\r" in text:
+        text = text.replace("\r\n", "\n").replace("\r", "\n")
+    return text
+
+
+def parse_target_spec(spec: Union[str, Dict[str, Any]]) -> Dict[str, Any]:
+    """
+    Read a ``TYPE:PATH`` target or a configuration file target object.
+
+    Returns:
+        The ``GenerateInput`` fields the target sets
+
+    Raises:
+        ValueError: If the spec is malformed
+    """
+    if isinstance(spec, str):
+        client_type, sep, output_path = spec.partition(":")
+        if not sep or not client_type or not output_path:
+            raise ValueError(f"Target must look like TYPE:PATH, got {spec!r}")
+        return {"client_type": client_type, "output_path": output_path}
+    if not isinstance(spec, dict):
+        raise ValueError(f"Target must be a string or an object, got {spec!r}")
+    unknown = set(spec) - set(TARGET_CONFIG_KEYS)
+    if unknown:
+        raise ValueError(f"Unknown target options: {', '.join(sorted(unknown))}")
+    options = {TARGET_CONFIG_KEYS[key]: value for key, value in spec.items()}
+    for required in ("clientType", "outputPath"):
+        if TARGET_CONFIG_KEYS[required] not in options:
+            raise ValueError(f"Target is missing {required}: {spec!r}")
+    return options
+
+
+def output_location(output_path: Path, split_by: Optional[str]) -> Path:
+    """
+    Return the client file, or for a split client its directory.
+
+    A split client goes into a directory named after ``output_path``
+    without its ``.ts`` suffix.
+    """
+    if split_by and output_path.suffix == ".ts":
+        return output_path.with_suffix("")
+    return output_path
+
+
 def snake_to_camel(snake_str: str) -> str:
     """Convert snake_case string to camelCase."""
     components = snake_str.split("_")
     return components[0] + "".join(x.title() for x in components[1:])
+
+
+def write_if_changed(file_path: Path, content: str) -> bool:
+    """
+    Write ``content`` to ``file_path`` unless it already holds exactly that.
+
+    Returns:
+        True if the file was written
+    """
+    return write_atomic(file_path, [content])
+
+
+def write_atomic(file_path: Path, chunks: Iterable[str]) -> bool:
+    """
+    Stream chunks into ``file_path`` atomically.
+
+    Chunks are written through a buffered handle to a temporary file beside
+    the target, which is then renamed into place. If the result is
+    byte-identical to the existing file, the temporary file is discarded and
+    the target is left untouched.
+
+    Returns:
+        True if the target was replaced
+    """
+    file_path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = file_path.with_name(f".{file_path.name}.{os.getpid()}.tmp")
+    digest = hashlib.sha256()
+    size = 0
+    try:
+        with open(tmp_path, "wb", buffering=WRITE_BUFFER_SIZE) as f:
+            for chunk in chunks:
+                data = chunk.encode("utf-8")
+                digest.update(data)
+                size += len(data)
+                f.write(data)
+
+        if _file_digest(file_path, size) == digest.digest():
+            tmp_path.unlink()
+            return False
+        os.replace(tmp_path, file_path)
+        return True
+    except BaseException:
+        try:
+            tmp_path.unlink()
+        except OSError:
+            pass
+        raise
+
+
+def _file_digest(file_path: Path, expected_size: int) -> Optional[bytes]:
+    """Hash an existing file, skipping the read when its size differs."""
+    try:
+        if file_path.stat().st_size != expected_size:
+            return None
+        digest = hashlib.sha256()
+        with open(file_path, "rb") as f:
+            for block in iter(lambda: f.read(WRITE_BUFFER_SIZE), b""):
+                digest.update(block)
+        return digest.digest()
+    except OSError:
+        return None
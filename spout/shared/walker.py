@@ -0,0 +1,229 @@
+"""Pruning project walker with ignore-file support."""
+
+import os
+import re
+from pathlib import Path
+from typing import Iterable, List, Optional, Pattern, Tuple
+
+from . import timing
+from .constants import DEFAULT_EXCLUDED_DIRS
+
+
+def _translate_glob(pattern: str) -> str:
+    """Translate a gitignore-style glob into a regular expression body."""
+    i, n = 0, len(pattern)
+    res = []
+    while i < n:
+        c = pattern[i]
+        if c == "*":
+            if pattern.startswith("**", i):
+                i += 2
+                if i < n and pattern[i] == "/":
+                    res.append("(?:.*/)?")
+                    i += 1
+                else:
+                    res.append(".*")
+                continue
+            res.append("[^/]*")
+        elif c == "?":
+            res.append("[^/]")
+        elif c == "[":
+            j = pattern.find("]", i + 1)
+            if j == -1:
+                res.append(re.escape(c))
+            else:
+                body = pattern[i + 1 : j]
+                if body.startswith("!"):
+                    body = "^" + body[1:]
+                res.append(f"[{body}]")
+                i = j
+        else:
+            res.append(re.escape(c))
+        i += 1
+    return "".join(res)
+
+
+class IgnoreRules:
+    """
+    Ordered gitignore-style rules.
+
+    Patterns without a slash match a basename at any depth; patterns with a
+    slash are anchored to the project root. A trailing slash restricts the
+    pattern to directories, and ``!`` re-includes a previously ignored path.
+    The last matching rule wins.
+    """
+
+    def __init__(self, patterns: Iterable[str] = ()):
+        self.rules: List[Tuple[Pattern[str], bool, bool, bool]] = []
+        for raw in patterns:
+            self.add(raw)
+
+    @classmethod
+    def from_file(cls, file_path: Path) -> "IgnoreRules":
+        """Load rules from an ignore file, returning no rules if it is missing."""
+        try:
+            lines = file_path.read_text(encoding="utf-8").splitlines()
+        except (OSError, UnicodeDecodeError):
+            lines = []
+        return cls(lines)
+
+    def add(self, raw: str) -> None:
+        """Add a single pattern line."""
+        pattern = raw.strip()
+        if not pattern or pattern.startswith("#"):
+            return
+
+        negate = pattern.startswith("!")
+        if negate:
+            pattern = pattern[1:]
+        dir_only = pattern.endswith("/")
+        pattern = pattern.rstrip("/")
+        anchored = "/" in pattern
+        pattern = pattern.lstrip("/")
+        if not pattern:
+            return
+
+        regex = re.compile(f"^{_translate_glob(pattern)}$")
+        self.rules.append((regex, negate, dir_only, anchored))
+
+    def __bool__(self) -> bool:
+        return bool(self.rules)
+
+    def matches(self, rel_path: str, is_dir: bool) -> bool:
+        """Return whether ``rel_path`` (posix, project-relative) is matched."""
+        matched = False
+        name = rel_path.rsplit("/", 1)[-1]
+        for regex, negate, dir_only, anchored in self.rules:
+            if dir_only and not is_dir:
+                continue
+            if regex.match(rel_path if anchored else name):
+                matched = not negate
+        return matched
+
+
+class ProjectWalker:
+    """
+    Find Python files while pruning excluded directories before descending.
+
+    Directories in ``DEFAULT_EXCLUDED_DIRS``, paths ignored by the project's
+    ``.gitignore`` and paths matching ``exclude`` globs are skipped. When
+    ``include`` globs are given, only Python files matching one of them are
+    returned.
+    """
+
+    def __init__(
+        self,
+        project_path: Path,
+        exclude: Iterable[str] = (),
+        include: Iterable[str] = (),
+        use_gitignore: bool = True,
+    ):
+        self.project_path = project_path
+        self.gitignore = (
+            IgnoreRules.from_file(project_path / ".gitignore")
+            if use_gitignore
+            else IgnoreRules()
+        )
+        self.exclude = IgnoreRules(exclude)
+        self.include = IgnoreRules(include)
+
+        self.files_scanned = 0
+        self.files_pruned = 0
+        self.dirs_pruned = 0
+
+    @classmethod
+    def from_config(
+        cls, project_path: Path, config: Optional[dict] = None
+    ) -> "ProjectWalker":
+        """Build a walker from the ``exclude``/``include`` config keys."""
+        config = config or {}
+        return cls(
+            project_path,
+            exclude=config.get("exclude", []),
+            include=config.get("include", []),
+        )
+
+    def _is_excluded(self, rel_path: str, is_dir: bool) -> bool:
+        return self.gitignore.matches(rel_path, is_dir) or self.exclude.matches(
+            rel_path, is_dir
+        )
+
+    def accepts(self, file_path: Path) -> bool:
+        """Return whether a single Python file would be yielded by ``walk``."""
+        if not file_path.name.endswith(".py"):
+            return False
+        try:
+            parts = file_path.relative_to(self.project_path).parts
+        except ValueError:
+            return False
+
+        for i, name in enumerate(parts[:-1]):
+            if name in DEFAULT_EXCLUDED_DIRS or self._is_excluded(
+                "/".join(parts[: i + 1]), True
+            ):
+                return False
+
+        rel_path = "/".join(parts)
+        if self._is_excluded(rel_path, False):
+            return False
+        return not self.include or self.include.matches(rel_path, False)
+
+    def walk(self) -> List[Path]:
+        """Return the project's Python files in a deterministic order."""
+        return [Path(path) for path, _ in self._timed_walk()]
+
+    def walk_names(self) -> List[str]:
+        """Return ``walk``'s files as ``/``-separated paths below the project."""
+        return [rel_path for _, rel_path in self._timed_walk()]
+
+    def _timed_walk(self) -> List[Tuple[str, str]]:
+        with timing.phase("walk") as stats:
+            python_files = self._walk()
+            stats.add(
+                files=self.files_scanned,
+                dirs_pruned=self.dirs_pruned,
+                files_pruned=self.files_pruned,
+            )
+        return python_files
+
+    def _walk(self) -> List[Tuple[str, str]]:
+        self.files_scanned = self.files_pruned = self.dirs_pruned = 0
+        python_files = []
+        stack = [(str(self.project_path), "")]
+
+        while stack:
+            directory, rel_dir = stack.pop()
+            try:
+                with os.scandir(directory) as it:
+                    entries = sorted(it, key=lambda e: e.name)
+            except OSError:
+                continue
+
+            subdirs = []
+            for entry in entries:
+                rel_path = f"{rel_dir}{entry.name}"
+                try:
+                    is_dir = entry.is_dir(follow_symlinks=False)
+                except OSError:
+                    continue
+
+                if is_dir:
+                    if entry.name in DEFAULT_EXCLUDED_DIRS or self._is_excluded(
+                        rel_path, True
+                    ):
+                        self.dirs_pruned += 1
+                        continue
+                    subdirs.append((entry.path, f"{rel_path}/"))
+                elif entry.name.endswith(".py"):
+                    if self._is_excluded(rel_path, False) or (
+                        self.include and not self.include.matches(rel_path, False)
+                    ):
+                        self.files_pruned += 1
+                        continue
+                    python_files.append((entry.path, rel_path))
+
+            # Reverse so directories are visited in sorted order
+            stack.extend(reversed(subdirs))
+
+        self.files_scanned = len(python_files)
+        return python_files
@@ -0,0 +1,260 @@
+"""Incremental watch mode for keeping a generated client in sync."""
+
+import os
+import threading
+import time
+from pathlib import Path
+from typing import Callable, Dict, List, Optional, Set, Tuple, Union
+
+from .core import SpoutDetector, SpoutGenerator
+from .framework_detectors.symbols import module_name
+from .models.ir import AnyEndpoint
+from .shared.utils import write_if_changed
+from .shared.walker import ProjectWalker
+
+try:
+    from watchdog.events import FileSystemEvent, FileSystemEventHandler
+    from watchdog.observers import Observer
+except ImportError:  # Optional dependency: fall back to polling
+    Observer = None
+
+
+class PollingChangeSource:
+    """Detect changed Python files by comparing stat snapshots."""
+
+    def __init__(self, walker: ProjectWalker):
+        self.walker = walker
+        self._snapshot = self._take_snapshot()
+
+    def _take_snapshot(self) -> Dict[str, Tuple[int, int]]:
+        snapshot = {}
+        for file_path in self.walker.walk():
+            try:
+                stat = file_path.stat()
+            except OSError:
+                continue
+            snapshot[str(file_path)] = (stat.st_mtime_ns, stat.st_size)
+        return snapshot
+
+    def poll(self) -> Set[Path]:
+        """Return files added, modified or removed since the last poll."""
+        current = self._take_snapshot()
+        previous = self._snapshot
+        self._snapshot = current
+        return {
+            Path(p)
+            for p in current.keys() | previous.keys()
+            if current.get(p) != previous.get(p)
+        }
+
+    def close(self) -> None:
+        pass
+
+
+class WatchdogChangeSource:
+    """Collect changed Python files from native filesystem events."""
+
+    def __init__(self, walker: ProjectWalker):
+        self.walker = walker
+        self._changed: Set[Path] = set()
+        self._lock = threading.Lock()
+
+        source = self
+
+        class _Handler(FileSystemEventHandler):
+            def on_any_event(self, event: "FileSystemEvent") -> None:
+                if event.is_directory:
+                    return
+                source._record(event.src_path)
+                dest_path = getattr(event, "dest_path", None)
+                if dest_path:
+                    source._record(dest_path)
+
+        self._observer = Observer()
+        self._observer.schedule(_Handler(), str(walker.project_path), recursive=True)
+        self._observer.start()
+
+    def _record(self, raw_path: str) -> None:
+        file_path = Path(raw_path)
+        if not self.walker.project_path.is_absolute():
+            file_path = Path(os.path.relpath(file_path))
+        if self.walker.accepts(file_path):
+            with self._lock:
+                self._changed.add(file_path)
+
+    def poll(self) -> Set[Path]:
+        """Return files reported changed since the last poll."""
+        with self._lock:
+            changed, self._changed = self._changed, set()
+        return changed
+
+    def close(self) -> None:
+        self._observer.stop()
+        self._observer.join()
+
+
+def open_change_source(
+    spout: SpoutDetector,
+) -> Union[PollingChangeSource, WatchdogChangeSource]:
+    """Watch a project with native events if available, else by polling."""
+    walker = spout.index.walker or ProjectWalker(spout.input_data.path)
+    if Observer is not None:
+        return WatchdogChangeSource(walker)
+    return PollingChangeSource(walker)
+
+
+def group_by_file(endpoints: List[AnyEndpoint]) -> Dict[str, List[AnyEndpoint]]:
+    """Group endpoints by the source file that defines them."""
+    file_endpoints: Dict[str, List[AnyEndpoint]] = {}
+    for endpoint in endpoints:
+        file_path = endpoint.framework_data.get("file_path", "")
+        file_endpoints.setdefault(file_path, []).append(endpoint)
+    return file_endpoints
+
+
+def refresh_files(
+    spout: SpoutDetector,
+    file_endpoints: Dict[str, List[AnyEndpoint]],
+    changed: Set[Path],
+) -> List[str]:
+    """
+    Bring a project's index, symbols and per-file endpoints up to date.
+
+    Changed files are rescanned and, if they still use the detected
+    framework, reparsed; removed files and files that no longer use it
+    are dropped from ``file_endpoints``.
+
+    Args:
+        spout: Detector holding the warm project state
+        file_endpoints: Endpoints per source file, updated in place
+        changed: Files added, modified or removed
+
+    Returns:
+        The files that were reparsed
+    """
+    detector = spout.detector
+    index = spout.index
+    symbols = spout.symbols
+    key = detector.framework.value
+
+    reparsed = []
+    for file_path in sorted(changed):
+        scanned = index.update(file_path) if file_path.exists() else None
+        if scanned is None:
+            index.remove(file_path)
+            symbols.remove(file_path)
+        else:
+            module = module_name(index.project_path, file_path)
+            symbols.update(module, file_path, scanned.content)
+
+        if scanned is None or not (
+            key in scanned.imports or key in scanned.instantiations
+        ):
+            file_endpoints.pop(str(file_path), None)
+            continue
+
+        file_endpoints[str(file_path)] = detector._parse_source(
+            file_path, scanned.content
+        )
+        reparsed.append(str(file_path))
+    return reparsed
+
+
+class SpoutWatcher:
+    """
+    Keep a generated client in sync with its source project.
+
+    Endpoints and their rendered methods are kept in memory per source file.
+    When files change only those files are rescanned and reparsed, their
+    methods re-rendered, and the client reassembled from the cached pieces.
+    The output file is only rewritten when its content actually changes.
+    """
+
+    def __init__(self, generator: SpoutGenerator):
+        self.generator = generator
+        self.output_path = Path(generator.input_data.output_path)
+        self.file_endpoints: Dict[str, List[AnyEndpoint]] = {}
+        self.file_methods: Dict[str, List[str]] = {}
+        self._last_output: Optional[str] = None
+
+    @property
+    def endpoints(self) -> List[AnyEndpoint]:
+        return [e for endpoints in self.file_endpoints.values() for e in endpoints]
+
+    def start(self) -> bool:
+        """
+        Perform the initial full generation.
+
+        Returns:
+            True if the output file was written
+        """
+        self.file_endpoints = group_by_file(self.generator.parsed_endpoints)
+        self.generator.generator.intern_types(self.endpoints)
+        for file_path, endpoints in self.file_endpoints.items():
+            self.file_methods[file_path] = self._render(endpoints)
+        return self._write()
+
+    def apply(self, changed: Set[Path]) -> bool:
+        """
+        Reparse changed files and patch the output.
+
+        Args:
+            changed: Files added, modified or removed since the last update
+
+        Returns:
+            True if the output file was rewritten
+        """
+        reparsed = refresh_files(self.generator, self.file_endpoints, changed)
+        for file_path in changed:
+            if str(file_path) not in self.file_endpoints:
+                self.file_methods.pop(str(file_path), None)
+
+        # Model definitions may live in any changed file, so re-resolve them
+        generator = self.generator.generator
+        generator.models = self.generator.resolve_models(self.endpoints)
+
+        # Shared aliases span files; when they change every method is stale
+        if generator.intern_types(self.endpoints):
+            reparsed = list(self.file_endpoints)
+        for file_path in reparsed:
+            endpoints = self.file_endpoints[file_path]
+            self.file_methods[file_path] = self._render(endpoints)
+
+        return self._write()
+
+    def _render(self, endpoints: List[AnyEndpoint]) -> List[str]:
+        generator = self.generator.generator
+        return [generator._generate_endpoint_method(e) for e in endpoints]
+
+    def _write(self) -> bool:
+        methods = [m for methods in self.file_methods.values() for m in methods]
+        output = self.generator.generator.assemble(self.endpoints, methods)
+        if output == self._last_output:
+            return False
+        self._last_output = output
+        return write_if_changed(self.output_path, output)
+
+    def run(
+        self,
+        interval: float = 0.5,
+        on_update: Optional[Callable[[Set[Path], bool], None]] = None,
+    ) -> None:
+        """
+        Watch the project until interrupted.
+
+        Args:
+            interval: Seconds between checks for changes
+            on_update: Called with the changed files and whether output was
+                rewritten after each batch of changes
+        """
+        source = open_change_source(self.generator)
+        try:
+            while True:
+                time.sleep(interval)
+                changed = source.poll()
+                if changed:
+                    written = self.apply(changed)
+                    if on_update is not None:
+                        on_update(changed, written)
+        finally:
+            source.close()
@@ -6,9 +6,10 @@ from unittest.mock import Mock, patch
 import pytest
 
 from spout.core import SpoutGenerator
-from spout.models.endpoint import Endpoint, EndpointMethod
+from spout.models.endpoint import Endpoint, EndpointMethod, ParameterType
+from spout.models.ir import EndpointIR, ParameterIR
 from spout.models.framework import FrameworkInfo, SupportedFramework
-from spout.models.cli_input import GenerateInput
+from spout.models.cli_input import GenerateInput, GenerateTarget
 
 
 @pytest.fixture
@@ -115,6 +116,61 @@ class TestSpoutGenerator:
         mock_parse.assert_called_once()
 
 
+class TestTargets:
+    """Test cases for emitting several clients from one parse."""
+
+    def test_parse_specs(self):
+        """Test that CLI and config targets parse into the same options."""
+        target = GenerateTarget.parse("axios:out/client.ts")
+        assert target.options() == {
+            "client_type": "axios",
+            "output_path": "out/client.ts",
+        }
+
+        target = GenerateTarget.parse(
+            {"clientType": "fetch", "outputPath": "api", "includeTypes": False}
+        )
+        assert target.options()["include_types"] is False
+        for bad in ("fetch", ":a.ts", {"clientType": "fetch", "output": "a.ts"}):
+            with pytest.raises(ValueError):
+                GenerateTarget.parse(bad)
+
+    def test_write_targets_parses_once(self, sample_endpoints, tmp_path):
+        """Test that every target renders from a single parse."""
+        generator = SpoutGenerator(
+            GenerateInput(project_path=str(tmp_path), output_path="unused.ts")
+        )
+        parse = Mock(return_value=sample_endpoints)
+        generator._detector = Mock(parse=parse)
+        targets = [
+            GenerateTarget(client_type="fetch", output_path=str(tmp_path / "a.ts")),
+            GenerateTarget(client_type="axios", output_path=str(tmp_path / "b.ts")),
+            GenerateTarget(
+                client_type="fetch",
+                output_path=str(tmp_path / "c.ts"),
+                include_types=False,
+            ),
+        ]
+
+        written = generator.write_targets(targets, parallel=True)
+
+        parse.assert_called_once()
+        assert written == [[Path(t.output_path)] for t in targets]
+        single = generator.derive(client_type="axios").generate_client()
+        assert (tmp_path / "b.ts").read_text() == single
+        assert generator.write_targets(targets) == [[], [], []]
+
+    def test_generate_client_reuses_generator(self, generator, sample_endpoints):
+        """Test that generate_client renders with the cached generator."""
+        generator._endpoints = sample_endpoints
+
+        generator.generate_client()
+        first = generator.generator
+        generator.generate_client()
+
+        assert generator.generator is first
+
+
 class TestEndpointModels:
     """Test cases for endpoint models."""
 
@@ -139,5 +195,51 @@ class TestEndpointModels:
         assert endpoint.typescript_method_name == "postUserProfiles"
 
 
+class TestEndpointIR:
+    """Test cases for the internal endpoint representation."""
+
+    @pytest.fixture
+    def endpoint_ir(self):
+        return EndpointIR(
+            path="/users/{user_id}",
+            method="GET",
+            function_name="get_user",
+            parameters=(
+                ParameterIR(
+                    name="user_id",
+                    type="number",
+                    python_type="number",
+                    parameter_type=ParameterType.PATH.value,
+                ),
+            ),
+            file_path="app.py",
+            line_number=3,
+        )
+
+    def test_to_model(self, endpoint_ir):
+        """Test conversion to the public pydantic model."""
+        endpoint = endpoint_ir.to_model()
+
+        assert isinstance(endpoint, Endpoint)
+        assert endpoint.parameters[0].parameter_type == ParameterType.PATH
+        assert endpoint.framework_data == {"file_path": "app.py", "line_number": 3}
+        assert endpoint.typescript_method_name == endpoint_ir.typescript_method_name
+
+    def test_json_round_trip(self, endpoint_ir):
+        """Test serialization used by the parse cache."""
+        assert EndpointIR.from_json(endpoint_ir.to_json()) == endpoint_ir
+
+    def test_endpoints_converted_on_demand(self, endpoint_ir):
+        """Test that SpoutGenerator exposes public models lazily."""
+        generator = SpoutGenerator(
+            GenerateInput(project_path=".", output_path="./output.tsx")
+        )
+        generator._parsed_endpoints = [endpoint_ir]
+
+        assert "getUser" in generator.generate_client()
+        assert generator._endpoints is None
+        assert generator.endpoints == [endpoint_ir.to_model()]
+
+
 if __name__ == "__main__":
     pytest.main([__file__])
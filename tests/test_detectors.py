@@ -0,0 +1,242 @@
+"""Tests for framework detection."""
+
+from pathlib import Path
+
+import pytest
+
+from spout.framework_detectors import ProjectIndex, build_index, detect_framework
+from spout.framework_detectors.base import PARALLEL_PARSE_THRESHOLD
+from spout.framework_detectors.detect_service import DETECTORS
+from spout.framework_detectors.django_ninja import DjangoNinjaDetector
+from spout.framework_detectors.fastapi import FastAPIDetector
+from spout.framework_detectors.scanner import (
+    MMAP_THRESHOLD,
+    PatternMatcher,
+    ScannedFile,
+)
+from spout.models.framework import SupportedFramework
+from spout.shared.cache import ParseCache
+
+
+@pytest.fixture
+def fastapi_project(tmp_path: Path) -> Path:
+    """Create a minimal FastAPI project."""
+    (tmp_path / "main.py").write_text(
+        "from fastapi import FastAPI\n"
+        "\n"
+        "app = FastAPI()\n"
+        "\n"
+        "@app.get('/items/{item_id}', tags=['items'])\n"
+        "def get_item(item_id: int):\n"
+        "    return {}\n"
+    )
+    (tmp_path / "utils.py").write_text("def helper():\n    return 1\n")
+    return tmp_path
+
+
+class TestProjectIndex:
+    """Test cases for the shared project scanner."""
+
+    def test_index_records_hits_per_detector(self, fastapi_project):
+        """Test that pattern hits are precomputed for every detector."""
+        index = build_index(fastapi_project)
+        main = index.get(fastapi_project / "main.py")
+
+        assert len(index.files) == 2
+        assert main is not None
+        assert SupportedFramework.FASTAPI.value in main.imports
+        assert SupportedFramework.FASTAPI.value in main.instantiations
+        assert SupportedFramework.DJANGO_NINJA.value not in main.imports
+
+    def test_detectors_share_index(self, fastapi_project, monkeypatch):
+        """Test that detection does not walk the project more than once."""
+        index = ProjectIndex.build(fastapi_project, list(DETECTORS.values()))
+        monkeypatch.setattr(
+            ProjectIndex, "build", lambda *args: pytest.fail("rescanned project")
+        )
+
+        assert FastAPIDetector.detect(fastapi_project, index) is not None
+        assert DjangoNinjaDetector.detect(fastapi_project, index) is None
+
+    def test_prefilter_skips_search_and_decoding(self, fastapi_project):
+        """Test that files without a framework literal skip search and decoding."""
+        matcher = PatternMatcher([FastAPIDetector, DjangoNinjaDetector])
+        scanned = ScannedFile(fastapi_project / "utils.py")
+        assert not matcher.match(scanned, b"import fast_api\napp = Fast()\n")
+        assert matcher.match(scanned, b"# fastapi\n")
+        assert not scanned.imports
+
+        utils = build_index(fastapi_project).get(fastapi_project / "utils.py")
+        assert utils._content is None
+        assert utils.content == "def helper():\n    return 1\n"
+
+    def test_large_files_and_newlines(self, tmp_path):
+        """Test that mapped files and CRLF sources read like text files."""
+        padding = "# padding\r\n" * (MMAP_THRESHOLD // 10)
+        (tmp_path / "main.py").write_bytes(
+            f"{padding}from fastapi import FastAPI\r\napp = FastAPI()\r\n".encode()
+        )
+        (tmp_path / "big.py").write_text(padding)
+        (tmp_path / "binary.py").write_bytes(b"\xff\xfe fastapi")
+
+        index = build_index(tmp_path)
+        main = index.get(tmp_path / "main.py")
+
+        assert SupportedFramework.FASTAPI.value in main.instantiations
+        assert main.content.endswith("app = FastAPI()\n")
+        assert index.get(tmp_path / "big.py").content.startswith("# padding\n")
+        assert index.get(tmp_path / "binary.py").content == ""
+
+    def test_detect_framework_parses_from_index(self, fastapi_project):
+        """Test that the selected detector parses endpoints."""
+        detector = detect_framework(fastapi_project)
+
+        assert isinstance(detector, FastAPIDetector)
+        endpoints = detector.parse()
+        assert [e.path for e in endpoints] == ["/items/{item_id}"]
+        assert endpoints[0].tags == ("items",)
+
+    def test_openapi_extra_client_options(self, tmp_path):
+        """Test that x-spout options reach framework_data and survive caching."""
+        (tmp_path / "main.py").write_text(
+            "from fastapi import FastAPI\n"
+            "app = FastAPI()\n"
+            "@app.get('/live', openapi_extra={'x-spout': {'dedupe': False}})\n"
+            "def live():\n"
+            "    return {}\n"
+            "@app.get('/other', openapi_extra=EXTRA)\n"
+            "def other():\n"
+            "    return {}\n"
+        )
+
+        live, other = detect_framework(tmp_path).parse()
+
+        assert live.framework_data["spout"] == {"dedupe": False}
+        assert "spout" not in other.framework_data
+        assert type(live).from_json(live.to_json()) == live
+
+    def test_parallel_parse_is_deterministic(self, tmp_path):
+        """Test that pooled parsing matches serial parsing order."""
+        (tmp_path / "main.py").write_text("from fastapi import FastAPI\n")
+        for i in range(PARALLEL_PARSE_THRESHOLD + 8):
+            (tmp_path / f"routes_{i:03d}.py").write_text(
+                "from fastapi import APIRouter\n"
+                "router = APIRouter()\n"
+                f"@router.get('/r{i}')\n"
+                f"def r{i}():\n"
+                "    return {}\n"
+            )
+
+        detector = detect_framework(tmp_path)
+        detector.jobs = 1
+        serial = detector.parse()
+        detector.jobs = 4
+        parallel = detector.parse()
+
+        assert len(serial) == PARALLEL_PARSE_THRESHOLD + 8
+        assert parallel == serial
+
+
+class TestEarlyDetection:
+    """Test cases for detection that stops once the winner is decided."""
+
+    @pytest.fixture
+    def routes_project(self, tmp_path: Path) -> Path:
+        """Create a FastAPI project with many route files."""
+        (tmp_path / "requirements.txt").write_text("fastapi\n")
+        (tmp_path / "a_main.py").write_text(
+            "from fastapi import FastAPI\napp = FastAPI()\n"
+        )
+        for i in range(20):
+            (tmp_path / f"routes_{i:02d}.py").write_text(
+                "from fastapi import APIRouter\n"
+                "router = APIRouter()\n"
+                f"@router.get('/r{i}')\n"
+                f"def r{i}():\n"
+                "    return {}\n"
+            )
+        # Read after detection is decided, so only FastAPI patterns apply
+        (tmp_path / "z_ninja.py").write_text("from ninja import NinjaAPI\n")
+        return tmp_path
+
+    def test_stops_reading_once_decided(self, routes_project):
+        """Test that detection leaves files unread and parsing reads them."""
+        index = build_index(routes_project, lazy=True)
+        detector = detect_framework(routes_project, index)
+
+        assert isinstance(detector, FastAPIDetector)
+        assert detector.framework_info.confidence == 1.0
+        assert index.remaining > 0
+        assert index.detectors == [FastAPIDetector]
+
+        endpoints = detector.parse()
+        assert index.remaining == 0
+        assert len(endpoints) == 20
+        assert len(detector.detected_files) == 22
+        ninja = index.get(routes_project / "z_ninja.py")
+        assert SupportedFramework.DJANGO_NINJA.value not in ninja.imports
+
+    def test_matches_full_scan(self, fastapi_project):
+        """Test that undecided detection reads on and agrees with a full scan."""
+        index = build_index(fastapi_project, lazy=True)
+        lazy = detect_framework(fastapi_project, index)
+        full = detect_framework(fastapi_project, build_index(fastapi_project))
+
+        assert index.remaining == 0
+        assert lazy.framework_info == full.framework_info
+        assert lazy.parse() == full.parse()
+
+    def test_capped_tie_goes_to_earlier_detector(self, tmp_path):
+        """Test that a capped leader waits for earlier detectors that could tie."""
+        for name in ("a_ninja", "b_ninja"):
+            (tmp_path / f"{name}.py").write_text(
+                "from ninja import NinjaAPI\napi = NinjaAPI()\n"
+            )
+        for name in ("c_main", "d_main"):
+            (tmp_path / f"{name}.py").write_text(
+                "from fastapi import FastAPI\napp = FastAPI()\n"
+            )
+        lazy = detect_framework(tmp_path, build_index(tmp_path, lazy=True))
+        full = detect_framework(tmp_path, build_index(tmp_path))
+
+        assert isinstance(full, FastAPIDetector)
+        assert isinstance(lazy, FastAPIDetector)
+        assert lazy.framework_info == full.framework_info
+
+    def test_no_framework(self, tmp_path):
+        """Test that a project without a framework is still rejected."""
+        (tmp_path / "app.py").write_text("print('hello')\n")
+
+        assert detect_framework(tmp_path) is None
+
+
+class TestParseCache:
+    """Test cases for the persistent parse cache."""
+
+    def test_warm_parse_skips_ast(self, fastapi_project, monkeypatch):
+        """Test that unchanged files are served from the cache."""
+        cache = ParseCache.for_project(fastapi_project)
+        detector = detect_framework(fastapi_project)
+        detector.cache = cache
+        cold = detector.parse()
+
+        monkeypatch.setattr(
+            FastAPIDetector,
+            "_parse_ast_for_endpoints",
+            lambda *args: pytest.fail("reparsed unchanged file"),
+        )
+        warm_detector = detect_framework(fastapi_project)
+        warm_detector.cache = ParseCache.for_project(fastapi_project)
+        warm = warm_detector.parse()
+
+        assert warm == cold
+        assert warm_detector.cache.hits == 1
+
+    def test_prune_evicts_oldest(self, tmp_path):
+        """Test size-bounded eviction."""
+        cache = ParseCache(tmp_path / "cache", max_entries=2)
+        for i in range(4):
+            cache.set(cache.key("ns", Path(f"f{i}.py"), ""), [i])
+
+        assert cache.prune() == 2
+        assert len(list(cache.entries_dir.glob("*/*.json"))) == 2
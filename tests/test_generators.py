@@ -0,0 +1,507 @@
+"""Tests for TypeScript client generators."""
+
+import io
+from pathlib import Path
+
+import pytest
+
+from spout.generators import GENERATORS
+from spout.generators.runtime import (
+    RuntimeOptions,
+    cache_options,
+    invalidation_prefix,
+    retry_options,
+    runtime_options,
+)
+from spout.generators.split import group_endpoints
+from spout.generators.templated import template_client_types, template_generator
+from spout.models.endpoint import (
+    Endpoint,
+    EndpointMethod,
+    EndpointParameter,
+    EndpointResponse,
+    ParameterType,
+)
+from spout.shared.utils import write_atomic
+
+
+@pytest.fixture
+def endpoints():
+    """Create sample endpoints for testing."""
+    return [
+        Endpoint(path="/users", method=EndpointMethod.GET, function_name="list"),
+        Endpoint(path="/users", method=EndpointMethod.POST, function_name="create"),
+    ]
+
+
+class TestStreaming:
+    """Test cases for streaming generation."""
+
+    @pytest.mark.parametrize("client_type", sorted(GENERATORS))
+    def test_stream_matches_generate(self, client_type, endpoints):
+        """Test that streamed chunks join to the generated client."""
+        generator = GENERATORS[client_type](base_url="", include_types=True)
+        code = generator.generate(endpoints)
+        fp = io.StringIO()
+
+        assert "".join(generator.generate_iter(endpoints)) == code
+        assert generator.generate_to(fp, endpoints) == len(code)
+        assert fp.getvalue() == code
+
+
+class TestWriteAtomic:
+    """Test cases for atomic output writes."""
+
+    def test_writes_then_skips_identical(self, tmp_path):
+        """Test that identical content leaves the target untouched."""
+        target = tmp_path / "out" / "client.ts"
+
+        assert write_atomic(target, ["a", "b"])
+        mtime = target.stat().st_mtime_ns
+
+        assert not write_atomic(target, ["ab"])
+        assert target.stat().st_mtime_ns == mtime
+        assert write_atomic(target, ["abc"])
+        assert target.read_text() == "abc"
+        assert list(target.parent.iterdir()) == [target]
+
+    def test_failure_keeps_previous_content(self, tmp_path):
+        """Test that an interrupted stream does not clobber the target."""
+        target = tmp_path / "client.ts"
+        target.write_text("old")
+
+        def chunks():
+            yield "new"
+            raise RuntimeError("generation failed")
+
+        with pytest.raises(RuntimeError):
+            write_atomic(target, chunks())
+        assert target.read_text() == "old"
+        assert list(tmp_path.iterdir()) == [target]
+
+
+class TestSplitOutput:
+    """Test cases for multi-file client output."""
+
+    @pytest.fixture
+    def tagged_endpoints(self):
+        return [
+            Endpoint(
+                path="/users",
+                method=EndpointMethod.GET,
+                function_name="list_users",
+                tags=["users"],
+                parameters=[
+                    EndpointParameter(
+                        name="data",
+                        type="UserFilter",
+                        python_type="UserFilter",
+                        parameter_type=ParameterType.BODY,
+                    )
+                ],
+            ),
+            Endpoint(
+                path="/api/v1/orders",
+                method=EndpointMethod.GET,
+                function_name="list_orders",
+                tags=["Order History"],
+            ),
+            Endpoint(path="/health", method=EndpointMethod.GET, function_name="health"),
+        ]
+
+    def test_group_by_tag_and_prefix(self, tagged_endpoints):
+        """Test grouping endpoints into named modules."""
+        assert list(group_endpoints(tagged_endpoints, "tag")) == [
+            "users",
+            "order-history",
+            "default",
+        ]
+        assert list(group_endpoints(tagged_endpoints, "prefix")) == [
+            "users",
+            "orders",
+            "health",
+        ]
+
+    def test_group_by_file_path(self):
+        """Test that same-named files in different packages stay apart."""
+        endpoints = [
+            Endpoint(
+                path=f"/{name}",
+                method=EndpointMethod.GET,
+                function_name=name,
+                framework_data={"file_path": f"/app/{name}/views.py"},
+            )
+            for name in ("users", "orders")
+        ]
+        root = Path("/app")
+
+        assert list(group_endpoints(endpoints, "file", root)) == [
+            "users-views",
+            "orders-views",
+        ]
+        assert list(group_endpoints(endpoints[:1], "file", root)) == ["users-views"]
+        assert list(group_endpoints(endpoints, "file")) == ["views"]
+
+    @pytest.mark.parametrize("client_type", sorted(GENERATORS))
+    def test_modules(self, client_type, tagged_endpoints):
+        """Test that modules, shared files and the barrel are emitted."""
+        generator = GENERATORS[client_type](base_url="", include_types=True)
+        modules = {
+            name: "".join(chunks)
+            for name, chunks in generator.generate_modules(
+                tagged_endpoints, "tag"
+            ).items()
+        }
+
+        assert set(modules) == {
+            "runtime.ts",
+            "types.ts",
+            "users.ts",
+            "order-history.ts",
+            "default.ts",
+            "index.ts",
+        }
+        assert "export class BaseApi" in modules["runtime.ts"]
+        assert "interface UserFilter" in modules["types.ts"]
+        assert "import type { UserFilter } from './types';" in modules["users.ts"]
+        assert "export class UsersApi extends BaseApi" in modules["users.ts"]
+        assert "getOrder" in modules["order-history.ts"]
+        assert "export { OrderHistoryApi } from './order-history';" in (
+            modules["index.ts"]
+        )
+
+
+class TestTypeInterning:
+    """Test cases for shared type aliases."""
+
+    @pytest.fixture
+    def shared_endpoints(self):
+        def param(name, type_, parameter_type):
+            return EndpointParameter(
+                name=name,
+                type=type_,
+                python_type=type_,
+                parameter_type=parameter_type,
+            )
+
+        def endpoint(path, method, params, response):
+            return Endpoint(
+                path=path,
+                method=method,
+                function_name=path.strip("/"),
+                parameters=params,
+                responses=[
+                    EndpointResponse(status_code=200, type=response, python_type="")
+                ],
+            )
+
+        body = [
+            param("body_title", "string", ParameterType.BODY),
+            param("data_size", "number", ParameterType.BODY),
+        ]
+        return [
+            endpoint("/notes", EndpointMethod.POST, body, "Note"),
+            endpoint("/notes", EndpointMethod.PUT, body[::-1], "Note"),
+            endpoint("/notes", EndpointMethod.GET, [], "Note[]"),
+            endpoint("/archive", EndpointMethod.GET, [], "Note[]"),
+            endpoint("/drafts", EndpointMethod.GET, [], "Record<string, Note>"),
+        ]
+
+    @pytest.mark.parametrize("client_type", sorted(GENERATORS))
+    def test_shared_types_emitted_once(self, client_type, shared_endpoints):
+        """Test that repeated compound types become a single alias."""
+        code = GENERATORS[client_type]().generate(shared_endpoints)
+
+        assert code.count("export type NoteList = Note[];") == 1
+        assert code.count("Promise<NoteList>") == 2
+        assert code.count("{ body_title: string; data_size: number }") == 1
+        assert code.count("data: PostNotesBody") == 2
+        # Used once, so left inline
+        assert "Promise<Record<string, Note>>" in code
+
+    def test_interning_disabled_without_types(self, shared_endpoints):
+        """Test that no aliases are referenced when types are omitted."""
+        code = GENERATORS["fetch"](include_types=False).generate(shared_endpoints)
+
+        assert "NoteList" not in code
+        assert "Promise<Note[]>" in code
+
+
+class TestTemplateEngine:
+    """Test cases for the Jinja2 template backend."""
+
+    @pytest.fixture
+    def rich_endpoints(self):
+        def param(name, type_, parameter_type, required=True):
+            return EndpointParameter(
+                name=name,
+                type=type_,
+                python_type=type_,
+                parameter_type=parameter_type,
+                required=required,
+            )
+
+        return [
+            Endpoint(
+                path="/users/{user_id}",
+                method=EndpointMethod.GET,
+                function_name="get_user",
+                description="Fetch one user.",
+                parameters=[
+                    param("user_id", "number", ParameterType.PATH),
+                    param("expand", "string", ParameterType.QUERY),
+                    param("limit", "number", ParameterType.QUERY, required=False),
+                ],
+                responses=[
+                    EndpointResponse(status_code=200, type="User", python_type="")
+                ],
+            ),
+            Endpoint(
+                path="/users",
+                method=EndpointMethod.POST,
+                function_name="create_user",
+                parameters=[
+                    param("body_name", "string", ParameterType.BODY),
+                    param("data_age", "number", ParameterType.BODY, required=False),
+                ],
+            ),
+        ]
+
+    @pytest.mark.parametrize("client_type", template_client_types())
+    @pytest.mark.parametrize("runtime", [None, RuntimeOptions(timeout=5000)])
+    def test_matches_fstring_output(self, client_type, runtime, rich_endpoints):
+        """Test that templates render the same client as the f-string path."""
+        options = dict(base_url="https://api", runtime=runtime)
+        expected = GENERATORS[client_type](**options).generate(rich_endpoints)
+        generator = template_generator(client_type)(**options)
+        generator.batch_size = 1
+
+        assert generator.generate(rich_endpoints) == expected
+
+    @pytest.mark.parametrize("client_type", template_client_types())
+    def test_split_modules_match(self, client_type, rich_endpoints):
+        """Test that split modules match the f-string path as well."""
+
+        def render(generator):
+            modules = generator.generate_modules(rich_endpoints, "prefix")
+            return {name: "".join(chunks) for name, chunks in modules.items()}
+
+        assert render(template_generator(client_type)()) == render(
+            GENERATORS[client_type]()
+        )
+
+    def test_bytecode_cache(self, tmp_path):
+        """Test that compiled templates are written to the bytecode cache."""
+        template_generator("fetch")(bytecode_cache_dir=tmp_path / "bytecode")
+
+        assert any((tmp_path / "bytecode").iterdir())
+
+    def test_unknown_template(self):
+        """Test that a missing template directory is rejected."""
+        with pytest.raises(ValueError):
+            template_generator("missing")
+
+
+class TestRuntime:
+    """Test cases for the request scheduling runtime."""
+
+    @pytest.fixture
+    def runtime_endpoints(self, endpoints):
+        """Add a GET that opts out of every scheduling feature."""
+        return endpoints + [
+            Endpoint(
+                path="/events",
+                method=EndpointMethod.GET,
+                function_name="events",
+                framework_data={"spout": {"dedupe": False, "batch": False}},
+            )
+        ]
+
+    def test_disabled_by_default(self, endpoints):
+        """Test that clients without runtime features emit no scheduler."""
+        code = GENERATORS["fetch"](runtime=RuntimeOptions()).generate(endpoints)
+
+        assert code == GENERATORS["fetch"]().generate(endpoints)
+        assert "RequestScheduler" not in code
+
+    def test_policies(self, runtime_endpoints):
+        """Test that only GETs dedupe and endpoint options win."""
+        runtime = RuntimeOptions(dedupe=True, batch_path="/batch", max_concurrency=4)
+        code = GENERATORS["fetch"](runtime=runtime).generate(runtime_endpoints)
+
+        assert "export class RequestScheduler {" in code
+        assert "      maxConcurrency: 4,\n      batchPath: '/batch',\n" in code
+        calls = [line.strip() for line in code.splitlines() if "this.request<" in line]
+        assert calls == [
+            "return this.request<any>(path, options, { dedupe: true, batch: true });",
+            "return this.request<any>(path, options, { batch: true });",
+            "return this.request<any>(path, options);",
+        ]
+
+    def test_split_runtime_module(self, endpoints):
+        """Test that split clients keep the scheduler in runtime.ts."""
+        generator = GENERATORS["fetch"](runtime=RuntimeOptions(dedupe=True))
+        modules = {
+            name: "".join(chunks)
+            for name, chunks in generator.generate_modules(endpoints, "prefix").items()
+        }
+
+        assert "export class RequestScheduler {" in modules["runtime.ts"]
+        assert "RequestScheduler" not in modules["users.ts"]
+
+    def test_unsupported_client_types(self):
+        """Test that clients without a scheduler reject runtime features."""
+        runtime = RuntimeOptions(dedupe=True)
+        with pytest.raises(ValueError, match="dedupe"):
+            GENERATORS["axios"](runtime=runtime)
+        with pytest.raises(ValueError, match="dedupe"):
+            template_generator("fetch")(runtime=runtime)
+
+    @pytest.mark.parametrize("client_type", ["fetch", "axios"])
+    def test_response_cache(self, client_type, runtime_endpoints):
+        """Test that GETs are cached per route and mutations invalidate."""
+        runtime = RuntimeOptions(
+            cache_ttl=30.0, cache_max_entries=50, cache_endpoints=(("/events", 0),)
+        )
+        generator = GENERATORS[client_type](runtime=runtime)
+        code = generator.generate(runtime_endpoints)
+
+        assert "export class ResponseCache {" in code
+        assert "RequestScheduler" not in code
+        assert "this.cache = new ResponseCache(50);" in code
+        if client_type == "fetch":
+            assert "this.request<any>(path, options, { cacheTtl: 30 });" in code
+            assert "this.request<any>(path, options, { invalidate: '/users' });" in code
+            assert "this.request<any>(path, options);" in code
+        else:
+            assert code.count("this.cached<any>(requestConfig, { cacheTtl: 30 });") == 1
+            assert "this.invalidate('/users');" in code
+
+    @pytest.mark.parametrize("client_type", ["fetch", "axios"])
+    def test_invalidation_prefix_escaped(self, client_type):
+        """Test that the invalidated prefix is emitted as an escaped literal."""
+        endpoint = Endpoint(
+            path="/o'neil/<int:item_id>",
+            method=EndpointMethod.PUT,
+            function_name="update",
+        )
+        runtime = RuntimeOptions(cache_ttl=30.0)
+        code = GENERATORS[client_type](runtime=runtime).generate([endpoint])
+
+        expected = {
+            "fetch": "{ invalidate: '/o\\'neil' }",
+            "axios": "this.invalidate('/o\\'neil');",
+        }
+        assert expected[client_type] in code
+
+    def test_cache_options(self):
+        """Test reading the configuration file's cache object."""
+        config = {"cache": {"ttl": 60, "endpoints": {"/users/{id}": 5}}}
+        runtime = RuntimeOptions(**cache_options(config))
+
+        assert runtime.features == {"cache"}
+        assert runtime.endpoint_ttl("/users/{id}") == 5
+        assert runtime.endpoint_ttl("/users") == 60
+        assert cache_options({}) == {}
+        for bad in ({"ttl": -1}, {"maxEntries": 0}, {"ttl": "1"}, {"size": 1}):
+            with pytest.raises(ValueError):
+                cache_options({"cache": bad})
+
+    @pytest.mark.parametrize(
+        "route, prefix",
+        [
+            ("/users", "/users"),
+            ("/users/{user_id}", "/users"),
+            ("/orgs/{org}/users/{user}", "/orgs"),
+            ("/v1/items/", "/v1/items"),
+            ("/{tenant}/items", "/"),
+            ("/users/<int:user_id>/", "/users"),
+        ],
+    )
+    def test_invalidation_prefix(self, route, prefix):
+        """Test that mutations invalidate their route's static prefix."""
+        assert invalidation_prefix(route) == prefix
+
+    def test_retry_runtime(self, endpoints):
+        """Test that timeouts and retries wrap fetch and accept a signal."""
+        runtime = RuntimeOptions(timeout=5000, retries=2, retry_statuses=(503,))
+        code = GENERATORS["fetch"](runtime=runtime).generate(endpoints)
+
+        assert "export interface ApiConfig extends RetryConfig {" in code
+        assert "export async function fetchWithRetry(" in code
+        assert "      timeout: 5000,\n      retries: 2,\n" in code
+        assert "      retryStatuses: [503],\n" in code
+        assert "fetchWithRetry(url, { ...options, headers }, this.config);" in code
+        assert "async getUsers(signal?: AbortSignal): Promise<any> {" in code
+        assert "      signal,\n" in code
+        with pytest.raises(ValueError, match="retry"):
+            GENERATORS["axios"](runtime=runtime)
+
+    @pytest.mark.parametrize("client_type", ["fetch", "axios"])
+    def test_timeout_default(self, client_type, endpoints):
+        """Test that a timeout alone becomes a client default, not a runtime."""
+        runtime = RuntimeOptions(timeout=5000)
+        code = GENERATORS[client_type](runtime=runtime).generate(endpoints)
+
+        assert "      timeout: 5000,\n" in code
+        assert "class RequestScheduler" not in code
+        assert "fetchWithRetry" not in code
+
+    def test_fetch_honors_timeout(self, endpoints):
+        """Test that plain fetch clients abort once ``config.timeout`` elapses."""
+        code = GENERATORS["fetch"]().generate(endpoints)
+
+        assert "setTimeout(() => controller.abort(), this.config.timeout)" in code
+        assert "      signal: controller.signal,\n" in code
+
+    def test_retry_options(self):
+        """Test reading timeout and retry options, with explicit overrides."""
+        config = {"timeout": 8000, "retry": {"retries": 3, "statuses": [429]}}
+        runtime = runtime_options(config, retries=1, timeout=None)
+
+        assert runtime.timeout == 8000
+        assert runtime.retries == 1
+        assert runtime.retry_statuses == (429,)
+        assert runtime.features == {"retry"}
+        for bad in (
+            {"timeout": -1},
+            {"retry": {"retries": 1.5}},
+            {"retry": {"statuses": [700]}},
+            {"retry": {"backoff": 2}},
+        ):
+            with pytest.raises(ValueError):
+                retry_options(bad)
+
+
+class TestFunctionStyle:
+    """Test cases for the function-per-endpoint output style."""
+
+    @pytest.mark.parametrize("client_type", ["fetch", "axios"])
+    def test_functions_take_context(self, client_type, endpoints):
+        """Test that each endpoint becomes an exported function."""
+        code = GENERATORS[client_type](style="functions").generate(endpoints)
+
+        assert "export class ApiClient" not in code
+        assert "export class ApiContext {" in code
+        assert "\nexport async function getUsers(ctx: ApiContext" in code
+        assert "\nexport async function postUsers(ctx: ApiContext" in code
+        assert "  return this." not in code
+        assert code.endswith(";\n}\n")
+
+    def test_split_modules(self, endpoints):
+        """Test that split modules export functions and share the context."""
+        generator = GENERATORS["fetch"](style="functions")
+        modules = {
+            name: "".join(chunks)
+            for name, chunks in generator.generate_modules(endpoints, "prefix").items()
+        }
+
+        assert "export class ApiContext {" in modules["runtime.ts"]
+        assert "import { ApiContext } from './runtime';" in modules["users.ts"]
+        assert "class" not in modules["users.ts"]
+        assert "export * from './users';" in modules["index.ts"]
+
+    def test_templates_reject_functions(self):
+        """Test that the template engine only emits classes."""
+        with pytest.raises(ValueError, match="functions"):
+            template_generator("fetch")(style="functions")
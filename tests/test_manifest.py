@@ -0,0 +1,155 @@
+"""Tests for output manifests and no-op regeneration."""
+
+import os
+from pathlib import Path
+
+import pytest
+from click.testing import CliRunner
+
+from spout.cli import main
+from spout.core import SpoutGenerator
+from spout.models.cli_input import GenerateInput
+from spout.shared.manifest import manifest_key, manifest_path, stale_outputs
+
+
+@pytest.fixture
+def project(tmp_path: Path) -> Path:
+    """Create a FastAPI project with one route file and one helper."""
+    project = tmp_path / "app"
+    project.mkdir()
+    (project / "main.py").write_text(
+        "from fastapi import FastAPI\n"
+        "\n"
+        "app = FastAPI()\n"
+        "\n"
+        "@app.get('/items/{item_id}')\n"
+        "def get_item(item_id: int):\n"
+        "    return {}\n"
+    )
+    (project / "utils.py").write_text("def helper():\n    return 1\n")
+    return project
+
+
+def make_generator(project: Path, **options) -> SpoutGenerator:
+    """Build a generator writing next to the project."""
+    output_path = str(project.parent / "client.ts")
+    return SpoutGenerator(
+        GenerateInput(
+            project_path=str(project),
+            output_path=output_path,
+            use_cache=False,
+            **options,
+        )
+    )
+
+
+def bump_mtime(path: Path) -> None:
+    """Move a file's mtime forward without changing its content."""
+    stat = path.stat()
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+
+
+class TestOutputManifest:
+    """Test cases for skipping generation when nothing changed."""
+
+    def test_unchanged_project_skips_parsing(self, project, monkeypatch):
+        """Test that a second run only checks the manifest."""
+        output = project.parent / "client.ts"
+        assert make_generator(project).write_output() == [output]
+        assert manifest_path(output).exists()
+
+        generator = make_generator(project)
+        monkeypatch.setattr(
+            SpoutGenerator, "parsed_endpoints", property(lambda self: pytest.fail())
+        )
+        assert generator.write_output() == []
+        assert generator._detector is None
+
+    def test_touched_files_still_match(self, project):
+        """Test that an mtime change without a content change is not stale."""
+        make_generator(project).write_output()
+        bump_mtime(project / "utils.py")
+
+        assert make_generator(project).is_up_to_date()
+
+    @pytest.mark.parametrize(
+        "change",
+        ["edit_source", "add_source", "remove_source", "edit_output", "options"],
+    )
+    def test_changes_regenerate(self, project, change):
+        """Test that sources, outputs and options all invalidate the manifest."""
+        output = project.parent / "client.ts"
+        make_generator(project).write_output()
+        options = {}
+        if change == "edit_source":
+            (project / "utils.py").write_text("def helper():\n    return 22\n")
+        elif change == "add_source":
+            (project / "extra.py").write_text("X = 1\n")
+        elif change == "remove_source":
+            (project / "utils.py").unlink()
+        elif change == "edit_output":
+            output.write_text(output.read_text() + "// edited\n")
+        else:
+            options["base_url"] = "https://api.example.com"
+
+        generator = make_generator(project, **options)
+        assert not generator.is_up_to_date()
+        generator.write_output()
+        assert make_generator(project, **options).is_up_to_date()
+
+    def test_stale_outputs(self, project):
+        """Test that only outputs whose manifest no longer matches are listed."""
+        fresh = make_generator(project)
+        fresh.write_output()
+        outputs = [
+            (fresh.output_location, fresh.manifest_key()),
+            (project.parent / "other.ts", manifest_key({})),
+            (fresh.output_location, manifest_key({"base_url": "https://api"})),
+        ]
+
+        assert stale_outputs(project, ["main.py", "utils.py"], outputs) == [1, 2]
+        assert stale_outputs(project, ["main.py"], outputs[:1]) == [0]
+
+    def test_split_removes_stale_modules(self, project):
+        """Test that modules no longer generated are deleted, others kept."""
+        (project / "admin").mkdir()
+        (project / "admin" / "main.py").write_text(
+            "from fastapi import APIRouter\n"
+            "\n"
+            "router = APIRouter()\n"
+            "\n"
+            "@router.get('/admin')\n"
+            "def admin():\n"
+            "    return {}\n"
+        )
+        output_dir = project.parent / "client"
+        make_generator(project, split_by="file").write_output()
+        assert (output_dir / "admin-main.ts").exists()
+        assert (output_dir / "main.ts").exists()
+        (output_dir / "notes.txt").write_text("mine\n")
+
+        (project / "admin" / "main.py").unlink()
+        make_generator(project, split_by="file").write_output()
+
+        assert not (output_dir / "admin-main.ts").exists()
+        assert (output_dir / "main.ts").exists()
+        assert (output_dir / "notes.txt").exists()
+
+    def test_cli_target_with_integer_ttl(self, project, monkeypatch):
+        """Test that the CLI and the generator agree on a target's key."""
+        config = project.parent / "spout.config.json"
+        output = project.parent / "client.ts"
+        config.write_text(
+            '{"targets": [{"clientType": "fetch", "outputPath": "%s",'
+            ' "cacheTtl": 5}]}' % output
+        )
+        args = ["generate", "-i", str(project), "--config", str(config)]
+        result = CliRunner().invoke(main, args)
+        assert "generated successfully" in result.output
+
+        monkeypatch.setattr(
+            SpoutGenerator, "parsed_endpoints", property(lambda self: pytest.fail())
+        )
+        result = CliRunner().invoke(main, args)
+        assert result.exit_code == 0
+        assert "fetch client is up to date" in result.output
@@ -0,0 +1,154 @@
+"""Tests for lazily loaded registries and startup imports."""
+
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+from spout.shared import plugins
+from spout.shared.plugins import GENERATOR_GROUP, discover_plugins
+from spout.shared.registry import LazyRegistry
+
+ROOT = Path(__file__).resolve().parent.parent
+
+
+def imported_modules(statement: str) -> set:
+    """Return the modules loaded by running ``statement`` in a fresh process."""
+    result = subprocess.run(
+        [sys.executable, "-c", f"{statement}\nimport sys\nprint(*sys.modules)"],
+        capture_output=True,
+        text=True,
+        cwd=ROOT,
+        check=True,
+    )
+    return set(result.stdout.split())
+
+
+class TestLazyRegistry:
+    """Test cases for LazyRegistry."""
+
+    def test_loads_on_lookup(self):
+        """Test that entries are imported on first lookup only."""
+        registry = LazyRegistry({"path": "pathlib:PurePosixPath", "module": "json"})
+        assert list(registry) == ["path", "module"]
+        assert "path" in registry
+        assert not registry.is_loaded("path")
+
+        assert registry["path"].__name__ == "PurePosixPath"
+        assert registry.is_loaded("path")
+        assert registry["module"].__name__ == "json"
+
+    def test_register(self):
+        """Test that callables register and existing names can be kept."""
+        registry = LazyRegistry({"a": lambda: 1})
+        registry.register("a", lambda: 2, replace=False)
+        registry.register("b", lambda: 3)
+
+        assert dict(registry) == {"a": 1, "b": 3}
+        with pytest.raises(KeyError):
+            registry["missing"]
+
+
+@pytest.fixture
+def plugin_site(tmp_path: Path, monkeypatch) -> Path:
+    """Install a distribution publishing a generator plugin on sys.path."""
+    site = tmp_path / "site"
+    dist_info = site / "spout_ky-1.0.dist-info"
+    dist_info.mkdir(parents=True)
+    (dist_info / "METADATA").write_text("Name: spout-ky\nVersion: 1.0\n")
+    (dist_info / "entry_points.txt").write_text(
+        f"[{GENERATOR_GROUP}]\nky = spout_ky:KyClientGenerator\n"
+    )
+    (site / "spout_ky.py").write_text(
+        "from spout.generators.fetch import FetchClientGenerator\n"
+        "class KyClientGenerator(FetchClientGenerator):\n"
+        "    header_comment = '// Generated TypeScript client using ky'\n"
+    )
+    monkeypatch.syspath_prepend(str(site))
+    return site
+
+
+class TestPlugins:
+    """Test cases for entry point plugin discovery."""
+
+    def test_discovers_without_importing(self, plugin_site, monkeypatch):
+        """Test that plugins are listed by name and imported when selected."""
+        monkeypatch.setattr(
+            plugins, "plugin_targets", lambda group: discover_plugins()[group]
+        )
+        registry = LazyRegistry(
+            {"fetch": "spout.generators.fetch:FetchClientGenerator"},
+            group=GENERATOR_GROUP,
+        )
+
+        assert list(registry) == ["fetch", "ky"]
+        assert "spout_ky" not in sys.modules
+        code = registry["ky"]().generate([])
+        assert code.startswith("// Generated TypeScript client using ky")
+
+    def test_builtins_win(self, plugin_site, monkeypatch):
+        """Test that a plugin cannot replace a built-in entry."""
+        monkeypatch.setattr(plugins, "plugin_targets", lambda group: {"ky": "x:Y"})
+        registry = LazyRegistry({"ky": lambda: "builtin"}, group=GENERATOR_GROUP)
+
+        assert registry["ky"] == "builtin"
+
+    def test_discovery_cached(self, plugin_site, tmp_path, monkeypatch):
+        """Test that discovery is reused until installed packages change."""
+        cache_path = tmp_path / "plugins.json"
+        assert discover_plugins(cache_path)[GENERATOR_GROUP] == {
+            "ky": "spout_ky:KyClientGenerator"
+        }
+
+        scans = []
+        scan = plugins._scan_entry_points
+        monkeypatch.setattr(
+            plugins, "_scan_entry_points", lambda: scans.append(1) or scan()
+        )
+        assert "ky" in discover_plugins(cache_path)[GENERATOR_GROUP]
+        assert scans == []
+
+        dist_info = plugin_site / "spout_ky-1.0.dist-info"
+        for path in dist_info.iterdir():
+            path.unlink()
+        dist_info.rmdir()
+        assert discover_plugins(cache_path)[GENERATOR_GROUP] == {}
+        assert scans == [1]
+
+
+class TestStartup:
+    """Test cases for import-time laziness."""
+
+    def test_cli_import_is_light(self):
+        """Test that importing the CLI loads no models, detectors or generators."""
+        modules = imported_modules("import spout.cli")
+
+        assert "spout.cli" in modules
+        for heavy in (
+            "pydantic",
+            "jinja2",
+            "spout.core",
+            "spout.framework_detectors.base",
+            "spout.generators.base",
+        ):
+            assert heavy not in modules
+
+    def test_loads_only_selected_generator(self):
+        """Test that looking up one client type imports only its generator."""
+        modules = imported_modules(
+            "from spout.generators import GENERATORS\nGENERATORS['axios']"
+        )
+
+        assert "spout.generators.axios" in modules
+        assert "spout.generators.fetch" not in modules
+        assert "jinja2" not in modules
+
+    def test_public_names_resolve(self):
+        """Test that the package's lazy attributes still import."""
+        import spout
+
+        assert spout.SpoutGenerator.__name__ == "SpoutGenerator"
+        assert "SpoutDetector" in dir(spout)
+        with pytest.raises(AttributeError):
+            spout.Missing
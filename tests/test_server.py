@@ -0,0 +1,221 @@
+"""Tests for the daemon server mode."""
+
+import json
+import threading
+import time
+from pathlib import Path
+
+import pytest
+
+from spout.models.cli_input import GenerateInput
+from spout.server import (
+    INVALID_PARAMS,
+    METHOD_NOT_FOUND,
+    PARSE_ERROR,
+    UNAUTHORIZED,
+    DaemonClient,
+    DaemonError,
+    ProjectSession,
+    SpoutDaemon,
+    default_token_path,
+)
+
+ROUTES = (
+    "from fastapi import APIRouter\n"
+    "router = APIRouter()\n"
+    "@router.get('/{name}')\n"
+    "def {name}():\n"
+    "    return {{}}\n"
+)
+
+
+@pytest.fixture
+def project(tmp_path: Path) -> Path:
+    """Create a small FastAPI project."""
+    project = tmp_path / "project"
+    project.mkdir()
+    (project / "main.py").write_text("from fastapi import FastAPI\napp = FastAPI()\n")
+    (project / "users.py").write_text(ROUTES.format(name="users"))
+    return project
+
+
+def make_daemon(project: Path, **kwargs) -> SpoutDaemon:
+    return SpoutDaemon(
+        GenerateInput(project_path=str(project), output_path="", use_cache=False),
+        **kwargs,
+    )
+
+
+@pytest.fixture
+def daemon(project: Path):
+    """Serve the project on its default socket for the duration of a test."""
+    daemon = make_daemon(project, idle_timeout=None, interval=0.05)
+    thread = threading.Thread(target=daemon.serve, daemon=True)
+    thread.start()
+    assert daemon.ready.wait(5)
+    yield daemon
+    daemon.shutdown()
+    thread.join(5)
+
+
+def call(daemon: SpoutDaemon, method: str, **params):
+    return DaemonClient(Path(daemon.address)).call(method, **params)
+
+
+class TestSpoutDaemon:
+    """Test cases for SpoutDaemon."""
+
+    def test_answers_requests(self, daemon, project):
+        """Test detect, endpoints and generate over the socket."""
+        assert call(daemon, "ping")["pid"]
+        assert call(daemon, "detect")["name"] == "fastapi"
+        assert [e["path"] for e in call(daemon, "endpoints")] == ["/users"]
+
+        code = call(daemon, "generate", client_type="axios")["code"]
+        assert "import axios" in code
+        assert "async getUsers(" in code
+
+        result = call(daemon, "generate", output_path="out/client.ts")
+        assert result == {"written": True, "paths": [str(project / "out/client.ts")]}
+        assert not call(daemon, "generate", output_path="out/client.ts")["written"]
+
+    def test_reports_errors(self, daemon):
+        """Test that bad requests get JSON-RPC errors, not dropped connections."""
+        with pytest.raises(DaemonError) as error:
+            call(daemon, "missing")
+        assert error.value.code == METHOD_NOT_FOUND
+        with pytest.raises(DaemonError) as error:
+            call(daemon, "generate", colour="red")
+        assert error.value.code == INVALID_PARAMS
+        with pytest.raises(DaemonError) as error:
+            call(daemon, "detect", verbose=True)
+        assert error.value.code == INVALID_PARAMS
+
+        response = json.loads(daemon.dispatch(b"{not json"))
+        assert response["error"]["code"] == PARSE_ERROR
+
+    @pytest.mark.parametrize("output_path", ["../escape.ts", "/tmp/escape.ts"])
+    def test_rejects_output_outside_project(self, daemon, project, output_path):
+        """Test that generate refuses to write outside the project directory."""
+        with pytest.raises(DaemonError) as error:
+            call(daemon, "generate", output_path=output_path)
+        assert error.value.code == INVALID_PARAMS
+        assert not (project.parent / "escape.ts").exists()
+
+    def test_tcp_requires_token(self, project):
+        """Test that TCP requests without the daemon's token are refused."""
+        daemon = make_daemon(project, idle_timeout=None, interval=0.05)
+        thread = threading.Thread(target=daemon.serve, kwargs={"port": 0}, daemon=True)
+        thread.start()
+        assert daemon.ready.wait(5)
+        port = daemon.address[1]
+        token_path = default_token_path(project)
+        try:
+            assert daemon.address[0] == "127.0.0.1"
+            assert token_path.stat().st_mode & 0o777 == 0o600
+            for token in (None, "wrong"):
+                with pytest.raises(DaemonError) as error:
+                    DaemonClient(port=port, token=token).call("ping")
+                assert error.value.code == UNAUTHORIZED
+
+            client = DaemonClient(port=port, token=token_path.read_text())
+            assert client.call("ping")["pid"]
+        finally:
+            daemon.shutdown()
+            thread.join(5)
+        assert not token_path.exists()
+
+    def test_survives_failed_refresh(self, daemon, project, monkeypatch):
+        """Test that a failing refresh is logged and polling carries on."""
+        call(daemon, "endpoints")
+        refresh = ProjectSession.refresh
+        failures = []
+
+        def fail_once(session, changed):
+            if not failures:
+                failures.append(changed)
+                raise RuntimeError("boom")
+            refresh(session, changed)
+
+        monkeypatch.setattr(ProjectSession, "refresh", fail_once)
+        (project / "items.py").write_text(ROUTES.format(name="items"))
+
+        deadline = time.monotonic() + 5
+        while not failures and time.monotonic() < deadline:
+            time.sleep(0.05)
+        assert failures
+        (project / "users.py").unlink()
+
+        paths = []
+        while time.monotonic() < deadline:
+            paths = [e["path"] for e in call(daemon, "endpoints")]
+            if paths == ["/items"]:
+                break
+            time.sleep(0.05)
+        assert paths == ["/items"]
+
+    def test_invalidates_on_change(self, daemon, project):
+        """Test that added and removed route files are picked up."""
+        call(daemon, "endpoints")
+        (project / "items.py").write_text(ROUTES.format(name="items"))
+        (project / "users.py").unlink()
+
+        deadline = time.monotonic() + 5
+        paths = []
+        while time.monotonic() < deadline:
+            paths = [e["path"] for e in call(daemon, "endpoints")]
+            if paths == ["/items"]:
+                break
+            time.sleep(0.05)
+        assert paths == ["/items"]
+        assert "async getItems(" in call(daemon, "generate")["code"]
+
+    def test_framework_removed(self, daemon, project):
+        """Test that detect reports an error once the framework is gone."""
+        assert call(daemon, "detect")["name"] == "fastapi"
+        (project / "main.py").unlink()
+        (project / "users.py").write_text("x = 1\n")
+
+        deadline = time.monotonic() + 5
+        error = None
+        while error is None and time.monotonic() < deadline:
+            try:
+                call(daemon, "detect")
+            except DaemonError as exc:
+                error = exc
+            time.sleep(0.05)
+        assert error is not None
+        assert "framework" in str(error)
+
+    def test_socket_is_private(self, daemon):
+        """Test that the Unix socket is only reachable by its owner."""
+        assert Path(daemon.address).stat().st_mode & 0o777 == 0o600
+
+    def test_concurrent_requests(self, daemon):
+        """Test that parallel clients all get consistent answers."""
+        results = []
+
+        def worker():
+            results.append(call(daemon, "generate")["code"])
+
+        threads = [threading.Thread(target=worker) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join(10)
+
+        assert len(results) == 8
+        assert len(set(results)) == 1
+
+    def test_idle_timeout(self, project):
+        """Test that the daemon exits and removes its socket when idle."""
+        daemon = make_daemon(project, idle_timeout=0.2, interval=0.05)
+        thread = threading.Thread(target=daemon.serve, daemon=True)
+        thread.start()
+        assert daemon.ready.wait(5)
+        socket_path = Path(daemon.address)
+        assert socket_path.exists()
+
+        thread.join(5)
+        assert not thread.is_alive()
+        assert not socket_path.exists()
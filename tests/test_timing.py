@@ -0,0 +1,66 @@
+"""Tests for timing instrumentation."""
+
+from pathlib import Path
+
+from click.testing import CliRunner
+
+from spout.cli import main
+from spout.framework_detectors import build_index
+from spout.shared import timing
+
+
+class TestTiming:
+    """Test cases for the phase recorder."""
+
+    def test_disabled_hooks_are_noops(self):
+        """Test that hooks record nothing while disabled."""
+        timing.disable()
+        with timing.phase("parse") as stats:
+            stats.add(files=1)
+
+        assert not timing.enabled()
+
+    def test_records_phases_and_counters(self):
+        """Test that phases accumulate time, calls and counters."""
+        recorder = timing.enable()
+        try:
+            for _ in range(2):
+                with timing.phase("read") as stats:
+                    stats.add(files=1, bytes=10)
+        finally:
+            timing.disable()
+
+        data = recorder.to_dict()["read"]
+        assert data["calls"] == 2
+        assert data["files"] == 2
+        assert data["bytes"] == 20
+        assert "read" in recorder.format_table()
+
+    def test_scan_records_read_and_match(self, tmp_path: Path):
+        """Test that the project scan reports bytes read and files matched."""
+        (tmp_path / "main.py").write_text("from fastapi import FastAPI\n")
+        (tmp_path / "utils.py").write_text("X = 1\n")
+        recorder = timing.enable()
+        try:
+            build_index(tmp_path)
+        finally:
+            timing.disable()
+
+        data = recorder.to_dict()
+        assert data["read"]["files"] == 2
+        assert data["read"]["bytes"] == 34
+        assert data["match"]["files"] == 2
+
+    def test_failed_run_still_profiled(self, tmp_path: Path):
+        """Test that a run exiting with an error still writes its profile."""
+        (tmp_path / "app.py").write_text("print('hello')\n")
+        profile = tmp_path / "run.prof"
+        result = CliRunner().invoke(
+            main,
+            ["generate", "-i", str(tmp_path), "--profile", str(profile), "--timings"],
+        )
+
+        assert result.exit_code == 1
+        assert profile.exists()
+        assert "Phase" in result.output
+        assert not timing.enabled()
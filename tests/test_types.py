@@ -0,0 +1,256 @@
+"""Tests for type extraction and model resolution."""
+
+import ast
+from pathlib import Path
+
+import pytest
+
+from spout.framework_detectors import build_index, detect_framework
+from spout.framework_detectors.annotations import annotation_to_typescript
+from spout.framework_detectors.symbols import SymbolIndex
+from spout.framework_detectors.type_resolver import TypeResolver
+from spout.generators.fetch import FetchClientGenerator
+from spout.shared.cache import ParseCache
+
+
+def ts(source: str) -> str:
+    return annotation_to_typescript(ast.parse(source, mode="eval").body)
+
+
+@pytest.fixture
+def models_project(tmp_path: Path) -> Path:
+    """Create a FastAPI project whose routes use models from another module."""
+    (tmp_path / "schemas.py").write_text(
+        "from enum import Enum\n"
+        "from typing import List, Optional\n"
+        "from pydantic import BaseModel, Field\n"
+        "\n"
+        "class Role(str, Enum):\n"
+        "    ADMIN = 'admin'\n"
+        "    USER = 'user'\n"
+        "\n"
+        "class Base(BaseModel):\n"
+        "    id: int\n"
+        "\n"
+        "class User(Base):\n"
+        "    name: str\n"
+        "    email: Optional[str] = None\n"
+        "    role: Role\n"
+        "    friends: List['User'] = Field(default_factory=list)\n"
+        "\n"
+        "class Unused(BaseModel):\n"
+        "    value: int\n"
+    )
+    (tmp_path / "main.py").write_text(
+        "from typing import List\n"
+        "from fastapi import FastAPI\n"
+        "from schemas import User\n"
+        "\n"
+        "app = FastAPI()\n"
+        "\n"
+        "@app.get('/users', response_model=List[User])\n"
+        "def list_users(q: str):\n"
+        "    return []\n"
+        "\n"
+        "@app.get('/users/{user_id}')\n"
+        "async def get_user(user_id: int) -> User:\n"
+        "    return None\n"
+    )
+    return tmp_path
+
+
+@pytest.fixture
+def package_project(tmp_path: Path) -> Path:
+    """Create a project that re-exports and aliases models across packages."""
+    (tmp_path / "app" / "schemas").mkdir(parents=True)
+    (tmp_path / "app" / "__init__.py").write_text("")
+    (tmp_path / "app" / "schemas" / "__init__.py").write_text(
+        "from .models import User as Person\n"
+    )
+    (tmp_path / "app" / "schemas" / "models.py").write_text(
+        "class User:\n    name: str\n"
+    )
+    (tmp_path / "app" / "legacy.py").write_text("class User:\n    login: str\n")
+    (tmp_path / "app" / "api.py").write_text(
+        "from app import schemas\n"
+        "from fastapi import FastAPI\n"
+        "\n"
+        "Out = schemas.Person\n"
+        "app = FastAPI()\n"
+        "\n"
+        "@app.get('/me')\n"
+        "def me() -> Out:\n"
+        "    return None\n"
+    )
+    return tmp_path
+
+
+class TestAnnotations:
+    """Test cases for annotation conversion."""
+
+    @pytest.mark.parametrize(
+        "source, expected",
+        [
+            ("int", "number"),
+            ("List[User]", "User[]"),
+            ("Optional[str]", "string | null"),
+            ("str | None", "string | null"),
+            ("List[Union[int, str]]", "(number | string)[]"),
+            ("Dict[str, User]", "Record<string, User>"),
+            ("Literal['a', 'b']", "'a' | 'b'"),
+            ("Tuple[int, str]", "[number, string]"),
+            ("schemas.User", "User"),
+            ("'User'", "User"),
+            ("Annotated[int, Query()]", "number"),
+            ("Callable[[int], str]", "any"),
+        ],
+    )
+    def test_annotation_to_typescript(self, source, expected):
+        """Test conversion of common typing constructs."""
+        assert ts(source) == expected
+
+
+class TestTypeResolver:
+    """Test cases for model resolution."""
+
+    def test_resolves_reachable_models(self, models_project):
+        """Test that only models reachable from endpoints are resolved."""
+        index = build_index(models_project)
+        endpoints = detect_framework(models_project, index).parse()
+        models = TypeResolver(index).resolve_endpoints(endpoints)
+
+        assert list(models) == ["Base", "Role", "User"]
+        user = models["User"]
+        assert user.bases == ("Base",)
+        assert [(f.name, f.type, f.required) for f in user.fields] == [
+            ("name", "string", True),
+            ("email", "string | null", False),
+            ("role", "Role", True),
+            ("friends", "User[]", False),
+        ]
+        assert models["Role"].values == ("'admin'", "'user'")
+
+    def test_each_model_resolved_once(self, models_project, monkeypatch):
+        """Test that shared and cyclic models are built a single time."""
+        index = build_index(models_project)
+        endpoints = detect_framework(models_project, index).parse()
+        resolver = TypeResolver(index)
+        built = []
+        build_model = resolver._build_model
+        monkeypatch.setattr(
+            resolver,
+            "_build_model",
+            lambda name, node, module: built.append(name)
+            or build_model(name, node, module),
+        )
+
+        resolver.resolve_endpoints(endpoints * 50)
+
+        assert sorted(built) == ["Base", "Role", "User"]
+
+    def test_warns_on_same_named_models(self, tmp_path):
+        """Test that two classes emitted under one name are reported."""
+        for package, field in (("accounts", "login"), ("people", "name")):
+            (tmp_path / package).mkdir()
+            (tmp_path / package / "__init__.py").write_text("")
+            (tmp_path / package / "schemas.py").write_text(
+                f"from pydantic import BaseModel\nclass User(BaseModel):\n"
+                f"    {field}: str\n"
+            )
+            (tmp_path / f"{package}_routes.py").write_text(
+                "from fastapi import APIRouter\n"
+                f"from {package}.schemas import User\n"
+                "router = APIRouter()\n"
+                f"@router.get('/{package}')\n"
+                f"def {package}() -> User:\n"
+                "    return None\n"
+            )
+        (tmp_path / "main.py").write_text(
+            "from fastapi import FastAPI\napp = FastAPI()\n"
+        )
+        index = build_index(tmp_path)
+        endpoints = detect_framework(tmp_path, index).parse()
+
+        with pytest.warns(UserWarning, match="'User'.*only the first") as record:
+            models = TypeResolver(index).resolve_endpoints(endpoints)
+
+        assert len(record) == 1
+        assert [f.name for f in models["User"].fields] == ["login"]
+
+    def test_generator_emits_interfaces(self, models_project):
+        """Test that resolved models are rendered as full definitions."""
+        index = build_index(models_project)
+        endpoints = detect_framework(models_project, index).parse()
+        models = TypeResolver(index).resolve_endpoints(endpoints)
+        code = FetchClientGenerator(models=models).generate(endpoints)
+
+        assert "export interface User extends Base {" in code
+        assert "  email?: string | null;" in code
+        assert "export type Role = 'admin' | 'user';" in code
+        assert "Promise<User[]>" in code
+        assert "Unused" not in code
+        assert "TODO" not in code
+
+
+class TestSymbolIndex:
+    """Test cases for the cross-module symbol index."""
+
+    def test_follows_imports_and_aliases(self, package_project):
+        """Test that names are traced through re-exports and assignments."""
+        symbols = SymbolIndex.build(build_index(package_project))
+
+        assert symbols.resolve_class("app.api", "Out") == ("app.schemas.models", "User")
+        assert symbols.resolve_class("app.api", "schemas.Person") == (
+            "app.schemas.models",
+            "User",
+        )
+        assert symbols.resolve_class("app.api", "Missing") is None
+        assert sorted(symbols.modules_defining("User")) == [
+            "app.legacy",
+            "app.schemas.models",
+        ]
+
+    def test_resolver_uses_importing_module(self, package_project):
+        """Test that the class imported by the route wins over same-named ones."""
+        index = build_index(package_project)
+        endpoints = detect_framework(package_project, index).parse()
+        models = TypeResolver(index).resolve_endpoints(endpoints)
+
+        assert [f.name for f in models["Out"].fields] == ["name"]
+
+    def test_same_name_in_different_modules(self, package_project):
+        """Test that same-named classes used from different modules stay apart."""
+        resolver = TypeResolver(build_index(package_project))
+
+        legacy = resolver.resolve("User", "app.legacy")
+        models = resolver.resolve("User", "app.schemas.models")
+        assert [f.name for f in legacy.fields] == ["login"]
+        assert [f.name for f in models.fields] == ["name"]
+
+    def test_cyclic_star_imports(self, tmp_path):
+        """Test that modules star-importing each other do not recurse forever."""
+        (tmp_path / "a.py").write_text("from b import *\nclass A:\n    x: int\n")
+        (tmp_path / "b.py").write_text("from a import *\n")
+        (tmp_path / "c.py").write_text("from b import *\n")
+        symbols = SymbolIndex.build(build_index(tmp_path))
+
+        assert symbols.resolve_class("c", "Missing") is None
+        assert symbols.resolve_class("c", "A") == ("a", "A")
+
+    def test_cached_and_incremental(self, package_project):
+        """Test that unchanged files load from cache and edits patch in place."""
+        index = build_index(package_project)
+        SymbolIndex.build(index, ParseCache.for_project(package_project))
+
+        cache = ParseCache.for_project(package_project)
+        symbols = SymbolIndex.build(index, cache)
+        assert cache.misses == 0
+        assert cache.hits == len(index.files)
+
+        legacy = package_project / "app" / "legacy.py"
+        symbols.update("app.legacy", legacy, "class Account:\n    id: int\n")
+        assert symbols.modules_defining("User") == ["app.schemas.models"]
+        assert symbols.resolve_class("app.legacy", "Account") == (
+            "app.legacy",
+            "Account",
+        )
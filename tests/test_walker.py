@@ -0,0 +1,67 @@
+"""Tests for the pruning project walker."""
+
+from pathlib import Path
+
+from spout.shared.walker import IgnoreRules, ProjectWalker
+
+
+def _touch(root: Path, rel: str) -> None:
+    path = root / rel
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text("")
+
+
+class TestIgnoreRules:
+    """Test cases for gitignore-style matching."""
+
+    def test_basename_and_anchored_patterns(self):
+        """Test unanchored, anchored and directory-only patterns."""
+        rules = IgnoreRules(["*.pyc", "/generated", "logs/", "docs/**/*.py"])
+
+        assert rules.matches("pkg/mod.pyc", False)
+        assert rules.matches("generated", True)
+        assert not rules.matches("pkg/generated", True)
+        assert rules.matches("pkg/logs", True)
+        assert not rules.matches("pkg/logs", False)
+        assert rules.matches("docs/a/b/conf.py", False)
+
+    def test_negation(self):
+        """Test that the last matching rule wins."""
+        rules = IgnoreRules(["*.py", "!keep.py"])
+
+        assert rules.matches("drop.py", False)
+        assert not rules.matches("keep.py", False)
+
+
+class TestProjectWalker:
+    """Test cases for ProjectWalker."""
+
+    def test_prunes_default_and_ignored_dirs(self, tmp_path):
+        """Test that excluded directories are never descended into."""
+        for rel in [
+            "app/main.py",
+            ".venv/lib/site-packages/fastapi/app.py",
+            "node_modules/pkg/x.py",
+            "app/__pycache__/main.py",
+            "scratch/tmp.py",
+        ]:
+            _touch(tmp_path, rel)
+        (tmp_path / ".gitignore").write_text("scratch/\n")
+
+        walker = ProjectWalker(tmp_path)
+        files = walker.walk()
+
+        assert files == [tmp_path / "app" / "main.py"]
+        assert walker.dirs_pruned == 4
+
+    def test_config_exclude_and_include(self, tmp_path):
+        """Test exclude/include globs from configuration."""
+        for rel in ["api/routes.py", "api/test_routes.py", "scripts/run.py"]:
+            _touch(tmp_path, rel)
+
+        walker = ProjectWalker.from_config(
+            tmp_path, {"exclude": ["test_*.py"], "include": ["api/**"]}
+        )
+
+        assert walker.walk() == [tmp_path / "api" / "routes.py"]
+        assert walker.files_pruned == 2
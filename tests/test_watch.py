@@ -0,0 +1,96 @@
+"""Tests for incremental watch mode."""
+
+from pathlib import Path
+
+import pytest
+
+from spout.core import SpoutGenerator
+from spout.models.cli_input import GenerateInput
+from spout.watch import PollingChangeSource, SpoutWatcher
+
+ROUTES = (
+    "from fastapi import APIRouter\n"
+    "router = APIRouter()\n"
+    "@router.get('/{name}')\n"
+    "def {name}():\n"
+    "    return {{}}\n"
+)
+
+
+@pytest.fixture
+def watcher(tmp_path: Path) -> SpoutWatcher:
+    """Create a watcher over a small FastAPI project."""
+    project = tmp_path / "project"
+    project.mkdir()
+    (project / "main.py").write_text("from fastapi import FastAPI\napp = FastAPI()\n")
+    (project / "users.py").write_text(ROUTES.format(name="users"))
+    (project / "items.py").write_text(ROUTES.format(name="items"))
+
+    generator = SpoutGenerator(
+        GenerateInput(
+            project_path=str(project),
+            output_path=str(tmp_path / "client.ts"),
+            use_cache=False,
+        )
+    )
+    watcher = SpoutWatcher(generator)
+    watcher.start()
+    return watcher
+
+
+class TestSpoutWatcher:
+    """Test cases for SpoutWatcher."""
+
+    def test_reparses_only_changed_file(self, watcher, monkeypatch):
+        """Test that an edit reparses one file and patches the output."""
+        project = watcher.generator.input_data.path
+        parsed = []
+        detector = watcher.generator.detector
+        original = detector._parse_source
+        monkeypatch.setattr(
+            detector,
+            "_parse_source",
+            lambda path, content: parsed.append(path) or original(path, content),
+        )
+
+        (project / "users.py").write_text(ROUTES.format(name="accounts"))
+        assert watcher.apply({project / "users.py"})
+
+        output = watcher.output_path.read_text()
+        assert parsed == [project / "users.py"]
+        assert "getAccounts" in output
+        assert "getUsers" not in output
+        assert "getItems" in output
+
+    def test_unchanged_output_is_not_rewritten(self, watcher):
+        """Test that a no-op edit leaves the output untouched."""
+        project = watcher.generator.input_data.path
+        mtime = watcher.output_path.stat().st_mtime_ns
+
+        (project / "users.py").write_text(ROUTES.format(name="users") + "\n")
+
+        assert not watcher.apply({project / "users.py"})
+        assert watcher.output_path.stat().st_mtime_ns == mtime
+
+    def test_removed_file_drops_endpoints(self, watcher):
+        """Test that deleting a route file removes its methods."""
+        project = watcher.generator.input_data.path
+        (project / "items.py").unlink()
+
+        assert watcher.apply({project / "items.py"})
+        assert "getItems" not in watcher.output_path.read_text()
+
+
+class TestPollingChangeSource:
+    """Test cases for polling change detection."""
+
+    def test_reports_added_and_modified(self, watcher):
+        """Test that polling reports new and modified files."""
+        project = watcher.generator.input_data.path
+        source = PollingChangeSource(watcher.generator.index.walker)
+
+        (project / "new.py").write_text("x = 1\n")
+        (project / "users.py").write_text("y = 2\n")
+
+        assert source.poll() == {project / "new.py", project / "users.py"}
+        assert source.poll() == set()